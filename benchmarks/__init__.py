@@ -0,0 +1 @@
+"""Performance benchmarks for goit-pycore-hw-03."""
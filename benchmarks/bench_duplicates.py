@@ -0,0 +1,81 @@
+"""
+Benchmark near-duplicate phone detection against all-pairs comparison.
+
+Generates distinct Ukrainian numbers, adds a copy with one typo (wrong,
+missing, extra or swapped digit) for a share of them, and measures how
+long find_near_duplicates takes and how many typo copies it links back.
+All-pairs time is measured on a small sample and extrapolated.
+
+Usage:
+    python -m benchmarks.bench_duplicates
+    python -m benchmarks.bench_duplicates --numbers 10000000 --passes 4
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+from tasks.phone_duplicates import find_near_duplicates, osa_distance
+
+_DIGITS = "0123456789"
+
+
+def add_typo(number: str, rng: random.Random) -> str:
+    """Apply one random edit to the national part of *number*."""
+    position = rng.randrange(4, len(number) - 1)
+    kind = rng.randrange(4)
+    if kind == 0:
+        return number[:position] + rng.choice(_DIGITS.replace(number[position], "")) + number[position + 1:]
+    if kind == 1:
+        return number[:position] + number[position + 1:]
+    if kind == 2:
+        return number[:position] + rng.choice(_DIGITS) + number[position:]
+    if number[position] == number[position + 1]:
+        return number[:position] + number[position + 1:]
+    return number[:position] + number[position + 1] + number[position] + number[position + 2:]
+
+
+def make_numbers(count: int, typo_ratio: float, seed: int = 42) -> Tuple[List[str], int]:
+    """Return (numbers, typo copies added)."""
+    rng = random.Random(seed)
+    numbers = sorted({f"+380{rng.choice(['50', '67', '93', '44'])}{rng.randrange(10**7):07d}" for _ in range(count)})
+    typos = [add_typo(number, rng) for number in rng.sample(numbers, int(len(numbers) * typo_ratio))]
+    return numbers + typos, len(typos)
+
+
+def all_pairs_seconds(numbers: List[str], max_distance: int, sample: int = 1000) -> float:
+    """Extrapolated time of comparing every pair of *numbers*."""
+    subset = numbers[:sample]
+    started = time.perf_counter()
+    for i, first in enumerate(subset):
+        for second in subset[i + 1:]:
+            osa_distance(first, second, max_distance)
+    elapsed = time.perf_counter() - started
+    pairs = len(subset) * (len(subset) - 1) / 2
+    return elapsed / pairs * len(numbers) * (len(numbers) - 1) / 2
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate phone detection.")
+    parser.add_argument("--numbers", type=int, default=200_000)
+    parser.add_argument("--typo-ratio", type=float, default=0.02)
+    parser.add_argument("--max-distance", type=int, default=1)
+    parser.add_argument("--passes", type=int, default=1)
+    args = parser.parse_args()
+
+    numbers, typos = make_numbers(args.numbers, args.typo_ratio)
+    print(f"numbers: {len(numbers):,} ({typos:,} typo copies)")
+
+    started = time.perf_counter()
+    clusters = find_near_duplicates(numbers, args.max_distance, passes=args.passes)
+    elapsed = time.perf_counter() - started
+
+    linked = sum(len(cluster) - 1 for cluster in clusters)
+    naive = all_pairs_seconds(numbers, args.max_distance)
+    print(f"blocked:   {elapsed:10.2f} s  clusters={len(clusters):,} linked={linked:,}")
+    print(f"all pairs: {naive:10.0f} s  (extrapolated, x{naive / elapsed:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
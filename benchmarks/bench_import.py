@@ -0,0 +1,81 @@
+"""
+Import-time benchmark for the tasks package (``python -X importtime``).
+
+Measures the cold-start import cost of ``import tasks`` and of touching
+each public function through the lazy package facade, excluding modules
+the interpreter already imports at startup.
+
+Usage:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --repeat 11 --max-ms 25
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+SCENARIOS: Dict[str, str] = {
+    "import tasks": "import tasks",
+    "tasks.get_days_from_today": "import tasks; tasks.get_days_from_today",
+    "tasks.get_numbers_ticket": "import tasks; tasks.get_numbers_ticket",
+    "tasks.normalize_phone": "import tasks; tasks.normalize_phone",
+    "tasks.get_upcoming_birthdays": "import tasks; tasks.get_upcoming_birthdays",
+}
+
+
+def top_level_imports(statement: str) -> Dict[str, int]:
+    """Run *statement* in a fresh interpreter and parse ``-X importtime``.
+
+    Returns:
+        Mapping of top-level imported module name to cumulative microseconds
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    imports = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # Nested imports are included in cumulative
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def measure(statement: str, startup: Dict[str, int]) -> Dict[str, int]:
+    """Cumulative import time per module triggered by *statement* itself."""
+    return {
+        name: micros for name, micros in top_level_imports(statement).items()
+        if name not in startup
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure tasks package import time.")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--max-ms", type=float, help="fail if any scenario exceeds this median")
+    args = parser.parse_args(argv)
+
+    startup = top_level_imports("pass")
+    over_budget = False
+
+    print(f"{'scenario':<32} {'median ms':>10}  top imports")
+    for label, statement in SCENARIOS.items():
+        runs = [measure(statement, startup) for _ in range(args.repeat)]
+        median_ms = statistics.median(sum(run.values()) for run in runs) / 1000
+        heaviest = sorted(runs[-1].items(), key=lambda item: -item[1])[:3]
+        details = ", ".join(f"{name} {micros / 1000:.1f}" for name, micros in heaviest)
+        flag = ""
+        if args.max_ms is not None and median_ms > args.max_ms:
+            over_budget = True
+            flag = "  OVER BUDGET"
+        print(f"{label:<32} {median_ms:>10.2f}  {details}{flag}")
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
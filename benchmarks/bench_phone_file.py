@@ -0,0 +1,65 @@
+"""
+Benchmark bytes-level normalize_phone_file against the str path.
+
+The str path decodes every line and calls normalize_phone; the bytes path
+memory-maps the file and strips non-digits with bytes.translate.
+
+Usage:
+    python -m benchmarks.bench_phone_file                 # 64 MB file
+    python -m benchmarks.bench_phone_file --size-mb 1024  # 1 GB file
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+
+from benchmarks.data import make_phones
+from tasks.task_3 import normalize_phone, normalize_phone_file
+
+
+def write_input(path: str, size_mb: int, dirty_ratio: float) -> None:
+    """Write about *size_mb* megabytes of seeded phone numbers to *path*."""
+    sample = "\n".join(
+        phone if isinstance(phone, str) else ""
+        for phone in make_phones(100_000, dirty_ratio)
+    ).encode("ascii") + b"\n"
+    with open(path, "wb") as target:
+        for _ in range(max(1, size_mb * 2**20 // len(sample))):
+            target.write(sample)
+
+
+def str_path(input_path: str, output_path: str) -> None:
+    """Baseline: decode lines and call normalize_phone on each."""
+    with open(input_path, encoding="ascii") as source, \
+            open(output_path, "w", encoding="ascii") as target, \
+            open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for line in source:
+            target.write((normalize_phone(line) or "") + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare bytes and str phone file paths.")
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--dirty-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = os.path.join(directory, "phones.txt")
+        write_input(input_path, args.size_mb, args.dirty_ratio)
+        size_mb = os.path.getsize(input_path) / 2**20
+        print(f"input: {size_mb:.0f} MB")
+
+        for label, run in (
+            ("str", lambda: str_path(input_path, os.path.join(directory, "str.txt"))),
+            ("bytes", lambda: normalize_phone_file(input_path, os.path.join(directory, "bytes.txt"))),
+        ):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            print(f"{label:>6}: {elapsed:8.2f}s  {size_mb / elapsed:8.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Memory per record: dicts versus compact User/Congratulation records.
+
+Field strings are created up front and shared by both layouts, so the
+numbers are the container overhead per record.
+
+Usage:
+    python -m benchmarks.bench_records
+    python -m benchmarks.bench_records --records 2000000
+"""
+
+import argparse
+import tracemalloc
+from typing import Callable, List
+
+from tasks.task_4 import Congratulation, User
+
+
+def bytes_per_record(build: Callable[[], List], count: int) -> float:
+    """Traced memory allocated by *build*, divided by *count*."""
+    tracemalloc.start()
+    try:
+        records = build()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del records
+    return size / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare memory per record.")
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    count = args.records
+    names = [f"User{i}" for i in range(count)]
+    dates = [f"1990.01.{i % 28 + 1:02d}" for i in range(count)]
+
+    cases = [
+        ("user", "dict", lambda: [{"name": n, "birthday": d} for n, d in zip(names, dates)]),
+        ("user", "User", lambda: [User(n, d) for n, d in zip(names, dates)]),
+        ("result", "dict", lambda: [{"name": n, "congratulation_date": d} for n, d in zip(names, dates)]),
+        ("result", "Congratulation", lambda: [Congratulation(n, d) for n, d in zip(names, dates)]),
+    ]
+
+    print(f"records={count}")
+    baseline = {}
+    for kind, layout, build in cases:
+        size = bytes_per_record(build, count)
+        if kind not in baseline:
+            baseline[kind] = size
+            note = "baseline"
+        else:
+            note = f"-{1 - size / baseline[kind]:.0%}"
+        print(f"{kind:>7} {layout:<15} {size:8.1f} B/record  ({note})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Benchmark sharded get_upcoming_birthdays against the single-threaded loop.
+
+Usage:
+    python -m benchmarks.bench_sharded
+    python -m benchmarks.bench_sharded --users 2000000 --shards 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.data import make_users
+from tasks.task_4 import get_upcoming_birthdays, get_upcoming_birthdays_sharded
+
+
+def best_of(repeat: int, func, *args, **kwargs) -> float:
+    """Return the best wall-clock time of *repeat* runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=500_000)
+    parser.add_argument("--shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    users = make_users(args.users)
+    serial = best_of(args.repeat, get_upcoming_birthdays, users)
+    print(f"users={args.users} shards={args.shards}")
+    print(f"{'serial':>8}: {serial:8.3f}s")
+
+    for executor in ("process", "thread"):
+        elapsed = best_of(
+            args.repeat, get_upcoming_birthdays_sharded,
+            users, shards=args.shards, executor=executor,
+        )
+        print(f"{executor:>8}: {elapsed:8.3f}s  speedup x{serial / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
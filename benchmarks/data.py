@@ -0,0 +1,88 @@
+"""
+Seeded synthetic input generators for the benchmark suite.
+
+Every generator takes a size, a dirty ratio (share of invalid inputs) and
+a seed, and returns the same data for the same arguments.
+"""
+
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+_EPOCH = date(1950, 1, 1)
+
+
+def _random_date(rng: random.Random) -> date:
+    """Pick a random date between 1950 and ~2060."""
+    return _EPOCH + timedelta(days=rng.randrange(40000))
+
+
+def make_iso_dates(size: int, dirty_ratio: float = 0.0, seed: int = 42) -> List[Any]:
+    """Generate inputs for get_days_from_today."""
+    rng = random.Random(seed)
+    dirty = ["", "   ", "2025-02-30", "08.02.2026", "not a date", None, 20260208]
+    return [
+        rng.choice(dirty) if rng.random() < dirty_ratio else _random_date(rng).isoformat()
+        for _ in range(size)
+    ]
+
+
+def make_ticket_args(
+    size: int, dirty_ratio: float = 0.0, seed: int = 42
+) -> List[Tuple[Any, Any, Any]]:
+    """Generate (min, max, quantity) argument tuples for get_numbers_ticket."""
+    rng = random.Random(seed)
+    dirty = [(0, 49, 6), (1, 2000, 6), (10, 5, 3), (1, 49, 50), (True, 49, 6), ("1", 49, 6)]
+    args = []
+    for _ in range(size):
+        if rng.random() < dirty_ratio:
+            args.append(rng.choice(dirty))
+        else:
+            low = rng.randint(1, 100)
+            high = rng.randint(low + 1, 1000)
+            args.append((low, high, rng.randint(1, min(10, high - low + 1))))
+    return args
+
+
+def make_phones(size: int, dirty_ratio: float = 0.0, seed: int = 42) -> List[Any]:
+    """Generate inputs for normalize_phone in assorted real-world formats."""
+    rng = random.Random(seed)
+    templates = [
+        "+38{d}", "38{d}", "{d}", "({a}) {b}-{c}", "+38 ({a}) {b} {c}", "   {d}   ",
+    ]
+    dirty = ["", "   ", "123", "abc", None, 380501234567]
+    phones = []
+    for _ in range(size):
+        if rng.random() < dirty_ratio:
+            phones.append(rng.choice(dirty))
+            continue
+        digits = "0" + "".join(rng.choice("0123456789") for _ in range(9))
+        phones.append(
+            rng.choice(templates).format(d=digits, a=digits[:3], b=digits[3:6], c=digits[6:])
+        )
+    return phones
+
+
+def make_users(size: int, dirty_ratio: float = 0.0, seed: int = 42) -> List[Any]:
+    """Generate user records for get_upcoming_birthdays."""
+    rng = random.Random(seed)
+    dirty = [
+        None,
+        {"name": "NoBirthday"},
+        {"name": "", "birthday": "1990.01.01"},
+        {"name": "Dashes", "birthday": "1990-01-01"},
+        {"name": "Nonexistent", "birthday": "1990.02.30"},
+    ]
+    return [
+        rng.choice(dirty) if rng.random() < dirty_ratio
+        else {"name": f"User{i}", "birthday": _random_date(rng).strftime("%Y.%m.%d")}
+        for i in range(size)
+    ]
+
+
+GENERATORS: Dict[str, Any] = {
+    "get_days_from_today": make_iso_dates,
+    "get_numbers_ticket": make_ticket_args,
+    "normalize_phone": make_phones,
+    "get_upcoming_birthdays": make_users,
+}
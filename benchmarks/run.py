@@ -0,0 +1,211 @@
+"""
+Benchmark suite for every function in tasks/.
+
+Runs each function at several input sizes with clean and dirty input
+mixes, reports throughput (ops/sec), per-call p50/p99 latency and peak
+memory, and compares the results against a stored JSON baseline.
+
+Usage:
+    python -m benchmarks.run                          # 1, 1k and 1M inputs
+    python -m benchmarks.run --sizes 1 1000 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.2
+
+Exits with status 1 and marks the row "REGRESSION" when a case is slower
+than its baseline throughput by more than the threshold.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.data import GENERATORS
+from tasks.task_1 import get_days_from_today
+from tasks.task_2 import get_numbers_ticket
+from tasks.task_3 import normalize_phone
+from tasks.task_4 import get_upcoming_birthdays
+
+# Functions called once per input item; get_upcoming_birthdays is called
+# once per batch and its throughput is counted in records.
+SCALAR_FUNCTIONS: Dict[str, Callable] = {
+    "get_days_from_today": get_days_from_today,
+    "get_numbers_ticket": lambda args: get_numbers_ticket(*args),
+    "normalize_phone": normalize_phone,
+}
+BATCH_FUNCTIONS: Dict[str, Callable] = {
+    "get_upcoming_birthdays": get_upcoming_birthdays,
+}
+
+MIX_DIRTY_RATIO = {"clean": 0.0, "dirty": 0.3}
+DEFAULT_SIZES = [1, 1_000, 1_000_000]
+MIN_SAMPLES = 1_000
+
+
+def _percentile(sorted_values: List[int], fraction: float) -> int:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def _time_calls(name: str, inputs: List[Any]) -> List[int]:
+    """Time calls of function *name* over *inputs*, in nanoseconds per call."""
+    clock = time.perf_counter_ns
+    latencies = []
+
+    if name in SCALAR_FUNCTIONS:
+        func = SCALAR_FUNCTIONS[name]
+        # Cycle small inputs so percentiles have enough samples
+        calls = max(len(inputs), MIN_SAMPLES)
+        for i in range(calls):
+            value = inputs[i % len(inputs)]
+            started = clock()
+            func(value)
+            latencies.append(clock() - started)
+    else:
+        func = BATCH_FUNCTIONS[name]
+        repeats = max(3, min(MIN_SAMPLES, 100_000 // len(inputs)))
+        for _ in range(repeats):
+            started = clock()
+            func(inputs)
+            latencies.append(clock() - started)
+
+    return latencies
+
+
+def _peak_memory(name: str, inputs: List[Any]) -> int:
+    """Peak traced memory, in bytes, of one pass over *inputs*."""
+    tracemalloc.start()
+    try:
+        if name in SCALAR_FUNCTIONS:
+            func = SCALAR_FUNCTIONS[name]
+            for value in inputs:
+                func(value)
+        else:
+            BATCH_FUNCTIONS[name](inputs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(name: str, size: int, mix: str, seed: int = 42) -> Dict[str, Any]:
+    """Benchmark one function at one input size and mix.
+
+    Args:
+        name: Function name (a key of ``benchmarks.data.GENERATORS``)
+        size: Number of input items
+        mix: 'clean' or 'dirty'
+        seed: Seed for the input generator
+
+    Returns:
+        Dictionary with ops_per_sec, p50_us, p99_us and peak_kib
+    """
+    inputs = GENERATORS[name](size, MIX_DIRTY_RATIO[mix], seed)
+
+    # Error messages are part of the dirty-path cost, but not the report
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        latencies = _time_calls(name, inputs)
+        peak = _peak_memory(name, inputs)
+
+    items_per_call = 1 if name in SCALAR_FUNCTIONS else size
+    latencies.sort()
+    return {
+        "ops_per_sec": len(latencies) * items_per_call / (sum(latencies) / 1e9 or 1e-9),
+        "p50_us": _percentile(latencies, 0.50) / 1e3,
+        "p99_us": _percentile(latencies, 0.99) / 1e3,
+        "peak_kib": peak / 1024,
+    }
+
+
+def case_key(name: str, size: int, mix: str) -> str:
+    """Stable identifier of a benchmark case in baseline files."""
+    return f"{name}[size={size},mix={mix}]"
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Return keys of cases whose throughput dropped more than *threshold*.
+
+    Args:
+        results: Current results keyed by :func:`case_key`
+        baseline: Baseline results in the same format
+        threshold: Allowed relative slowdown (0.2 means 20%)
+
+    Returns:
+        Sorted list of regressed case keys; cases missing from the
+        baseline are ignored
+    """
+    return sorted(
+        key for key, metrics in results.items()
+        if key in baseline
+        and metrics["ops_per_sec"] < baseline[key]["ops_per_sec"] * (1 - threshold)
+    )
+
+
+def _load_baseline(path: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Read baseline results from a JSON file, or None if it does not exist."""
+    if not os.path.exists(path):
+        print(f"Baseline '{path}' not found, skipping comparison.")
+        return None
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)["results"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark every function in tasks/.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--functions", nargs="+", choices=sorted(GENERATORS), default=sorted(GENERATORS))
+    parser.add_argument("--mix", nargs="+", choices=sorted(MIX_DIRTY_RATIO), default=["clean", "dirty"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", help="JSON baseline to compare against")
+    parser.add_argument("--save-baseline", help="write results as a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="allowed throughput drop before flagging a regression (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    baseline = _load_baseline(args.baseline) if args.baseline else None
+
+    results: Dict[str, Dict[str, Any]] = {}
+    print(f"{'case':<52} {'ops/sec':>14} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>10}")
+    for name in args.functions:
+        for size in args.sizes:
+            for mix in args.mix:
+                key = case_key(name, size, mix)
+                metrics = results[key] = run_case(name, size, mix, args.seed)
+                flag = ""
+                if baseline and find_regressions({key: metrics}, baseline, args.threshold):
+                    change = metrics["ops_per_sec"] / baseline[key]["ops_per_sec"] - 1
+                    flag = f"  REGRESSION ({change:+.0%})"
+                print(
+                    f"{key:<52} {metrics['ops_per_sec']:>14,.0f} {metrics['p50_us']:>10.2f} "
+                    f"{metrics['p99_us']:>10.2f} {metrics['peak_kib']:>10.1f}{flag}"
+                )
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(
+                {
+                    "meta": {"python": sys.version.split()[0], "platform": platform.platform()},
+                    "results": results,
+                },
+                baseline_file,
+                indent=2,
+                sort_keys=True,
+            )
+        print(f"Baseline written to '{args.save_baseline}'.")
+
+    regressions = find_regressions(results, baseline, args.threshold) if baseline else []
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%} threshold.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
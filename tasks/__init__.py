@@ -1 +1,60 @@
-"""Tasks module for GoIT Python Core Homework 03."""
+"""Tasks module for GoIT Python Core Homework 03.
+
+Public functions are re-exported here and loaded lazily: importing
+``tasks`` imports no task module, and ``tasks.normalize_phone`` imports
+only ``tasks.task_3``. This keeps cold start of short-lived workers low.
+
+Example:
+    >>> from tasks import get_days_from_today
+"""
+# Public name -> module that defines it
+_EXPORTS = {
+    "Congratulation": "tasks.task_4",
+    "DateFormatDetector": "tasks.task_1",
+    "User": "tasks.task_4",
+    "decode_phone": "tasks.task_3",
+    "decode_phones": "tasks.task_3",
+    "encode_phone": "tasks.task_3",
+    "encode_phones": "tasks.task_3",
+    "get_days_from_today": "tasks.task_1",
+    "get_days_from_today_many": "tasks.task_1",
+    "get_days_histogram": "tasks.task_1",
+    "get_numbers_ticket": "tasks.task_2",
+    "normalize_phone": "tasks.task_3",
+    "normalize_phone_file": "tasks.task_3",
+    "random_ticket_rank": "tasks.task_2",
+    "rank_ticket": "tasks.task_2",
+    "rank_tickets": "tasks.task_2",
+    "ticket_count": "tasks.task_2",
+    "unrank_ticket": "tasks.task_2",
+    "unrank_tickets": "tasks.task_2",
+    "get_upcoming_birthdays": "tasks.task_4",
+    "get_upcoming_birthdays_grouped": "tasks.task_4",
+    "get_upcoming_birthdays_sharded": "tasks.task_4",
+    "get_upcoming_birthdays_tz": "tasks.task_4",
+    "iter_congratulation_dates": "tasks.task_4",
+    "iter_upcoming_birthdays": "tasks.task_4",
+    "merge_days_histograms": "tasks.task_1",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Load a public function from its task module on first access.
+
+    The result is deliberately not cached in the package namespace, so
+    functions swapped in by :mod:`tasks.instrumentation` are picked up.
+    """
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Imported here: importlib itself is not loaded at interpreter startup
+    from importlib import import_module
+
+    return getattr(import_module(module_name), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
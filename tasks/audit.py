@@ -0,0 +1,306 @@
+"""Streaming fairness audit for generated lottery tickets.
+
+A :class:`TicketAudit` consumes tickets in batches and keeps only fixed-size
+counters: how often each number was drawn and how often each pair of
+numbers was drawn together. Memory depends on the number range, not on the
+number of tickets. Audits built by parallel workers over the same range are
+combined with :meth:`TicketAudit.merge` or :func:`merge_audits`.
+
+Per-batch counting is done by :class:`collections.Counter` over flattened
+batches, so the Python-level loop runs once per distinct number or pair per
+batch rather than once per drawn value. Uniformity is checked with a
+chi-square test. A ticket draws its numbers without replacement, so the
+counts are not independent multinomial cells: the number statistic is
+Pearson's scaled by (n - 1) / (n - k), and the pair statistic splits the
+deviations into the two independent components of the pair table (per-number
+sums and the rest) and scales each by its variance. p-values use the
+Wilson-Hilferty approximation.
+
+Example:
+    >>> from tasks.task_2 import get_numbers_ticket
+    >>> audit = TicketAudit(1, 49, 6)
+    >>> audit.update(get_numbers_ticket(1, 49, 6) for _ in range(10_000))
+    10000
+    >>> audit.number_chi_square().p_value > 0.001
+    True
+"""
+from array import array
+from collections import Counter
+from fractions import Fraction
+from itertools import chain, combinations
+from math import sqrt
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+from tasks import task_2
+
+
+class ChiSquare(NamedTuple):
+    """Result of a chi-square goodness-of-fit test.
+
+    Attributes:
+        statistic: Chi-square statistic, scaled for drawing without replacement
+        dof: Degrees of freedom
+        p_value: Probability of a statistic at least this large under
+                 uniformity (1.0 when there is no data)
+    """
+
+    statistic: float
+    dof: int
+    p_value: float
+
+
+def _chi_square_p_value(statistic: float, dof: int) -> float:
+    """Upper tail probability of the chi-square distribution (Wilson-Hilferty)."""
+    if dof <= 0:
+        return 1.0
+    scale = 2 / (9 * dof)
+    z = ((statistic / dof) ** (1 / 3) - (1 - scale)) / sqrt(scale)
+    return 1 - NormalDist().cdf(z)
+
+
+def _chi_square(statistic: float, dof: int) -> ChiSquare:
+    return ChiSquare(statistic, dof, _chi_square_p_value(statistic, dof))
+
+
+def _pair_variances(size: int, quantity: int) -> Tuple[Fraction, Fraction]:
+    """Per-ticket variances of the two non-trivial pair table components.
+
+    A pair indicator has variance q(1 - q); two pairs sharing a number
+    covary by c1, disjoint pairs by c2. On the triangular graph of pairs
+    this covariance has eigenvalue v + (n - 4)c1 - (n - 3)c2 on the
+    n - 1 dimensional per-number component and v - 2c1 + c2 on the
+    remaining n(n - 3)/2 dimensions.
+    """
+    n, k = size, quantity
+    q = Fraction(k * (k - 1), n * (n - 1))
+    shared = Fraction(k * (k - 1) * (k - 2), n * (n - 1) * (n - 2)) - q * q
+    # With n = 3 there are no disjoint pairs (and k - 3 <= 0)
+    disjoint = Fraction(k * (k - 1) * (k - 2) * (k - 3), n * (n - 1) * (n - 2) * max(n - 3, 1)) - q * q
+    variance = q * (1 - q)
+    return variance + (n - 4) * shared - (n - 3) * disjoint, variance - 2 * shared + disjoint
+
+
+class TicketAudit:
+    """Incremental per-number and per-pair frequency counters.
+
+    Args:
+        min: The minimum value in the range
+        max: The maximum value in the range
+        quantity: Numbers per ticket
+        pairs: Also count pair co-occurrences. The pair table holds
+               n * (n - 1) / 2 counters for a range of n numbers.
+
+    Raises:
+        ValueError: If the arguments break the get_numbers_ticket rules
+    """
+
+    def __init__(self, min: int, max: int, quantity: int, *, pairs: bool = True) -> None:
+        error = task_2._ticket_args_error(min, max, quantity)
+        if error:
+            raise ValueError(error)
+
+        self.min, self.max, self.quantity = min, max, quantity
+        self.tickets = 0
+        self.invalid = 0
+        size = max - min + 1
+        self.number_counts = array("Q", bytes(8 * size))
+        self.pair_counts = array("Q", bytes(8 * (size * (size - 1) // 2))) if pairs else None
+        # Flat index of pair (a, b), a < b, is _row_offsets[a - min] + b
+        self._row_offsets = [
+            i * (2 * size - i - 1) // 2 - i - 1 - min for i in range(size)
+        ]
+
+    def _ticket_error(self, ticket: Any) -> Optional[str]:
+        error = task_2._ticket_error(ticket, self.min, self.max)
+        if error is None and len(ticket) != self.quantity:
+            error = f"ticket must have {self.quantity} numbers, got {len(ticket)}."
+        return error
+
+    def update(self, tickets: Iterable[Sequence[int]], *, validate: bool = True) -> int:
+        """Add a batch of tickets to the counters.
+
+        Args:
+            tickets: Tickets as lists or tuples of numbers
+            validate: Check every ticket first; invalid tickets are
+                      reported, counted in ``invalid`` and skipped. Pass
+                      ``False`` for tickets straight from get_numbers_ticket.
+
+        Returns:
+            Number of tickets added
+        """
+        batch = []
+        for ticket in tickets:
+            if validate:
+                error = self._ticket_error(ticket)
+                if error:
+                    print(f"Error: {error}")
+                    self.invalid += 1
+                    continue
+            batch.append(sorted(ticket))
+
+        number_counts, low = self.number_counts, self.min
+        for number, count in Counter(chain.from_iterable(batch)).items():
+            number_counts[number - low] += count
+
+        if self.pair_counts is not None:
+            pair_counts, offsets = self.pair_counts, self._row_offsets
+            pairs = chain.from_iterable(combinations(ticket, 2) for ticket in batch)
+            for (a, b), count in Counter(pairs).items():
+                pair_counts[offsets[a - low] + b] += count
+
+        self.tickets += len(batch)
+        return len(batch)
+
+    def merge(self, other: "TicketAudit") -> "TicketAudit":
+        """Add the counters of *other* (e.g. from a worker) to this audit.
+
+        Returns:
+            This audit
+
+        Raises:
+            ValueError: If the audits differ in range, quantity or pair tracking
+        """
+        if (other.min, other.max, other.quantity) != (self.min, self.max, self.quantity) or (
+            (other.pair_counts is None) != (self.pair_counts is None)
+        ):
+            raise ValueError("Cannot merge audits with different parameters.")
+
+        self.tickets += other.tickets
+        self.invalid += other.invalid
+        self.number_counts = array("Q", map(sum, zip(self.number_counts, other.number_counts)))
+        if self.pair_counts is not None:
+            self.pair_counts = array("Q", map(sum, zip(self.pair_counts, other.pair_counts)))
+        return self
+
+    def pair_count(self, a: int, b: int) -> int:
+        """Return how many tickets contained both *a* and *b*."""
+        if self.pair_counts is None:
+            raise ValueError("Pair counting is disabled for this audit.")
+        if a > b:
+            a, b = b, a
+        return self.pair_counts[self._row_offsets[a - self.min] + b]
+
+    def number_chi_square(self) -> ChiSquare:
+        """Test whether every number is drawn equally often.
+
+        Pearson's statistic over the number counts is (n - k) / (n - 1)
+        times a chi-square with n - 1 degrees of freedom when every ticket
+        draws k distinct numbers, so it is rescaled by (n - 1) / (n - k).
+        """
+        size, quantity = len(self.number_counts), self.quantity
+        dof = size - 1
+        if not self.tickets or quantity == size:
+            # Every ticket holds every number: the counts cannot vary
+            return ChiSquare(0.0, dof, 1.0)
+        expected = self.tickets * quantity / size
+        pearson = sum((count - expected) ** 2 for count in self.number_counts) / expected
+        return _chi_square(pearson * (size - 1) / (size - quantity), dof)
+
+    def pair_chi_square(self) -> ChiSquare:
+        """Test whether every pair of numbers is drawn together equally often.
+
+        The deviations from the expected pair count are split into the
+        per-number component (n - 1 degrees of freedom) and the rest
+        (n(n - 3)/2); each part is divided by its variance under fair
+        draws. A part with zero variance (e.g. k = n - 1, where the pair
+        counts follow from the number counts) is left out.
+        """
+        if self.pair_counts is None:
+            raise ValueError("Pair counting is disabled for this audit.")
+        size, quantity, tickets = len(self.number_counts), self.quantity, self.tickets
+        if size < 3:
+            return ChiSquare(0.0, 0, 1.0)
+
+        per_number, rest = _pair_variances(size, quantity)
+        dof = (size - 1 if per_number else 0) + (size * (size - 3) // 2 if rest else 0)
+        if not tickets or not dof:
+            return ChiSquare(0.0, dof, 1.0)
+
+        expected = tickets * quantity * (quantity - 1) / (size * (size - 1))
+        low, offsets = self.min, self._row_offsets
+        sums = [0.0] * size
+        total = 0.0
+        for a in range(size):
+            for b in range(a + 1, size):
+                deviation = self.pair_counts[offsets[a] + b + low] - expected
+                total += deviation * deviation
+                sums[a] += deviation
+                sums[b] += deviation
+
+        # Squared length of the projection onto the per-number component
+        number_part = sum(value * value for value in sums) / (size - 2)
+        statistic = 0.0
+        if per_number:
+            statistic += number_part / (tickets * float(per_number))
+        if rest:
+            statistic += max(total - number_part, 0.0) / (tickets * float(rest))
+        return _chi_square(statistic, dof)
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize the audit.
+
+        Returns:
+            Dictionary with 'tickets', 'invalid', 'numbers' (chi-square
+            result as a dict) and, if pairs are tracked, 'pairs'
+        """
+        report: Dict[str, Any] = {
+            "tickets": self.tickets,
+            "invalid": self.invalid,
+            "numbers": self.number_chi_square()._asdict(),
+        }
+        if self.pair_counts is not None:
+            report["pairs"] = self.pair_chi_square()._asdict()
+        return report
+
+
+def audit_tickets(
+    batches: Iterable[Iterable[Sequence[int]]],
+    min: int,
+    max: int,
+    quantity: int,
+    *,
+    pairs: bool = True,
+    validate: bool = True,
+) -> TicketAudit:
+    """Stream ticket batches into a new audit.
+
+    Args:
+        batches: Iterable of ticket batches (only one batch is held at a time)
+        min: The minimum value in the range
+        max: The maximum value in the range
+        quantity: Numbers per ticket
+        pairs: Also count pair co-occurrences
+        validate: Check every ticket (see :meth:`TicketAudit.update`)
+
+    Returns:
+        The filled audit
+    """
+    audit = TicketAudit(min, max, quantity, pairs=pairs)
+    for batch in batches:
+        audit.update(batch, validate=validate)
+    return audit
+
+
+def merge_audits(audits: Iterable[TicketAudit]) -> TicketAudit:
+    """Combine partial audits from parallel workers into one.
+
+    Args:
+        audits: Non-empty iterable of audits over the same parameters
+
+    Returns:
+        A new audit with the summed counters
+
+    Raises:
+        ValueError: If *audits* is empty or the parameters differ
+    """
+    audits = iter(audits)
+    first = next(audits, None)
+    if first is None:
+        raise ValueError("merge_audits() needs at least one audit.")
+
+    merged = TicketAudit(first.min, first.max, first.quantity, pairs=first.pair_counts is not None)
+    merged.merge(first)
+    for audit in audits:
+        merged.merge(audit)
+    return merged
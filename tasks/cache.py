@@ -0,0 +1,257 @@
+"""Persistent on-disk cache for phone normalization and date parsing.
+
+Nightly jobs see mostly the same inputs every run, so results are stored
+in a SQLite database (standard library :mod:`sqlite3`) and looked up in
+bulk. Each kind of result lives in its own namespace together with a
+version key: when a task module bumps its ``CACHE_VERSION`` because its
+rules changed, the namespace is cleared on first use.
+
+Example:
+    >>> with PersistentCache("tasks-cache.sqlite3") as cache:
+    ...     phones = cached_normalize_phones(["050 123 45 67"], cache)
+"""
+import sqlite3
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_CHUNK_SIZE = 500
+
+
+class PersistentCache:
+    """Size-bounded key/value cache in a SQLite file.
+
+    Values are strings or None (a cached "invalid input" result). Reads
+    and writes are batched in a single transaction per call; when a
+    namespace grows past *max_entries*, the least recently used entries
+    are evicted.
+
+    Args:
+        path: Database file path (``":memory:"`` for a throwaway cache)
+        max_entries: Maximum number of entries kept per namespace
+    """
+
+    def __init__(self, path: str, max_entries: int = 1_000_000) -> None:
+        if not isinstance(max_entries, int) or isinstance(max_entries, bool) or max_entries < 1:
+            raise ValueError("max_entries must be a positive integer.")
+
+        self.max_entries = max_entries
+        self._connection = sqlite3.connect(path)
+        self._checked_namespaces: Dict[str, str] = {}
+        with self._connection:
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    namespace TEXT PRIMARY KEY,
+                    version TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT,
+                    used INTEGER NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, used);
+                """
+            )
+        # Monotonic access counter for LRU ordering
+        self._tick = self._connection.execute(
+            "SELECT COALESCE(MAX(used), 0) FROM entries"
+        ).fetchone()[0]
+
+    def __enter__(self) -> "PersistentCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def _check_version(self, namespace: str, version: Hashable) -> None:
+        """Clear *namespace* if it was written with a different version."""
+        version = str(version)
+        if self._checked_namespaces.get(namespace) == version:
+            return
+
+        row = self._connection.execute(
+            "SELECT version FROM meta WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        if row is None or row[0] != version:
+            with self._connection:
+                self._connection.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta (namespace, version) VALUES (?, ?)",
+                    (namespace, version),
+                )
+        self._checked_namespaces[namespace] = version
+
+    def get_many(
+        self, namespace: str, version: Hashable, keys: Iterable[str]
+    ) -> Dict[str, Optional[str]]:
+        """Look up many keys at once.
+
+        Args:
+            namespace: Result kind, e.g. 'normalize_phone'
+            version: Rules version of the producer of the values
+            keys: Keys to look up
+
+        Returns:
+            Dictionary of cache hits only (a hit may have a None value)
+        """
+        self._check_version(namespace, version)
+        keys = list(keys)
+        hits: Dict[str, Optional[str]] = {}
+
+        with self._connection:
+            for start in range(0, len(keys), _CHUNK_SIZE):
+                chunk = keys[start:start + _CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM entries WHERE namespace = ? AND key IN ({placeholders})",
+                    (namespace, *chunk),
+                ).fetchall()
+                if rows:
+                    self._tick += 1
+                    self._connection.execute(
+                        f"UPDATE entries SET used = ? WHERE namespace = ? AND key IN ({placeholders})",
+                        (self._tick, namespace, *chunk),
+                    )
+                hits.update(rows)
+
+        return hits
+
+    def put_many(
+        self, namespace: str, version: Hashable, items: Dict[str, Optional[str]]
+    ) -> None:
+        """Store many entries in one transaction, evicting LRU entries if needed.
+
+        Args:
+            namespace: Result kind, e.g. 'normalize_phone'
+            version: Rules version of the producer of the values
+            items: Key to value (str or None) mapping
+        """
+        if not items:
+            return
+
+        self._check_version(namespace, version)
+        self._tick += 1
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, used) VALUES (?, ?, ?, ?)",
+                ((namespace, key, value, self._tick) for key, value in items.items()),
+            )
+            count = self._connection.execute(
+                "SELECT COUNT(*) FROM entries WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+            if count > self.max_entries:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key IN ("
+                    "SELECT key FROM entries WHERE namespace = ? ORDER BY used LIMIT ?)",
+                    (namespace, namespace, count - self.max_entries),
+                )
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def _cached_map(
+    values: Iterable[Any],
+    cache: PersistentCache,
+    namespace: str,
+    version: Hashable,
+    compute: Callable[[Any], Optional[str]],
+    key_prefix: str = "",
+) -> List[Optional[str]]:
+    """Map *compute* over *values*, reading and writing the cache in bulk.
+
+    Only string values are cached; anything else is computed directly so
+    that invalid types are still reported.
+    """
+    values = list(values)
+    keys = {key_prefix + value for value in values if isinstance(value, str)}
+    results = cache.get_many(namespace, version, keys)
+
+    misses = {
+        key_prefix + value: compute(value)
+        for value in dict.fromkeys(value for value in values if isinstance(value, str))
+        if key_prefix + value not in results
+    }
+    cache.put_many(namespace, version, misses)
+    results.update(misses)
+
+    return [
+        results[key_prefix + value] if isinstance(value, str) else compute(value)
+        for value in values
+    ]
+
+
+def cached_normalize_phones(
+    phone_numbers: Iterable[Any], cache: PersistentCache, country_code: int = 38
+) -> List[Optional[str]]:
+    """Normalize many phone numbers through the persistent cache.
+
+    Args:
+        phone_numbers: Raw phone numbers
+        cache: Open cache
+        country_code: Country code passed to normalize_phone
+
+    Returns:
+        Normalized numbers (or None for invalid ones), in input order.
+        Invalid numbers are reported only when first computed.
+    """
+    from tasks import task_3
+
+    return _cached_map(
+        phone_numbers, cache, "normalize_phone", task_3.CACHE_VERSION,
+        lambda phone: task_3.normalize_phone(phone, country_code),
+        key_prefix=f"{country_code}:",
+    )
+
+
+def _to_dates(values: List[Optional[str]]) -> List[Optional[date]]:
+    return [date.fromisoformat(value) if value is not None else None for value in values]
+
+
+def cached_parse_dates(values: Iterable[Any], cache: PersistentCache) -> List[Optional[date]]:
+    """Parse many ISO 8601 date strings (task_1 rules) through the cache.
+
+    Args:
+        values: Date strings as accepted by get_days_from_today
+        cache: Open cache
+
+    Returns:
+        Parsed dates (or None for invalid values), in input order
+    """
+    from tasks import task_1
+
+    def compute(value: Any) -> Optional[str]:
+        error = task_1._check_args(value)
+        if error:
+            print(error.message)
+            return None
+        parsed = task_1._parse_date(value)
+        return parsed.isoformat() if parsed else None
+
+    return _to_dates(_cached_map(values, cache, "task_1.parse_date", task_1.CACHE_VERSION, compute))
+
+
+def cached_parse_birthdays(values: Iterable[Any], cache: PersistentCache) -> List[Optional[date]]:
+    """Parse many 'YYYY.MM.DD' birthday strings (task_4 rules) through the cache.
+
+    Args:
+        values: Birthday strings
+        cache: Open cache
+
+    Returns:
+        Parsed dates (or None for invalid values), in input order
+    """
+    from tasks import task_4
+
+    def compute(value: Any) -> Optional[str]:
+        parsed = task_4._parse_birthday(value)
+        return parsed.isoformat() if parsed else None
+
+    return _to_dates(_cached_map(values, cache, "task_4.parse_birthday", task_4.CACHE_VERSION, compute))
@@ -0,0 +1,258 @@
+"""Opt-in hot-path instrumentation for the tasks package.
+
+Nothing is measured until :func:`enable` is called. Enabling swaps the
+public task functions and their phase helpers for timing wrappers, and
+installs a counting ``print`` in each task module to classify error
+messages. :func:`disable` puts the original objects back, so the disabled
+state costs nothing.
+
+Only lookups through the module see the wrappers: a name imported with
+``from tasks.task_1 import get_days_from_today`` *before* enabling keeps
+pointing at the original function. Calls made in pool worker processes
+are not recorded.
+"""
+import builtins
+import functools
+import importlib
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Public entry points per module: calls and inclusive "total" time
+_ENTRY_POINTS: Dict[str, Tuple[str, ...]] = {
+    "tasks.task_1": ("get_days_from_today", "get_days_from_today_many", "get_days_histogram"),
+    "tasks.task_2": ("get_numbers_ticket",),
+    "tasks.task_3": ("normalize_phone", "normalize_phone_file"),
+    "tasks.task_4": (
+        "get_upcoming_birthdays",
+        "get_upcoming_birthdays_grouped",
+        "get_upcoming_birthdays_tz",
+        "get_upcoming_birthdays_sharded",
+    ),
+}
+
+# Internal helpers per module and the phase their (exclusive) time counts as
+_PHASES: Dict[str, Dict[str, str]] = {
+    "tasks.task_1": {"_check_args": "validate", "_parse_date": "parse", "_native_ordinal": "parse"},
+    "tasks.task_2": {"_check_args": "validate"},
+    "tasks.task_3": {"_check_args": "validate"},
+    "tasks.task_4": {
+        "_validate_value": "validate",
+        "_check_users": "validate",
+        "_check_user": "validate",
+        "_check_name": "validate",
+        "_parse_birthday": "parse",
+        "_congratulation_date": "compute",
+        "_format_date": "format",
+    },
+}
+
+# Error categories, checked in order against printed error messages
+_ERROR_CATEGORIES: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("empty", re.compile(r"empty")),
+    ("format", re.compile(r"format|parse|Invalid JSON|Unknown timezone")),
+    ("range", re.compile(r"positive|[<>]|too short|must not be after")),
+    ("type", re.compile(r"must be|Expected|not allowed")),
+]
+
+_lock = threading.Lock()
+_local = threading.local()
+_originals: List[Tuple[object, str, object]] = []
+_MISSING = object()
+
+_calls: Dict[str, int] = {}
+_seconds: Dict[Tuple[str, str], float] = {}
+_errors: Dict[Tuple[str, str], int] = {}
+
+
+def _current_function(default: str) -> str:
+    """Name of the entry point running in this thread, or *default*."""
+    return getattr(_local, "function", None) or default
+
+
+def _add_seconds(function: str, phase: str, seconds: float) -> None:
+    with _lock:
+        key = (function, phase)
+        _seconds[key] = _seconds.get(key, 0.0) + seconds
+
+
+def _wrap_entry_point(name: str, func: Callable) -> Callable:
+    """Count calls and measure inclusive time of a public function."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outer_function = getattr(_local, "function", None)
+        outer_child = getattr(_local, "child", 0.0)
+        _local.function, _local.child = name, 0.0
+        with _lock:
+            _calls[name] = _calls.get(name, 0) + 1
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            _add_seconds(name, "total", elapsed)
+            _local.function, _local.child = outer_function, outer_child + elapsed
+
+    return wrapper
+
+
+def _wrap_phase(module_name: str, phase: str, func: Callable) -> Callable:
+    """Measure exclusive time of a helper (nested phases are subtracted)."""
+    short_name = module_name.rsplit(".", 1)[-1]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        outer_child = getattr(_local, "child", 0.0)
+        _local.child = 0.0
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            _add_seconds(_current_function(short_name), phase, elapsed - _local.child)
+            _local.child = outer_child + elapsed
+
+    return wrapper
+
+
+def _categorize(message: str) -> str:
+    """Map an error message to an error category."""
+    for category, pattern in _ERROR_CATEGORIES:
+        if pattern.search(message):
+            return category
+    return "other"
+
+
+def _make_print(module_name: str) -> Callable:
+    """Build a ``print`` replacement that counts error messages."""
+    short_name = module_name.rsplit(".", 1)[-1]
+
+    def counting_print(*args, **kwargs):
+        key = (_current_function(short_name), _categorize(" ".join(map(str, args))))
+        with _lock:
+            _errors[key] = _errors.get(key, 0) + 1
+        builtins.print(*args, **kwargs)
+
+    return counting_print
+
+
+def _swap(module, attribute: str, replacement) -> None:
+    _originals.append((module, attribute, module.__dict__.get(attribute, _MISSING)))
+    setattr(module, attribute, replacement)
+
+
+def is_enabled() -> bool:
+    """Return True if instrumentation is currently enabled."""
+    return bool(_originals)
+
+
+def enable() -> None:
+    """Swap in instrumented wrappers. Calling it twice has no effect."""
+    if _originals:
+        return
+
+    for module_name, functions in _ENTRY_POINTS.items():
+        module = importlib.import_module(module_name)
+        for name in functions:
+            _swap(module, name, _wrap_entry_point(name, getattr(module, name)))
+        for name, phase in _PHASES.get(module_name, {}).items():
+            _swap(module, name, _wrap_phase(module_name, phase, getattr(module, name)))
+        _swap(module, "print", _make_print(module_name))
+
+
+def disable() -> None:
+    """Restore the original functions. Collected metrics are kept."""
+    while _originals:
+        module, attribute, original = _originals.pop()
+        if original is _MISSING:
+            delattr(module, attribute)
+        else:
+            setattr(module, attribute, original)
+
+
+def reset() -> None:
+    """Clear all collected metrics."""
+    with _lock:
+        _calls.clear()
+        _seconds.clear()
+        _errors.clear()
+
+
+def snapshot() -> Dict[str, Dict]:
+    """Return a copy of the collected metrics.
+
+    Returns:
+        Dictionary with three keys:
+        - 'calls': {function: call count}
+        - 'seconds': {function: {phase: cumulative seconds}}; 'total' is
+          inclusive, the validate/parse/compute/format phases are exclusive
+        - 'errors': {function: {category: count}} with categories
+          'empty', 'format', 'range', 'type' and 'other'
+    """
+    with _lock:
+        seconds: Dict[str, Dict[str, float]] = {}
+        for (function, phase), value in _seconds.items():
+            seconds.setdefault(function, {})[phase] = value
+        errors: Dict[str, Dict[str, int]] = {}
+        for (function, category), value in _errors.items():
+            errors.setdefault(function, {})[category] = value
+        return {"calls": dict(_calls), "seconds": seconds, "errors": errors}
+
+
+def to_prometheus(metrics: Optional[Dict[str, Dict]] = None) -> str:
+    """Render metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: Result of :func:`snapshot` (default: take one now)
+
+    Returns:
+        Exposition text ending with a newline
+    """
+    if metrics is None:
+        metrics = snapshot()
+
+    lines = [
+        "# HELP tasks_calls_total Number of calls per function.",
+        "# TYPE tasks_calls_total counter",
+    ]
+    for function, value in sorted(metrics["calls"].items()):
+        lines.append(f'tasks_calls_total{{function="{function}"}} {value}')
+
+    lines += [
+        "# HELP tasks_phase_seconds_total Cumulative time per function and phase.",
+        "# TYPE tasks_phase_seconds_total counter",
+    ]
+    for function, phases in sorted(metrics["seconds"].items()):
+        for phase, value in sorted(phases.items()):
+            lines.append(
+                f'tasks_phase_seconds_total{{function="{function}",phase="{phase}"}} {value:.9f}'
+            )
+
+    lines += [
+        "# HELP tasks_errors_total Reported input errors per function and category.",
+        "# TYPE tasks_errors_total counter",
+    ]
+    for function, categories in sorted(metrics["errors"].items()):
+        for category, value in sorted(categories.items()):
+            lines.append(
+                f'tasks_errors_total{{function="{function}",category="{category}"}} {value}'
+            )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str) -> None:
+    """Write current metrics to *path* in Prometheus text format.
+
+    The file is replaced atomically, so a scraper (e.g. the node_exporter
+    textfile collector) never reads a partial file.
+
+    Args:
+        path: Destination file path
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as metrics_file:
+        metrics_file.write(to_prometheus())
+    os.replace(temp_path, path)
@@ -0,0 +1,162 @@
+"""Near-duplicate detection for normalized phone numbers.
+
+Dirty records often differ by one mistyped, missing, extra or swapped
+digit. :func:`find_near_duplicates` groups numbers within a small edit
+distance without comparing every pair:
+
+1. Blocking: every number is indexed under its deletion neighborhood, the
+   strings left after deleting up to *max_distance* characters (a prefix
+   joined to a suffix). Two numbers within optimal string alignment
+   distance *d* always share a key with at most *d* deletions on each
+   side, so no duplicate pair is missed.
+2. Verification: only numbers sharing a key are compared, with a bounded
+   optimal string alignment (Damerau-Levenshtein with adjacent
+   transpositions) distance.
+3. Clustering: matching pairs are merged with union-find.
+
+For very large inputs the key space can be processed in several passes;
+each pass keeps only the keys that hash to it, trading time for memory.
+
+Example:
+    >>> find_near_duplicates(["+380501234567", "+380501234576", "+380671111111"])
+    [['+380501234567', '+380501234576']]
+"""
+from typing import Dict, Iterable, List, Optional, Set
+
+from tasks.validation import Field, compile_schema
+
+_check_args = compile_schema(
+    Field("max_distance", int, min_value=1),
+    Field("passes", int, min_value=1),
+)
+
+
+def _deletion_keys(value: str, max_distance: int) -> Set[str]:
+    """Return *value* and every string made by deleting up to *max_distance* characters."""
+    keys = {value}
+    layer = {value}
+    for _ in range(max_distance):
+        layer = {key[:i] + key[i + 1:] for key in layer for i in range(len(key))}
+        keys |= layer
+    return keys
+
+
+def osa_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """Optimal string alignment distance between two strings.
+
+    Counts insertions, deletions, substitutions and transpositions of
+    adjacent characters (each substring edited at most once).
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Stop early once the distance is known to exceed this
+
+    Returns:
+        The distance, or ``max_distance + 1`` if it exceeds *max_distance*
+    """
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    # Common prefixes and suffixes do not change the distance; near
+    # duplicates usually differ in one or two characters
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < limit - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+
+    previous_previous: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    distance = previous[len(b)]
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def _find(parents: List[int], item: int) -> int:
+    """Root of *item*, halving the path on the way."""
+    while parents[item] != item:
+        parents[item] = parents[parents[item]]
+        item = parents[item]
+    return item
+
+
+def find_near_duplicates(
+    phone_numbers: Iterable[Optional[str]],
+    max_distance: int = 1,
+    *,
+    passes: int = 1,
+) -> List[List[str]]:
+    """Cluster phone numbers that differ by at most *max_distance* edits.
+
+    Args:
+        phone_numbers: Normalized numbers, e.g. normalize_phone output.
+                       None and other non-strings (failed normalizations)
+                       are ignored; repeated numbers count once.
+        max_distance: Largest optimal string alignment distance between
+                      two numbers of a cluster (1 catches a single
+                      wrong, missing, extra or swapped digit)
+        passes: Split the blocking index into this many passes to bound
+                memory; results do not depend on it
+
+    Returns:
+        Clusters of two or more distinct numbers, each sorted, ordered by
+        their first number. Numbers are linked transitively, so members
+        of a cluster may be further apart than *max_distance*. Returns an
+        empty list if validation fails.
+
+    Validation:
+        - max_distance must be a positive integer
+        - passes must be a positive integer
+    """
+    error = _check_args(max_distance, passes)
+    if error:
+        print(f"Error: {error.message}")
+        return []
+
+    numbers = list(dict.fromkeys(value for value in phone_numbers if value.__class__ is str))
+    parents = list(range(len(numbers)))
+
+    for current_pass in range(passes):
+        blocks: Dict[str, List[int]] = {}
+        add_to_block = blocks.setdefault
+        for index, number in enumerate(numbers):
+            keys = _deletion_keys(number, max_distance)
+            if passes > 1:
+                keys = [key for key in keys if hash(key) % passes == current_pass]
+            for key in keys:
+                add_to_block(key, []).append(index)
+
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    root_first, root_second = _find(parents, first), _find(parents, second)
+                    if root_first == root_second:
+                        continue
+                    if osa_distance(numbers[first], numbers[second], max_distance) <= max_distance:
+                        parents[max(root_first, root_second)] = min(root_first, root_second)
+        del blocks
+
+    clusters: Dict[int, List[str]] = {}
+    for index, number in enumerate(numbers):
+        clusters.setdefault(_find(parents, index), []).append(number)
+
+    return sorted(sorted(cluster) for cluster in clusters.values() if len(cluster) > 1)
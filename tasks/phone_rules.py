@@ -0,0 +1,227 @@
+"""National numbering rules for normalized phone numbers.
+
+:func:`tasks.task_3.normalize_phone` only checks a minimum length. The
+rules here say whether a normalized number can exist: its country code,
+operator or area code and total length. A rule table is compiled once into
+a digit trie (a prefix automaton), so classifying a number is a single
+walk over its leading digits plus a length check.
+
+A table is a list of rules, one per country, as Python objects or JSON::
+
+    [{"country": "UA", "country_code": "380", "lengths": [12],
+      "mobile": ["50", "67", ...], "landline": ["44", "32", ...]}]
+
+``lengths`` counts all digits including the country code. ``mobile`` and
+``landline`` list the codes that may follow the country code; a rule
+without them accepts any number of the right length as "valid".
+
+Example:
+    >>> classify_phone("+380501234567")
+    'mobile'
+    >>> classify_phone("+380001234567")
+    'invalid'
+"""
+import json
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+MOBILE = "mobile"
+LANDLINE = "landline"
+VALID = "valid"
+INVALID = "invalid"
+
+_LINE_TYPES = (MOBILE, LANDLINE)
+_RULE_KEYS = frozenset(("country", "country_code", "lengths") + _LINE_TYPES)
+
+# Ukraine (+380, 9 national digits): mobile operator codes and geographic
+# area code prefixes. Load a table with load_phone_rules() to update them.
+UKRAINE_RULES: List[Dict[str, Any]] = [
+    {
+        "country": "UA",
+        "country_code": "380",
+        "lengths": [12],
+        "mobile": [
+            "39", "50", "63", "66", "67", "68", "73", "75", "77",
+            "91", "92", "93", "94", "95", "96", "97", "98", "99",
+        ],
+        "landline": [
+            "31", "32", "33", "34", "35", "36", "37", "38",
+            "41", "43", "44", "45", "46", "47", "48", "49",
+            "51", "52", "53", "54", "55", "56", "57",
+            "61", "62", "64", "65", "69",
+        ],
+    },
+]
+
+# Trie node: digit -> child node; the None key holds (category, lengths)
+_Node = Dict[Optional[str], Any]
+
+
+def _rule_error(rule: Any) -> Optional[str]:
+    """Describe what is wrong with one table entry, or return None."""
+    if not isinstance(rule, dict):
+        return f"rule must be a dict, got {type(rule).__name__}."
+    unknown = set(rule) - _RULE_KEYS
+    if unknown:
+        return f"unknown rule keys: {', '.join(sorted(map(str, unknown)))}."
+    country_code = rule.get("country_code")
+    if not isinstance(country_code, str) or not country_code.isdigit():
+        return "country_code must be a string of digits."
+    lengths = rule.get("lengths")
+    if not isinstance(lengths, list) or not lengths or not all(
+        isinstance(length, int) and not isinstance(length, bool) and length > len(country_code)
+        for length in lengths
+    ):
+        return "lengths must be a non-empty list of integers longer than the country code."
+    for line_type in _LINE_TYPES:
+        codes = rule.get(line_type, [])
+        if not isinstance(codes, list) or not all(isinstance(code, str) and code.isdigit() for code in codes):
+            return f"{line_type} must be a list of digit strings."
+    return None
+
+
+class PhoneRules:
+    """Compiled rule table.
+
+    Args:
+        table: List of rule dictionaries (see the module docstring)
+
+    Raises:
+        ValueError: If the table is malformed or two rules claim the same prefix
+    """
+
+    def __init__(self, table: Iterable[Dict[str, Any]]) -> None:
+        self._root: _Node = {}
+        for rule in table:
+            error = _rule_error(rule)
+            if error:
+                raise ValueError(f"Invalid phone rule: {error}")
+
+            lengths: FrozenSet[int] = frozenset(rule["lengths"])
+            typed = False
+            for line_type in _LINE_TYPES:
+                for code in rule.get(line_type, []):
+                    self._add(rule["country_code"] + code, (line_type, lengths))
+                    typed = True
+            if not typed:
+                self._add(rule["country_code"], (VALID, lengths))
+
+    def _add(self, prefix: str, outcome: Tuple[str, FrozenSet[int]]) -> None:
+        node = self._root
+        for digit in prefix:
+            node = node.setdefault(digit, {})
+        if None in node and node[None] != outcome:
+            raise ValueError(f"Conflicting phone rules for prefix {prefix}.")
+        node[None] = outcome
+
+    def classify(self, phone_number: str) -> str:
+        """Classify a normalized number ('+' and digits, or digits only).
+
+        Args:
+            phone_number: Number as returned by normalize_phone
+
+        Returns:
+            'mobile', 'landline', 'valid' (country without line-type
+            codes) or 'invalid' (no matching prefix, wrong length, non-digit
+            characters or not a string)
+        """
+        if phone_number.__class__ is not str:
+            return INVALID
+        digits = phone_number[1:] if phone_number[:1] == "+" else phone_number
+        if not (digits.isascii() and digits.isdigit()):
+            return INVALID
+
+        # The longest matching prefix that allows this length wins
+        length = len(digits)
+        node, category = self._root, INVALID
+        for digit in digits:
+            node = node.get(digit)
+            if node is None:
+                break
+            outcome = node.get(None)
+            if outcome is not None and length in outcome[1]:
+                category = outcome[0]
+        return category
+
+    def classify_many(self, phone_numbers: Iterable[str]) -> List[str]:
+        """Classify many normalized numbers.
+
+        Returns:
+            Categories in input order (see :meth:`classify`)
+        """
+        classify = self.classify
+        return [classify(phone_number) for phone_number in phone_numbers]
+
+
+def load_phone_rules(path: str) -> Optional[PhoneRules]:
+    """Compile a rule table from a JSON file.
+
+    Args:
+        path: File holding a JSON list of rules
+
+    Returns:
+        Compiled rules, or None if the file cannot be read or is invalid
+        (the error is printed)
+    """
+    try:
+        with open(path, encoding="utf-8") as rules_file:
+            table = json.load(rules_file)
+    except OSError as error:
+        print(f"Error: Cannot read phone rules '{path}': {error.strerror}.")
+        return None
+    except json.JSONDecodeError as error:
+        print(f"Error: Invalid JSON in phone rules '{path}': {error.msg}.")
+        return None
+
+    if not isinstance(table, list):
+        print(f"Error: Phone rules must be a JSON list, got {type(table).__name__}.")
+        return None
+    try:
+        return PhoneRules(table)
+    except ValueError as error:
+        print(f"Error: {error}")
+        return None
+
+
+_default_rules: Optional[PhoneRules] = None
+
+
+def _get_default_rules() -> PhoneRules:
+    global _default_rules
+    if _default_rules is None:
+        _default_rules = PhoneRules(UKRAINE_RULES)
+    return _default_rules
+
+
+def classify_phone(phone_number: str, rules: Optional[PhoneRules] = None) -> str:
+    """Classify a normalized number with *rules* (default: UKRAINE_RULES).
+
+    Returns:
+        'mobile', 'landline', 'valid' or 'invalid'
+    """
+    return (rules or _get_default_rules()).classify(phone_number)
+
+
+def classify_phones(
+    phone_numbers: Iterable[Any],
+    rules: Optional[PhoneRules] = None,
+    country_code: int = 38,
+) -> List[Tuple[Optional[str], str]]:
+    """Normalize raw numbers and classify the results.
+
+    Args:
+        phone_numbers: Raw phone numbers
+        rules: Compiled rules (default: UKRAINE_RULES)
+        country_code: Country code passed to normalize_phone
+
+    Returns:
+        (normalized number or None, category) pairs in input order.
+        Numbers normalize_phone rejects are reported and 'invalid'.
+    """
+    from tasks.task_3 import normalize_phone
+
+    classify = (rules or _get_default_rules()).classify
+    results = []
+    for phone_number in phone_numbers:
+        normalized = normalize_phone(phone_number, country_code)
+        results.append((normalized, classify(normalized) if normalized else INVALID))
+    return results
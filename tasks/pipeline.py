@@ -0,0 +1,305 @@
+"""Streaming record pipeline over the task functions.
+
+A :class:`Pipeline` runs dictionaries through a chain of stages, e.g.
+normalize a phone, compute days from a date and check for an upcoming
+birthday, in one pass over the input. Records are read lazily and grouped
+into batches; every stage processes a whole batch column at a time, so
+per-call work such as reading "today" or checking options happens once per
+batch, and values are validated inline before the trusted (``validate=False``)
+task functions run. Batches can be spread over a process pool; results are
+yielded in input order.
+
+Each stage reads one field and writes one output field. Invalid values are
+reported as by the task functions and produce None.
+
+Example:
+    >>> pipeline = Pipeline([
+    ...     PhoneStage("phone"),
+    ...     DaysStage("signup_date", output="days_from_signup"),
+    ...     BirthdayStage("birthday"),
+    ... ])
+    >>> for record in pipeline.run(records, workers=4):
+    ...     ...
+    >>> pipeline.metrics()["normalize_phone:phone"]["per_second"]
+"""
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from tasks import task_1, task_3, task_4
+
+# (stage name, items, invalid, seconds) for one stage over one batch
+_StageMetrics = Tuple[str, int, int, float]
+
+
+class Stage(ABC):
+    """Base class of pipeline stages.
+
+    Args:
+        field: Record key to read
+        output: Record key to write
+    """
+
+    kind = "stage"
+
+    def __init__(self, field: str, output: str) -> None:
+        self.field = field
+        self.output = output
+
+    @property
+    def name(self) -> str:
+        """Metrics key: '<kind>:<field>'."""
+        return f"{self.kind}:{self.field}"
+
+    @abstractmethod
+    def process(self, values: List[Any], today: date) -> Tuple[List[Any], int]:
+        """Process one batch column.
+
+        Args:
+            values: Field values (None for missing fields)
+            today: Reference date shared by the whole run
+
+        Returns:
+            (outputs in input order, number of invalid values)
+        """
+
+
+class PhoneStage(Stage):
+    """Normalize phone numbers with :func:`tasks.task_3.normalize_phone`.
+
+    Args:
+        field: Record key holding the raw number
+        output: Record key for the normalized number (default: '<field>_normalized')
+        country_code: Country code passed to normalize_phone
+
+    Raises:
+        ValueError: If country_code is not a positive integer
+    """
+
+    kind = "normalize_phone"
+
+    def __init__(self, field: str, output: Optional[str] = None, country_code: int = 38) -> None:
+        error = task_3._check_country_code(country_code)
+        if error:
+            raise ValueError(error.message)
+        super().__init__(field, output or f"{field}_normalized")
+        self.country_code = country_code
+
+    def process(self, values: List[Any], today: date) -> Tuple[List[Any], int]:
+        normalize_phone, country_code = task_3.normalize_phone, self.country_code
+        outputs = []
+        for value in values:
+            # Country code was checked once; only the value needs checking
+            trusted = value.__class__ is str and value.strip()
+            outputs.append(normalize_phone(value, country_code, validate=not trusted))
+        return outputs, outputs.count(None)
+
+
+class DaysStage(Stage):
+    """Compute days from today with :func:`tasks.task_1.get_days_from_today_many`.
+
+    Args:
+        field: Record key holding the date
+        output: Record key for the day difference (default: '<field>_days')
+        epoch_unit: Passed to get_days_from_today_many
+        lenient: Passed to get_days_from_today_many
+
+    Raises:
+        ValueError: If epoch_unit is not None, 'seconds' or 'days'
+    """
+
+    kind = "get_days_from_today"
+
+    def __init__(
+        self,
+        field: str,
+        output: Optional[str] = None,
+        epoch_unit: Optional[str] = None,
+        lenient: bool = False,
+    ) -> None:
+        if epoch_unit is not None and epoch_unit not in task_1.EPOCH_UNITS:
+            raise ValueError(f"epoch_unit must be one of {', '.join(task_1.EPOCH_UNITS)}, got {epoch_unit!r}.")
+        super().__init__(field, output or f"{field}_days")
+        self.epoch_unit = epoch_unit
+        self.lenient = lenient
+
+    def process(self, values: List[Any], today: date) -> Tuple[List[Any], int]:
+        outputs = task_1.get_days_from_today_many(
+            values, epoch_unit=self.epoch_unit, lenient=self.lenient, today=today
+        )
+        return outputs, outputs.count(None)
+
+
+class BirthdayStage(Stage):
+    """Find congratulation dates in the next 7 days (task_4 rules).
+
+    Args:
+        field: Record key holding the 'YYYY.MM.DD' birthday
+        output: Record key for the 'YYYY.MM.DD' congratulation date, or None
+                when the birthday is not upcoming (default: 'congratulation_date')
+        strict: Parse every birthday. False first compares the month and
+                day slice with the window, as in get_upcoming_birthdays.
+    """
+
+    kind = "upcoming_birthday"
+
+    def __init__(self, field: str, output: str = "congratulation_date", strict: bool = True) -> None:
+        super().__init__(field, output)
+        self.strict = strict
+
+    def process(self, values: List[Any], today: date) -> Tuple[List[Any], int]:
+        window = None if self.strict else task_4._window_month_days(today)
+        formatted: Dict[date, str] = {}
+        outputs: List[Optional[str]] = []
+        invalid = 0
+        for value in values:
+            if window is not None and task_4._outside_window(value, window):
+                outputs.append(None)
+                continue
+
+            birthday = task_4._parse_birthday(value)
+            if birthday is None:
+                invalid += 1
+                outputs.append(None)
+                continue
+
+            congratulation_date = task_4._congratulation_date(birthday, today)
+            if congratulation_date is None:
+                outputs.append(None)
+                continue
+            text = formatted.get(congratulation_date)
+            if text is None:
+                text = formatted[congratulation_date] = task_4._format_date(congratulation_date)
+            outputs.append(text)
+        return outputs, invalid
+
+
+def _run_batch(
+    stages: Sequence[Stage], batch: List[Any], today: date
+) -> Tuple[List[Dict[str, Any]], List[_StageMetrics]]:
+    """Run every stage over one batch (in the caller or a pool worker).
+
+    Returns:
+        (output records, per-stage metrics)
+    """
+    records = []
+    for record in batch:
+        if isinstance(record, dict):
+            records.append(dict(record))
+        else:
+            print(f"Error: record must be a dict, got {type(record).__name__}.")
+
+    metrics = []
+    for stage in stages:
+        started = time.perf_counter()
+        field = stage.field
+        outputs, invalid = stage.process([record.get(field) for record in records], today)
+        output = stage.output
+        for record, value in zip(records, outputs):
+            record[output] = value
+        metrics.append((stage.name, len(records), invalid, time.perf_counter() - started))
+    return records, metrics
+
+
+class Pipeline:
+    """Chain of stages applied to a stream of dictionaries.
+
+    Args:
+        stages: Stages in execution order; later stages see the outputs
+                of earlier ones
+        batch_size: Records per batch (and per pool task)
+
+    Raises:
+        ValueError: If there are no stages, a stage is not a Stage, two
+                    stages share a name, or batch_size is not a positive integer
+    """
+
+    def __init__(self, stages: Sequence[Stage], batch_size: int = 10_000) -> None:
+        stages = list(stages)
+        if not stages or not all(isinstance(stage, Stage) for stage in stages):
+            raise ValueError("stages must be a non-empty sequence of Stage objects.")
+        names = [stage.name for stage in stages]
+        if len(set(names)) != len(names):
+            raise ValueError("stage names (kind:field) must be unique.")
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        self.stages = stages
+        self.batch_size = batch_size
+        self._totals: Dict[str, List[float]] = {name: [0, 0, 0.0] for name in names}
+
+    def _add_metrics(self, metrics: List[_StageMetrics]) -> None:
+        for name, items, invalid, seconds in metrics:
+            totals = self._totals[name]
+            totals[0] += items
+            totals[1] += invalid
+            totals[2] += seconds
+
+    def run(self, records: Iterable[Any], *, workers: int = 1) -> Iterator[Dict[str, Any]]:
+        """Process *records* lazily and yield output records in input order.
+
+        Input dictionaries are copied, not modified. Non-dict records are
+        reported and dropped.
+
+        Args:
+            records: Iterable of dictionaries
+            workers: Processes to spread batches over (1 runs in this process).
+                     At most 2 * workers batches are in flight at a time.
+
+        Yields:
+            Copies of the input records with the stage outputs added
+
+        Raises:
+            ValueError: If workers is not a positive integer
+        """
+        if not isinstance(workers, int) or isinstance(workers, bool) or workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        return self._run(records, workers)
+
+    def _run(self, records: Iterable[Any], workers: int) -> Iterator[Dict[str, Any]]:
+        today = datetime.today().date()
+        records = iter(records)
+        batches = iter(lambda: list(islice(records, self.batch_size)), [])
+
+        if workers == 1:
+            for batch in batches:
+                output, metrics = _run_batch(self.stages, batch, today)
+                self._add_metrics(metrics)
+                yield from output
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for batch in batches:
+                pending.append(pool.submit(_run_batch, self.stages, batch, today))
+                if len(pending) >= 2 * workers:
+                    output, metrics = pending.popleft().result()
+                    self._add_metrics(metrics)
+                    yield from output
+            while pending:
+                output, metrics = pending.popleft().result()
+                self._add_metrics(metrics)
+                yield from output
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Return cumulative per-stage metrics over all runs.
+
+        Returns:
+            {stage name: {'items', 'invalid', 'seconds', 'per_second'}};
+            seconds is stage processing time summed over batches (across
+            workers, so it can exceed wall time)
+        """
+        return {
+            name: {
+                "items": items,
+                "invalid": invalid,
+                "seconds": seconds,
+                "per_second": items / seconds if seconds else 0.0,
+            }
+            for name, (items, invalid, seconds) in self._totals.items()
+        }
@@ -0,0 +1,270 @@
+"""Asyncio scheduler for congratulation messages.
+
+Instead of recomputing :func:`tasks.task_4.get_upcoming_birthdays` on a
+timer, :class:`BirthdayScheduler` keeps every user's next congratulation
+time in a min-heap, sleeps until the earliest one and hands due messages to
+a pluggable async sender. Adding, changing or removing a user touches only
+that user's heap entry; reloading an unchanged user touches nothing.
+Replaced entries are skipped lazily when they reach the top of the heap,
+and the heap is rebuilt once they outnumber the live entries.
+
+Congratulation dates follow task_4 rules: the next birthday on or after
+today (Feb 29 -> March 1 in non-leap years), moved from a weekend to
+Monday. After a message is sent, the user is rescheduled for the next year.
+
+Example:
+    >>> sender = LocalSender()
+    >>> scheduler = BirthdayScheduler(sender, max_concurrency=5)
+    >>> scheduler.load([{"name": "John", "birthday": "1985.01.23"}])
+    1
+    >>> asyncio.run(scheduler.run())  # until scheduler.stop() is called
+"""
+import asyncio
+import heapq
+from datetime import date, datetime, time, timedelta
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from tasks.task_4 import _birthday_in_year, _parse_user, _shift_weekend
+
+# Async callable receiving (name, congratulation_date)
+Sender = Callable[[str, date], Awaitable[None]]
+
+# Longest single sleep, so wall clock jumps (suspend, manual changes) are noticed
+_MAX_SLEEP_SECONDS = 3600.0
+
+
+def _next_congratulation_date(birthday: date, today: date) -> date:
+    """Return the congratulation date of the next birthday on or after *today*."""
+    occurrence = _birthday_in_year(birthday, today.year)
+    if occurrence < today:
+        occurrence = _birthday_in_year(birthday, today.year + 1)
+    return _shift_weekend(occurrence)
+
+
+class LocalSender:
+    """In-process sender that only records messages, for tests and dry runs.
+
+    Attributes:
+        sent: (name, congratulation_date) pairs in dispatch order
+    """
+
+    def __init__(self) -> None:
+        self.sent: List[Tuple[str, date]] = []
+
+    async def __call__(self, name: str, congratulation_date: date) -> None:
+        self.sent.append((name, congratulation_date))
+
+
+class BirthdayScheduler:
+    """Min-heap of upcoming congratulations with bounded-concurrency dispatch.
+
+    Users are identified by a key: upserting a user with a known key
+    replaces their schedule. The default key is (name, birth date), so
+    users sharing a name are scheduled separately; pass *key* (e.g.
+    ``lambda user: user["id"]``) to let upserts change a user's birthday.
+    Failed sends are reported and not retried.
+
+    Args:
+        sender: Async callable receiving (name, congratulation_date)
+        key: Returns the key of a valid user record (default: (name, birthday date))
+        max_concurrency: Maximum number of sends in flight
+        send_time: Local time of day at which messages become due
+        clock: Returns the current local datetime (injectable for tests)
+        sleep: Async sleep function (injectable for tests)
+
+    Raises:
+        ValueError: If max_concurrency is not a positive integer
+    """
+
+    def __init__(
+        self,
+        sender: Sender,
+        *,
+        key: Optional[Callable[[Any], Hashable]] = None,
+        max_concurrency: int = 10,
+        send_time: time = time(9, 0),
+        clock: Callable[[], datetime] = datetime.now,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if not isinstance(max_concurrency, int) or isinstance(max_concurrency, bool) or max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+
+        self.sender = sender
+        self.key = key
+        self.send_time = send_time
+        self.sent = 0
+        self.failed = 0
+        self._clock = clock
+        self._sleep = sleep
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        # Heap of (due, sequence, key); key -> (sequence, name, birthday) of the live entry
+        self._heap: List[Tuple[datetime, int, Hashable]] = []
+        self._entries: Dict[Hashable, Tuple[int, str, date]] = {}
+        self._sequence = count()
+        self._in_flight: Set["asyncio.Task[None]"] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _schedule(self, key: Hashable, name: str, birthday: date, today: date) -> None:
+        due = datetime.combine(_next_congratulation_date(birthday, today), self.send_time)
+        sequence = next(self._sequence)
+        self._entries[key] = (sequence, name, birthday)
+        heapq.heappush(self._heap, (due, sequence, key))
+
+    def _upsert(self, key: Hashable, name: str, birthday: date, today: date) -> None:
+        """Schedule a loaded user unless their live entry is unchanged."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] == name and entry[2] == birthday:
+            return
+        self._schedule(key, name, birthday, today)
+        self._compact()
+
+    def _compact(self) -> None:
+        """Drop replaced and removed heap entries once they outnumber live ones."""
+        if len(self._heap) <= 2 * len(self._entries):
+            return
+        entries = self._entries
+        self._heap = [item for item in self._heap if entries.get(item[2], (None,))[0] == item[1]]
+        heapq.heapify(self._heap)
+
+    def _user_key(self, user, name: str, birthday: date) -> Hashable:
+        return (name, birthday) if self.key is None else self.key(user)
+
+    def load(self, users: Iterable) -> int:
+        """Schedule many users (invalid records are reported and skipped).
+
+        Args:
+            users: User dictionaries or User records, as for get_upcoming_birthdays
+
+        Returns:
+            Number of distinct keys scheduled; a later record with the same
+            key replaces an earlier one
+        """
+        today = self._clock().date()
+        keys = set()
+        for user in users:
+            parsed = _parse_user(user)
+            if parsed:
+                key = self._user_key(user, *parsed)
+                self._upsert(key, *parsed, today)
+                keys.add(key)
+        self._wakeup.set()
+        return len(keys)
+
+    def upsert_user(self, user) -> bool:
+        """Add a user or replace the schedule of the user with the same key.
+
+        Args:
+            user: User dictionary or User record
+
+        Returns:
+            True if scheduled, False if the record is invalid (reported)
+        """
+        parsed = _parse_user(user)
+        if not parsed:
+            return False
+        self._upsert(self._user_key(user, *parsed), *parsed, self._clock().date())
+        self._wakeup.set()
+        return True
+
+    def remove_user(self, key: Hashable) -> bool:
+        """Stop congratulating the user with *key*.
+
+        Args:
+            key: User key, e.g. ("John", date(1985, 1, 23)) with the default key
+
+        Returns:
+            True if the user was scheduled, False otherwise
+        """
+        if self._entries.pop(key, None) is None:
+            return False
+        self._compact()
+        self._wakeup.set()
+        return True
+
+    def next_due(self) -> Optional[Tuple[datetime, str]]:
+        """Return (due datetime, name) of the earliest live entry, or None."""
+        heap = self._heap
+        while heap:
+            due, sequence, key = heap[0]
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == sequence:
+                return due, entry[1]
+            # Replaced or removed user
+            heapq.heappop(heap)
+        return None
+
+    async def _send(self, name: str, congratulation_date: date) -> None:
+        async with self._semaphore:
+            try:
+                await self.sender(name, congratulation_date)
+            except Exception as error:
+                self.failed += 1
+                print(f"Error: Cannot send congratulation to '{name}': {error}")
+            else:
+                self.sent += 1
+
+    def _dispatch_due(self) -> List["asyncio.Task[None]"]:
+        """Start sends for every due entry and reschedule those users."""
+        now = self._clock()
+        tasks = []
+        head = self.next_due()
+        while head is not None and head[0] <= now:
+            due, _, key = heapq.heappop(self._heap)
+            _, name, birthday = self._entries[key]
+            self._schedule(key, name, birthday, due.date() + timedelta(days=1))
+
+            task = asyncio.ensure_future(self._send(name, due.date()))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            tasks.append(task)
+            head = self.next_due()
+        return tasks
+
+    async def run_pending(self) -> int:
+        """Send every message that is due now and wait for the sends.
+
+        Returns:
+            Number of messages dispatched
+        """
+        tasks = self._dispatch_due()
+        if tasks:
+            await asyncio.gather(*tasks)
+        return len(tasks)
+
+    async def _wait(self, delay: Optional[float]) -> None:
+        """Sleep for *delay* seconds (forever if None) or until woken up."""
+        waiters = {asyncio.ensure_future(self._wakeup.wait())}
+        if delay is not None:
+            waiters.add(asyncio.ensure_future(self._sleep(delay)))
+        _, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+
+    async def run(self) -> None:
+        """Dispatch messages as they become due until :meth:`stop` is called.
+
+        Sends still in flight when stopping are awaited.
+        """
+        self._stopping = False
+        try:
+            while not self._stopping:
+                self._wakeup.clear()
+                self._dispatch_due()
+                head = self.next_due()
+                delay = None
+                if head is not None:
+                    delay = min(max((head[0] - self._clock()).total_seconds(), 0.0), _MAX_SLEEP_SECONDS)
+                await self._wait(delay)
+        finally:
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight)
+
+    def stop(self) -> None:
+        """Ask :meth:`run` to return after the current iteration."""
+        self._stopping = True
+        self._wakeup.set()
@@ -0,0 +1,312 @@
+"""Month-day birthday index in shared memory for multi-process servers.
+
+One process builds the index with :func:`publish_birthday_index`; every
+worker opens it with :class:`SharedBirthdayIndex` and answers
+get_upcoming_birthdays queries from the shared pages, without a private
+copy of the user data.
+
+Two :mod:`multiprocessing.shared_memory` blocks are used:
+
+* a control block named *name* holding the current generation number
+  (written twice, so a reader can detect a torn read);
+* a data block named ``{name}_{generation}`` per build, in native byte
+  order (the block never leaves the host, and readers cast the arrays
+  in place)::
+
+      header    magic b"BDIX", format version, user count, names size
+      offsets   367 x u32: users of day-of-year slot k are entries
+                offsets[k] .. offsets[k + 1] (Feb 29 is slot 59)
+      ordinals  count x u32: birth date as date.toordinal()
+      positions count x u32: position of the user in the input list
+      name_ends count x u32: end of each name in the names blob
+      names     UTF-8 names, concatenated in entry order
+
+A rebuild writes a new data block, bumps the generation and unlinks the
+old block. Readers compare the generation before each query and re-attach
+when it changed; pages of the old block stay valid until they let go.
+
+The blocks outlive the processes that use them (they are not tracked by
+the multiprocessing resource tracker); call :func:`unlink_birthday_index`
+to remove them.
+"""
+import struct
+from datetime import date, datetime, timedelta
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tasks.task_4 import _congratulation_date, _format_date, _parse_user
+
+_MAGIC = b"BDIX"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("=4sIII")
+_CONTROL = struct.Struct("=QQ")
+_SLOTS = 366
+_LEAP_DAY_SLOT = 59
+_LEAP_YEAR = 2000
+_ATTACH_ATTEMPTS = 3
+
+
+def _slot(month: int, day: int) -> int:
+    """Day-of-year slot of a month/day in a leap year (0-based)."""
+    return (date(_LEAP_YEAR, month, day) - date(_LEAP_YEAR, 1, 1)).days
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Open an existing block without registering it for cleanup at exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the block with the resource tracker,
+        # which would unlink it when this process exits
+        block = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _create(name: str, size: int) -> shared_memory.SharedMemory:
+    """Create a block that is not unlinked when this process exits."""
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size, track=False)
+    except TypeError:
+        block = shared_memory.SharedMemory(name=name, create=True, size=size)
+        resource_tracker.unregister(block._name, "shared_memory")
+        return block
+
+
+def _unlink(block: shared_memory.SharedMemory) -> None:
+    """Close and remove an untracked block."""
+    block.close()
+    if getattr(block, "_track", True):
+        # unlink() unregisters the block on Python < 3.13; register it back
+        # first so the resource tracker does not report an unknown name
+        resource_tracker.register(block._name, "shared_memory")
+    block.unlink()
+
+
+def _data_name(name: str, generation: int) -> str:
+    return f"{name}_{generation}"
+
+
+def _read_generation(control: shared_memory.SharedMemory) -> int:
+    while True:
+        first, second = _CONTROL.unpack_from(control.buf)
+        if first == second:
+            return first
+
+
+def _pack_index(users: Iterable) -> Tuple[bytes, int]:
+    """Serialize valid users into the data block layout.
+
+    Returns:
+        (block bytes, number of indexed users)
+    """
+    slots: List[List[Tuple[int, int, bytes]]] = [[] for _ in range(_SLOTS)]
+    for position, user in enumerate(users):
+        parsed = _parse_user(user)
+        if parsed:
+            name, birthday = parsed
+            slots[_slot(birthday.month, birthday.day)].append(
+                (birthday.toordinal(), position, name.encode("utf-8"))
+            )
+
+    offsets, ordinals, positions, name_ends, names = [0], [], [], [], []
+    names_size = 0
+    for entries in slots:
+        for ordinal, position, encoded in entries:
+            ordinals.append(ordinal)
+            positions.append(position)
+            names.append(encoded)
+            names_size += len(encoded)
+            name_ends.append(names_size)
+        offsets.append(len(ordinals))
+
+    count = len(ordinals)
+    arrays = struct.pack(f"={_SLOTS + 1 + 3 * count}I", *offsets, *ordinals, *positions, *name_ends)
+    return _HEADER.pack(_MAGIC, _FORMAT_VERSION, count, names_size) + arrays + b"".join(names), count
+
+
+def publish_birthday_index(users: Iterable, name: str) -> int:
+    """Build the month-day index into shared memory and make it current.
+
+    Invalid records are reported and skipped, as in get_upcoming_birthdays.
+    Only one process should publish under a given *name* at a time.
+
+    Args:
+        users: User dictionaries or User records
+        name: Index name (the control block name)
+
+    Returns:
+        Generation number of the published index
+    """
+    try:
+        control = _attach(name)
+    except FileNotFoundError:
+        control = _create(name, _CONTROL.size)
+        _CONTROL.pack_into(control.buf, 0, 0, 0)
+
+    try:
+        previous = _read_generation(control)
+        generation = previous + 1
+        payload, _ = _pack_index(users)
+
+        data = _create(_data_name(name, generation), len(payload))
+        data.buf[:len(payload)] = payload
+        data.close()
+
+        _CONTROL.pack_into(control.buf, 0, generation, generation)
+    finally:
+        control.close()
+
+    if previous:
+        try:
+            stale = _attach(_data_name(name, previous))
+        except FileNotFoundError:
+            pass
+        else:
+            _unlink(stale)
+    return generation
+
+
+def unlink_birthday_index(name: str) -> None:
+    """Remove the control block and the current data block of *name*."""
+    try:
+        control = _attach(name)
+    except FileNotFoundError:
+        return
+    generation = _read_generation(control)
+    _unlink(control)
+
+    try:
+        data = _attach(_data_name(name, generation))
+    except FileNotFoundError:
+        return
+    _unlink(data)
+
+
+class SharedBirthdayIndex:
+    """Read-only view of a published birthday index.
+
+    Args:
+        name: Index name passed to publish_birthday_index
+
+    Raises:
+        FileNotFoundError: If no index was published under *name*
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.generation = 0
+        self._control = _attach(name)
+        self._data: Optional[shared_memory.SharedMemory] = None
+        self._views: Dict[str, memoryview] = {}
+        self.refresh()
+
+    def __enter__(self) -> "SharedBirthdayIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._views["ordinals"])
+
+    def _release(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views = {}
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+
+    def close(self) -> None:
+        """Detach from the shared blocks (they are not removed)."""
+        self._release()
+        if self._control is not None:
+            self._control.close()
+            self._control = None
+
+    def refresh(self) -> bool:
+        """Switch to the latest generation if a rebuild was published.
+
+        Returns:
+            True if a new generation was attached
+
+        Raises:
+            FileNotFoundError: If the index was unlinked
+        """
+        for attempt in range(_ATTACH_ATTEMPTS):
+            generation = _read_generation(self._control)
+            if generation == self.generation:
+                return False
+            try:
+                data = _attach(_data_name(self.name, generation))
+                break
+            except FileNotFoundError:
+                # Replaced again between reading the generation and attaching,
+                # or the index was unlinked
+                if attempt == _ATTACH_ATTEMPTS - 1:
+                    raise
+
+        self._release()
+        self._data, self.generation = data, generation
+
+        magic, version, count, names_size = _HEADER.unpack_from(data.buf)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"Shared block '{data.name}' is not a birthday index.")
+
+        start = _HEADER.size
+        views = {}
+        for key, length in (("offsets", _SLOTS + 1), ("ordinals", count), ("positions", count), ("name_ends", count)):
+            views[key] = data.buf[start:start + 4 * length].cast("I")
+            start += 4 * length
+        views["names"] = data.buf[start:start + names_size]
+        self._views = views
+        return True
+
+    def _entries(self, slot: int) -> range:
+        offsets = self._views["offsets"]
+        return range(offsets[slot], offsets[slot + 1])
+
+    def _name(self, entry: int) -> str:
+        name_ends = self._views["name_ends"]
+        start = name_ends[entry - 1] if entry else 0
+        return str(self._views["names"][start:name_ends[entry]], "utf-8")
+
+    def get_upcoming_birthdays(self, today: Optional[date] = None) -> List[Dict[str, str]]:
+        """Same result as task_4.get_upcoming_birthdays for the indexed users.
+
+        Only the slots of the 7 days from *today* are read (plus Feb 29
+        when March 1 of a non-leap year is among them).
+
+        Args:
+            today: Reference date (default: today)
+
+        Returns:
+            List of dictionaries with 'name' and 'congratulation_date'
+            ('YYYY.MM.DD') keys, in the order users were published
+        """
+        self.refresh()
+        if today is None:
+            today = datetime.today().date()
+
+        slots = []
+        for offset in range(7):
+            day = today + timedelta(days=offset)
+            slots.append(_slot(day.month, day.day))
+            # March 1 right after Feb 28: a non-leap year
+            if day.month == 3 and day.day == 1 and (day - timedelta(days=1)).day == 28:
+                slots.append(_LEAP_DAY_SLOT)
+
+        ordinals, positions = self._views["ordinals"], self._views["positions"]
+        found = []
+        for slot in slots:
+            for entry in self._entries(slot):
+                congratulation_date = _congratulation_date(date.fromordinal(ordinals[entry]), today)
+                if congratulation_date is not None:
+                    found.append((positions[entry], entry, congratulation_date))
+
+        found.sort()
+        return [
+            {"name": self._name(entry), "congratulation_date": _format_date(congratulation_date)}
+            for _, entry, congratulation_date in found
+        ]
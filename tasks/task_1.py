@@ -1,8 +1,222 @@
-from datetime import datetime
-from typing import Optional
+from bisect import bisect_right
+from datetime import date as Date, datetime
+from itertools import islice
+from operator import index as as_integer
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
+from tasks.validation import Field, compile_schema
 
-def get_days_from_today(date: str) -> Optional[int]:
+_check_args = compile_schema(
+    Field(
+        "date", str, non_empty=True,
+        messages={"type": "Expected a string, got {type}.", "empty": "Date string is empty."},
+    )
+)
+
+# Bump when date parsing rules change: invalidates tasks.cache entries
+CACHE_VERSION = 1
+
+if TYPE_CHECKING:
+    from tasks.cache import PersistentCache
+
+# Units accepted for integer epoch input, as a divisor giving days
+EPOCH_UNITS = {"seconds": 86_400, "days": 1}
+_EPOCH_ORDINAL = Date(1970, 1, 1).toordinal()
+_MAX_ORDINAL = Date.max.toordinal()
+
+# Histogram buckets in order, and the day offsets where each next one starts
+HISTOGRAM_BUCKETS = ("older", "overdue", "today", "this_week", "later", "invalid")
+_BUCKET_STARTS = (-7, 0, 1, 8)
+_INVALID_BUCKET = len(HISTOGRAM_BUCKETS) - 1
+
+# Limits of the per-call parse memo and of chunks sent to a persistent cache
+_MEMO_SIZE = 100_000
+_CACHE_CHUNK_SIZE = 10_000
+
+
+def _parse_date(date_str: str) -> Optional[Date]:
+    """Parse an ISO 8601 string into a date, ignoring any time component.
+
+    Args:
+        date_str: Non-empty date string
+
+    Returns:
+        date object if valid, None otherwise
+    """
+    try:
+        return datetime.fromisoformat(date_str).date()
+    except (ValueError, TypeError):
+        print(
+            "Cannot parse the date. "
+            "Please use a valid ISO 8601 format: YYYY-MM-DD"
+        )
+        return None
+
+
+def _native_ordinal(value: Any, epoch_unit: Optional[str]) -> Optional[int]:
+    """Day ordinal of a date, datetime, epoch integer or NumPy datetime64.
+
+    Args:
+        value: Non-string date value
+        epoch_unit: Unit of integer input ('seconds' or 'days'), or None
+                    to reject integers
+
+    Returns:
+        Proleptic Gregorian ordinal of the (UTC for epochs) calendar date,
+        or None if *value* is not supported (the error is printed)
+    """
+    # datetime is a subclass of date; its ordinal ignores the time of day
+    if isinstance(value, Date):
+        return value.toordinal()
+
+    if type(value).__name__ == "datetime64":
+        if value != value:
+            print("Cannot use NaT as a date.")
+            return None
+        value, epoch_unit = value.astype("datetime64[D]").astype("int64"), "days"
+
+    if epoch_unit is not None and value.__class__ is not bool:
+        try:
+            days = as_integer(value) // EPOCH_UNITS[epoch_unit]
+        except TypeError:
+            pass
+        else:
+            ordinal = _EPOCH_ORDINAL + days
+            if 1 <= ordinal <= _MAX_ORDINAL:
+                return ordinal
+            print(f"Epoch value {value} is outside the supported date range.")
+            return None
+
+    print(f"Expected a string, got {type(value).__name__}.")
+    return None
+
+
+def _array_epoch_days(values: Any, kind: str, epoch_unit: Optional[str]) -> Optional[List[int]]:
+    """Convert a whole NumPy datetime64 or integer array to epoch days.
+
+    Returns:
+        Days since 1970-01-01 as Python ints, or None if any element is
+        NaT or out of range (the caller then reports them one by one)
+    """
+    if kind == "M":
+        if (values != values).any():
+            return None
+        days = values.astype("datetime64[D]").astype("int64").tolist()
+    else:
+        days = (values // EPOCH_UNITS[epoch_unit]).tolist()
+
+    if days and not (1 <= _EPOCH_ORDINAL + min(days) and _EPOCH_ORDINAL + max(days) <= _MAX_ORDINAL):
+        return None
+    return days
+
+
+def _check_epoch_unit(epoch_unit: Optional[str]) -> bool:
+    if epoch_unit is None or epoch_unit in EPOCH_UNITS:
+        return True
+    print(f"epoch_unit must be one of {', '.join(EPOCH_UNITS)}, got {epoch_unit!r}.")
+    return False
+
+
+def _parse_iso(value: str) -> Date:
+    if value[4:5] != "-":
+        raise ValueError(value)
+    return datetime.fromisoformat(value).date()
+
+
+def _parse_dotted(value: str) -> Date:
+    if len(value) != 10 or value[2] != "." or value[5] != "." or not value.replace(".", "").isdigit():
+        raise ValueError(value)
+    return Date(int(value[6:]), int(value[3:5]), int(value[:2]))
+
+
+def _parse_slashed(value: str) -> Date:
+    if len(value) != 10 or value[4] != "/" or value[7] != "/" or not value.replace("/", "").isdigit():
+        raise ValueError(value)
+    return Date(int(value[:4]), int(value[5:7]), int(value[8:]))
+
+
+def _parse_compact(value: str) -> Date:
+    if len(value) != 8 or not value.isdigit():
+        raise ValueError(value)
+    return Date(int(value[:4]), int(value[4:6]), int(value[6:]))
+
+
+# Formats accepted in lenient mode, in detection order
+DATE_FORMATS: Dict[str, Callable[[str], Date]] = {
+    "YYYY-MM-DD": _parse_iso,
+    "DD.MM.YYYY": _parse_dotted,
+    "YYYY/MM/DD": _parse_slashed,
+    "YYYYMMDD": _parse_compact,
+}
+
+
+class DateFormatDetector:
+    """Parse a column of date strings in any of the DATE_FORMATS.
+
+    The format that parsed the last value is tried first. Only when it
+    fails are the other formats tried, and the one that succeeds becomes
+    the current format. A homogeneous column therefore costs one parser
+    call per value after the first.
+
+    Args:
+        formats: Names of the accepted formats (default: all DATE_FORMATS)
+
+    Raises:
+        ValueError: If a format name is unknown
+
+    Example:
+        >>> detector = DateFormatDetector()
+        >>> detector.parse("08.02.2026"), detector.current
+        (datetime.date(2026, 2, 8), 'DD.MM.YYYY')
+    """
+
+    __slots__ = ("formats", "current", "detections")
+
+    def __init__(self, formats: Optional[Iterable[str]] = None) -> None:
+        self.formats = tuple(DATE_FORMATS if formats is None else formats)
+        unknown = [name for name in self.formats if name not in DATE_FORMATS]
+        if unknown or not self.formats:
+            raise ValueError(f"formats must be names from {', '.join(DATE_FORMATS)}, got {unknown}.")
+        self.current: Optional[str] = None
+        # Number of times the current format changed
+        self.detections = 0
+
+    def parse(self, value: str) -> Optional[Date]:
+        """Parse *value*, switching format if the current one fails.
+
+        Returns:
+            date object, or None if no accepted format matches (not reported)
+        """
+        if self.current is not None:
+            try:
+                return DATE_FORMATS[self.current](value)
+            except ValueError:
+                pass
+
+        for name in self.formats:
+            if name == self.current:
+                continue
+            try:
+                parsed = DATE_FORMATS[name](value)
+            except ValueError:
+                continue
+            self.current = name
+            self.detections += 1
+            return parsed
+        return None
+
+
+def _parse_lenient(value: str, detector: DateFormatDetector) -> Optional[Date]:
+    """Parse *value* with *detector*, reporting values in no known format."""
+    parsed = detector.parse(value)
+    if parsed is None:
+        print(f"Cannot parse the date. Supported formats: {', '.join(detector.formats)}")
+    return parsed
+
+
+def get_days_from_today(
+    date: Any, *, validate: bool = True, epoch_unit: Optional[str] = None
+) -> Optional[int]:
     """Calculate the difference in days between a given date and today.
 
     Compares only the date portion (ignoring time) of the input against
@@ -11,7 +225,14 @@ def get_days_from_today(date: str) -> Optional[int]:
     Args:
         date: A date string in ISO 8601 format (``YYYY-MM-DD``).
               Time components (e.g. ``2025-01-15T14:30:00``) are accepted
-              but ignored for the calculation.
+              but ignored for the calculation. ``date``, ``datetime``
+              and NumPy ``datetime64`` values are used directly, without
+              a format/parse round trip.
+        validate: Check the argument type and emptiness first. Pass
+                  ``False`` for trusted bulk input; unparseable values
+                  are still reported.
+        epoch_unit: Accept integers as Unix epoch 'seconds' or 'days'
+                    (dates in UTC). Integers are rejected when None.
 
     Returns:
         The number of days from today to *date*.
@@ -21,21 +242,205 @@ def get_days_from_today(date: str) -> Optional[int]:
 
     """
     if not isinstance(date, str):
-        print(f"Expected a string, got {type(date).__name__}.")
-        return None
+        if not _check_epoch_unit(epoch_unit):
+            return None
+        ordinal = _native_ordinal(date, epoch_unit)
+        if ordinal is None:
+            return None
+        return ordinal - datetime.now().date().toordinal()
 
-    if not date.strip():
-        print("Date string is empty.")
-        return None
+    if validate:
+        error = _check_args(date)
+        if error:
+            print(error.message)
+            return None
 
-    try:
-        input_date = datetime.fromisoformat(date).date()
-    except (ValueError, TypeError):
-        print(
-            "Cannot parse the date. "
-            "Please use a valid ISO 8601 format: YYYY-MM-DD"
-        )
+    input_date = _parse_date(date)
+    if input_date is None:
         return None
 
     return (input_date - datetime.now().date()).days
 
+
+def get_days_from_today_many(
+    dates: Iterable[Any],
+    *,
+    validate: bool = True,
+    epoch_unit: Optional[str] = None,
+    lenient: bool = False,
+    today: Optional[Date] = None,
+) -> List[Optional[int]]:
+    """Calculate day differences for many dates at once.
+
+    Accepts the same values as :func:`get_days_from_today`, in any mix.
+    Today is read once, each distinct string is parsed once, and a NumPy
+    ``datetime64`` (or, with *epoch_unit*, integer) array is converted as
+    a whole.
+
+    Args:
+        dates: Iterable of date values, or a NumPy array
+        validate: Check string arguments first (see get_days_from_today)
+        epoch_unit: Unit of integer input ('seconds' or 'days'), or None
+        lenient: Also accept strings in the other DATE_FORMATS. The
+                 format is detected from the first string and re-detected
+                 only when a value does not match it (see
+                 :class:`DateFormatDetector`).
+        today: Reference date (default: the current local date), e.g. to
+               share one date across the batches of a run
+
+    Returns:
+        Day differences in input order; None for invalid values (reported)
+    """
+    if not _check_epoch_unit(epoch_unit):
+        return []
+
+    today = (today or datetime.now().date()).toordinal()
+
+    kind = getattr(getattr(dates, "dtype", None), "kind", None)
+    if kind == "M" or (kind in ("i", "u") and epoch_unit is not None):
+        days = _array_epoch_days(dates, kind, epoch_unit)
+        if days is not None:
+            offset = _EPOCH_ORDINAL - today
+            return [day + offset for day in days]
+
+    detector = DateFormatDetector() if lenient else None
+
+    # Only valid strings are memoized; invalid ones are reported every time
+    memo: Dict[str, int] = {}
+    results: List[Optional[int]] = []
+    for value in dates:
+        days = memo.get(value) if isinstance(value, str) else None
+        if days is None:
+            if isinstance(value, str):
+                error = _check_args(value) if validate else None
+                if error:
+                    print(error.message)
+                    ordinal = None
+                else:
+                    parsed = _parse_date(value) if detector is None else _parse_lenient(value, detector)
+                    ordinal = None if parsed is None else parsed.toordinal()
+            else:
+                ordinal = _native_ordinal(value, epoch_unit)
+
+            if ordinal is not None:
+                days = ordinal - today
+                if isinstance(value, str):
+                    if len(memo) >= _MEMO_SIZE:
+                        memo.clear()
+                    memo[value] = days
+        results.append(days)
+    return results
+
+
+def _bucket_index(days: int) -> int:
+    return bisect_right(_BUCKET_STARTS, days)
+
+
+def get_days_histogram(
+    dates: Iterable[Any],
+    *,
+    validate: bool = True,
+    cache: Optional["PersistentCache"] = None,
+    epoch_unit: Optional[str] = None,
+) -> Dict[str, int]:
+    """Count dates per age bucket relative to today, without per-date results.
+
+    Dates are consumed as a stream. Each distinct string is parsed once per
+    call (or looked up in *cache* in chunks), and only the bucket counters
+    are kept.
+
+    Args:
+        dates: Date values as accepted by :func:`get_days_from_today`, in
+               any mix of strings and native values
+        validate: Check string arguments first (see get_days_from_today).
+                  Values read through *cache* are always checked.
+        cache: Optional :class:`tasks.cache.PersistentCache` to reuse
+               parsed date strings across runs. Invalid strings are then
+               reported only when first parsed.
+        epoch_unit: Unit of integer input ('seconds' or 'days'), or None
+
+    Returns:
+        Dictionary with a count for every bucket in HISTOGRAM_BUCKETS:
+        - 'older': more than 7 days ago
+        - 'overdue': 1 to 7 days ago
+        - 'today': today
+        - 'this_week': 1 to 7 days ahead
+        - 'later': more than 7 days ahead
+        - 'invalid': values that cannot be parsed (each is reported)
+
+        Returns an empty dictionary if epoch_unit is invalid.
+
+    """
+    if not _check_epoch_unit(epoch_unit):
+        return {}
+
+    counts = [0] * len(HISTOGRAM_BUCKETS)
+    today = datetime.now().date().toordinal()
+
+    def count_native(value: Any) -> None:
+        ordinal = _native_ordinal(value, epoch_unit)
+        if ordinal is None:
+            counts[_INVALID_BUCKET] += 1
+        else:
+            counts[_bucket_index(ordinal - today)] += 1
+
+    if cache is not None:
+        from tasks.cache import cached_parse_dates
+
+        dates = iter(dates)
+        chunk = list(islice(dates, _CACHE_CHUNK_SIZE))
+        while chunk:
+            strings = []
+            for value in chunk:
+                if isinstance(value, str):
+                    strings.append(value)
+                else:
+                    count_native(value)
+            for parsed in cached_parse_dates(strings, cache):
+                if parsed is None:
+                    counts[_INVALID_BUCKET] += 1
+                else:
+                    counts[_bucket_index(parsed.toordinal() - today)] += 1
+            chunk = list(islice(dates, _CACHE_CHUNK_SIZE))
+        return dict(zip(HISTOGRAM_BUCKETS, counts))
+
+    # Only valid strings are memoized; invalid ones are reported every time
+    memo: Dict[str, int] = {}
+    for value in dates:
+        if not isinstance(value, str):
+            count_native(value)
+            continue
+        index = memo.get(value)
+        if index is None:
+            error = _check_args(value) if validate else None
+            if error:
+                print(error.message)
+                parsed = None
+            else:
+                parsed = _parse_date(value)
+            if parsed is None:
+                counts[_INVALID_BUCKET] += 1
+                continue
+            index = _bucket_index(parsed.toordinal() - today)
+            if len(memo) >= _MEMO_SIZE:
+                memo.clear()
+            memo[value] = index
+        counts[index] += 1
+
+    return dict(zip(HISTOGRAM_BUCKETS, counts))
+
+
+def merge_days_histograms(histograms: Iterable[Dict[str, int]]) -> Dict[str, int]:
+    """Combine partial histograms, e.g. from parallel workers.
+
+    Args:
+        histograms: Results of :func:`get_days_histogram`
+
+    Returns:
+        Dictionary with the summed count for every bucket
+    """
+    merged = dict.fromkeys(HISTOGRAM_BUCKETS, 0)
+    for histogram in histograms:
+        for bucket, count in histogram.items():
+            merged[bucket] += count
+    return merged
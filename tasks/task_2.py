@@ -1,8 +1,73 @@
 import random
-from typing import List
+from bisect import bisect_left
+from functools import lru_cache
+from math import comb
+from typing import Iterable, List, Optional, Sequence, Tuple
 
+from tasks.validation import Field, compile_schema
 
-def get_numbers_ticket(min: int, max: int, quantity: int) -> List[int]:
+# Baseline wording of get_numbers_ticket; every boolean and type check runs
+# before the range checks
+_PARAMETER_MESSAGES = {
+    "bool": "Boolean parameters are not allowed.",
+    "type": "All parameters must be integers.",
+}
+_check_args = compile_schema(
+    Field("min", int, min_value=1, messages={**_PARAMETER_MESSAGES, "min": "Parameter 'min' must be >= 1."}),
+    Field(
+        "max", int, max_value=1000,
+        messages={**_PARAMETER_MESSAGES, "max": "Parameter 'max' should be <= 1000 for practical lottery use."},
+    ),
+    Field("quantity", int, messages=_PARAMETER_MESSAGES),
+)
+
+
+def _ticket_args_error(min: int, max: int, quantity: int) -> Optional[str]:
+    """Check lottery arguments against the get_numbers_ticket rules.
+
+    Args:
+        min: Minimum value in the range
+        max: Maximum value in the range
+        quantity: Numbers per ticket
+
+    Returns:
+        Error message of the first failing rule, or None if valid
+    """
+    error = _check_args(min, max, quantity)
+    if error:
+        return error.message
+
+    if max <= min:
+        return "Parameter 'max' must be > parameter 'min'."
+
+    if quantity < 1:
+        return "Parameter 'quantity' must be >= 1."
+
+    # Validate quantity doesn't exceed available range
+    available_numbers = max - min + 1
+    if quantity > available_numbers:
+        return (
+            f"Quantity ({quantity}) must be <= available range "
+            f"({available_numbers} numbers from {min} to {max})."
+        )
+
+    return None
+
+
+def _validate_ticket_args(min: int, max: int, quantity: int) -> bool:
+    """Check lottery arguments, printing the first error.
+
+    Returns:
+        True if valid, False otherwise (the error is printed)
+    """
+    error = _ticket_args_error(min, max, quantity)
+    if error:
+        print(f"Error: {error}")
+        return False
+    return True
+
+
+def get_numbers_ticket(min: int, max: int, quantity: int, *, validate: bool = True) -> List[int]:
     """Generate a sorted list of unique random numbers for a lottery ticket.
 
     Selects a specified quantity of unique random numbers within a given range
@@ -13,6 +78,8 @@ def get_numbers_ticket(min: int, max: int, quantity: int) -> List[int]:
         max: The maximum value in the range (must be > min and <= 1000).
         quantity: The number of random numbers to select (must be >= 1
                   and <= available range size).
+        validate: Check the arguments first. Pass ``False`` for trusted
+                  bulk input that is known to satisfy the rules below.
 
     Returns:
         A sorted list of unique random integers. Returns an empty list
@@ -27,46 +94,268 @@ def get_numbers_ticket(min: int, max: int, quantity: int) -> List[int]:
         - All parameters must be integers
 
     """
-    # Validate input types (reject booleans even though they're subclass of int)
-    if any(isinstance(param, bool) for param in [min, max, quantity]):
-        print("Error: Boolean parameters are not allowed.")
+    if validate and not _validate_ticket_args(min, max, quantity):
         return []
 
-    if not all(isinstance(param, int) for param in [min, max, quantity]):
-        print("Error: All parameters must be integers.")
-        return []
+    # Generate random selection
+    variants = list(range(min, max + 1))
+    selection = random.sample(variants, quantity)
+    selection.sort()
+    return selection
 
-    # Validate minimum value
-    if min < 1:
-        print("Error: Parameter 'min' must be >= 1.")
-        return []
 
-    # Validate maximum value
-    if max > 1000:
-        print("Error: Parameter 'max' should be <= 1000 for practical lottery use.")
+# Largest precomputed binomial table, in entries; bigger ranges use math.comb
+_TABLE_LIMIT = 1 << 16
+
+
+class _BinomialRow:
+    """Row ``m -> C(m, j)`` of a binomial table, computed on access."""
+
+    __slots__ = ("j",)
+
+    def __init__(self, j: int) -> None:
+        self.j = j
+
+    def __getitem__(self, m: int) -> int:
+        return comb(m, self.j)
+
+
+@lru_cache(maxsize=8)
+def _binomial_table(n: int, k: int) -> Tuple[Sequence[int], ...]:
+    """Binomial coefficients for ranking k-of-n combinations.
+
+    Small tables are precomputed and cached. Tables over _TABLE_LIMIT
+    entries (e.g. 500 of 1000 numbers, where the entries are large
+    integers) are made of rows that compute each value on access.
+
+    Args:
+        n: Range size
+        k: Numbers per ticket
+
+    Returns:
+        Table where ``table[j][m]`` is C(m, j) for 0 <= j <= k, 0 <= m <= n.
+        Each row is non-decreasing in m, which allows binary search.
+    """
+    if (k + 1) * (n + 1) > _TABLE_LIMIT:
+        return tuple(_BinomialRow(j) for j in range(k + 1))
+
+    table = [[1] * (n + 1)]
+    for j in range(1, k + 1):
+        previous = table[-1]
+        row = [0] * (n + 1)
+        for m in range(1, n + 1):
+            # Pascal's rule: C(m, j) = C(m - 1, j) + C(m - 1, j - 1)
+            row[m] = row[m - 1] + previous[m - 1]
+        table.append(row)
+    return tuple(tuple(row) for row in table)
+
+
+def ticket_count(min: int, max: int, quantity: int) -> Optional[int]:
+    """Return how many distinct tickets exist: C(max - min + 1, quantity).
+
+    Args:
+        min: The minimum value in the range.
+        max: The maximum value in the range.
+        quantity: The number of numbers per ticket.
+
+    Returns:
+        Number of combinations, or None if validation fails (same rules
+        as :func:`get_numbers_ticket`).
+
+    """
+    if not _validate_ticket_args(min, max, quantity):
+        return None
+    return comb(max - min + 1, quantity)
+
+
+def _rank(ticket: Sequence[int], min: int, n: int, table) -> int:
+    """Lexicographic rank of a sorted, validated ticket."""
+    k = len(ticket)
+    rank = 0
+    previous = -1
+    for i, number in enumerate(ticket):
+        row = table[k - i]
+        # Tickets starting with a smaller number at position i:
+        # sum of C(n - 1 - v, k - 1 - i) for previous < v < x (hockey stick)
+        x = number - min
+        rank += row[n - previous - 1] - row[n - x]
+        previous = x
+    return rank
+
+
+def _unrank(rank: int, min: int, n: int, k: int, table) -> List[int]:
+    """Ticket with the given lexicographic rank (rank already validated)."""
+    ticket = []
+    previous = -1
+    for i in range(k):
+        row = table[k - i]
+        # Largest x with row[n - previous - 1] - row[n - x] <= rank, i.e. the
+        # smallest m = n - x with row[m] >= row[n - previous - 1] - rank
+        m = bisect_left(row, row[n - previous - 1] - rank, 0, n - previous)
+        x = n - m
+        rank -= row[n - previous - 1] - row[m]
+        ticket.append(x + min)
+        previous = x
+    return ticket
+
+
+def _ticket_error(ticket, min: int, max: int) -> Optional[str]:
+    """Describe why *ticket* is not a valid ticket, or return None."""
+    if not isinstance(ticket, (list, tuple)):
+        return f"ticket must be a list or tuple, got {type(ticket).__name__}."
+    if not all(isinstance(number, int) and not isinstance(number, bool) for number in ticket):
+        return "ticket numbers must be integers."
+    if any(number < min or number > max for number in ticket):
+        return f"ticket numbers must be between {min} and {max}."
+    if len(set(ticket)) != len(ticket):
+        return "ticket numbers must be unique."
+    return None
+
+
+def rank_ticket(ticket: Sequence[int], min: int, max: int) -> Optional[int]:
+    """Return the lexicographic rank of a ticket among all possible tickets.
+
+    Tickets of ``len(ticket)`` numbers from [min, max] are ordered
+    lexicographically (as sorted lists) and numbered from 0 to
+    ``ticket_count(min, max, len(ticket)) - 1``, so a ticket can be stored,
+    sharded or compared as a single integer.
+
+    Args:
+        ticket: Unique numbers from [min, max], in any order.
+        min: The minimum value in the range.
+        max: The maximum value in the range.
+
+    Returns:
+        The rank, or None if validation fails.
+
+    Example:
+        >>> rank_ticket([1, 2, 3], 1, 49)
+        0
+
+    """
+    if not _validate_ticket_args(min, max, 1):
+        return None
+    error = _ticket_error(ticket, min, max)
+    if error:
+        print(f"Error: {error}")
+        return None
+    if not _validate_ticket_args(min, max, len(ticket)):
+        return None
+
+    n = max - min + 1
+    return _rank(sorted(ticket), min, n, _binomial_table(n, len(ticket)))
+
+
+def unrank_ticket(rank: int, min: int, max: int, quantity: int) -> List[int]:
+    """Return the ticket with the given lexicographic rank.
+
+    Inverse of :func:`rank_ticket`. Sampling a uniform random ticket is
+    ``unrank_ticket(random_ticket_rank(min, max, quantity), min, max, quantity)``.
+
+    Args:
+        rank: Integer in [0, ticket_count(min, max, quantity)).
+        min: The minimum value in the range.
+        max: The maximum value in the range.
+        quantity: The number of numbers per ticket.
+
+    Returns:
+        Sorted list of numbers, or an empty list if validation fails.
+
+    """
+    if not _validate_ticket_args(min, max, quantity):
         return []
 
-    # Validate max > min
-    if max <= min:
-        print("Error: Parameter 'max' must be > parameter 'min'.")
+    n = max - min + 1
+    table = _binomial_table(n, quantity)
+    total = table[quantity][n]
+    if not isinstance(rank, int) or isinstance(rank, bool) or not 0 <= rank < total:
+        print(f"Error: rank must be an integer in [0, {total}).")
         return []
 
-    # Validate quantity
-    if quantity < 1:
-        print("Error: Parameter 'quantity' must be >= 1.")
+    return _unrank(rank, min, n, quantity, table)
+
+
+def random_ticket_rank(min: int, max: int, quantity: int) -> Optional[int]:
+    """Draw the rank of a uniformly random ticket.
+
+    Args:
+        min: The minimum value in the range.
+        max: The maximum value in the range.
+        quantity: The number of numbers per ticket.
+
+    Returns:
+        A random rank, or None if validation fails.
+
+    """
+    total = ticket_count(min, max, quantity)
+    if total is None:
+        return None
+    return random.randrange(total)
+
+
+def rank_tickets(tickets: Iterable[Sequence[int]], min: int, max: int) -> List[Optional[int]]:
+    """Rank many tickets of the same range (see :func:`rank_ticket`).
+
+    Args:
+        tickets: Tickets with unique numbers from [min, max].
+        min: The minimum value in the range.
+        max: The maximum value in the range.
+
+    Returns:
+        Ranks in input order; None for invalid tickets (reported), or an
+        empty list if the range is invalid.
+
+    """
+    # Check the range once; ticket sizes are checked per distinct quantity
+    if not _validate_ticket_args(min, max, 1):
         return []
 
-    # Validate quantity doesn't exceed available range
-    available_numbers = max - min + 1
-    if quantity > available_numbers:
-        print(
-            f"Error: Quantity ({quantity}) must be <= available range "
-            f"({available_numbers} numbers from {min} to {max})."
-        )
+    n = max - min + 1
+    tables = {}
+    ranks: List[Optional[int]] = []
+    for ticket in tickets:
+        error = _ticket_error(ticket, min, max)
+        if error:
+            print(f"Error: {error}")
+            ranks.append(None)
+            continue
+
+        quantity = len(ticket)
+        if quantity not in tables:
+            valid = _validate_ticket_args(min, max, quantity)
+            tables[quantity] = _binomial_table(n, quantity) if valid else None
+        table = tables[quantity]
+        ranks.append(_rank(sorted(ticket), min, n, table) if table else None)
+    return ranks
+
+
+def unrank_tickets(
+    ranks: Iterable[int], min: int, max: int, quantity: int
+) -> List[List[int]]:
+    """Unrank many ranks of the same range (see :func:`unrank_ticket`).
+
+    Args:
+        ranks: Integers in [0, ticket_count(min, max, quantity)).
+        min: The minimum value in the range.
+        max: The maximum value in the range.
+        quantity: The number of numbers per ticket.
+
+    Returns:
+        Tickets in input order; an empty list for each invalid rank
+        (reported), or an empty result if the range is invalid.
+
+    """
+    if not _validate_ticket_args(min, max, quantity):
         return []
 
-    # Generate random selection
-    variants = list(range(min, max + 1))
-    selection = random.sample(variants, quantity)
-    selection.sort()
-    return selection
+    n = max - min + 1
+    table = _binomial_table(n, quantity)
+    total = table[quantity][n]
+    tickets = []
+    for rank in ranks:
+        if not isinstance(rank, int) or isinstance(rank, bool) or not 0 <= rank < total:
+            print(f"Error: rank must be an integer in [0, {total}).")
+            tickets.append([])
+        else:
+            tickets.append(_unrank(rank, min, n, quantity, table))
+    return tickets
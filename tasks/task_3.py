@@ -1,8 +1,33 @@
 import re
-from typing import Optional
+from array import array
+from typing import Iterable, List, Optional, Tuple
 
+from tasks.validation import Field, compile_schema
 
-def normalize_phone(phone_number: str, country_code: int = 38) -> Optional[str]:
+_COUNTRY_CODE = Field("country_code", int, min_value=1, messages={"min": "{name} must be a positive integer."})
+# Emptiness of phone_number is checked after country_code, as before the schemas
+_check_args = compile_schema(Field("phone_number", str), _COUNTRY_CODE)
+_check_country_code = compile_schema(_COUNTRY_CODE)
+
+# Bump when normalization rules change: invalidates tasks.cache entries
+CACHE_VERSION = 1
+
+# Every byte except ASCII digits and the newline separator
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not (48 <= b <= 57 or b == 10))
+
+# Bytes read per block in normalize_phone_file (extended to a line end)
+_BLOCK_SIZE = 1 << 20
+
+# Packed phone layout: (digits value << 5) | digit count. 17 digits keep the
+# value below 2**57, so the packed number fits an unsigned 64-bit integer.
+_COUNT_BITS = 5
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
+_MAX_PACKED_DIGITS = 17
+
+
+def normalize_phone(
+    phone_number: str, country_code: int = 38, *, validate: bool = True
+) -> Optional[str]:
     """Normalize a phone number to international format.
 
     Takes a phone number in various formats and normalizes it to
@@ -17,6 +42,8 @@ def normalize_phone(phone_number: str, country_code: int = 38) -> Optional[str]:
         phone_number: The phone number to normalize.
         country_code: The country code to use (default: 38).
                       Should be a positive integer, without the '+' prefix.
+        validate: Check argument types and values first. Pass ``False``
+                  for trusted bulk input; the length rule still applies.
 
     Returns:
         Normalized phone number in format +[country_code][digits], or None
@@ -38,31 +65,20 @@ def normalize_phone(phone_number: str, country_code: int = 38) -> Optional[str]:
         This is intentional behavior for handling malformed inputs, not international conversion.
 
     """
-    # Validate input types
-    if not isinstance(phone_number, str):
-        print(f"Error: phone_number must be a string, got {type(phone_number).__name__}.")
-        return None
-
-    if not isinstance(country_code, int) or isinstance(country_code, bool):
-        print(f"Error: country_code must be an integer, got {type(country_code).__name__}.")
-        return None
-
-    # Validate country code value
-    if country_code <= 0:
-        print("Error: country_code must be a positive integer.")
-        return None
+    if validate:
+        error = _check_args(phone_number, country_code)
+        if error:
+            print(f"Error: {error.message}")
+            return None
+        if not phone_number.strip():
+            print("Error: phone_number cannot be empty or whitespace-only.")
+            return None
 
     # Convert country_code to string for string operations
     country_code_str = str(country_code)
 
-    # Strip whitespace and extract only digits
-    phone = phone_number.strip()
-    if not phone:
-        print("Error: phone_number cannot be empty or whitespace-only.")
-        return None
-
     # Extract all digits from the phone number
-    digits_only = re.sub(r"\D", "", phone)
+    digits_only = re.sub(r"\D", "", phone_number)
 
     # Ensure country code is at the start
     if not digits_only.startswith(country_code_str):
@@ -75,4 +91,208 @@ def normalize_phone(phone_number: str, country_code: int = 38) -> Optional[str]:
         return None
 
     # Return normalized number with '+' prefix
-    return "+" + digits_only
\ No newline at end of file
+    return "+" + digits_only
+
+
+def normalize_phone_file(
+    input_path: str, output_path: str, country_code: int = 38
+) -> Optional[Tuple[int, int]]:
+    """Normalize a file of phone numbers (one per line) at the bytes level.
+
+    Bulk counterpart of :func:`normalize_phone` for large dumps. The input
+    is memory-mapped and processed in blocks of whole lines: non-digits are
+    stripped from a block with a single ``bytes.translate`` call, without
+    decoding to ``str`` or using regular expressions, and the country-code
+    and length rules are then applied per line.
+
+    Args:
+        input_path: Text file with one phone number per line (any
+                    ASCII-compatible encoding, LF or CRLF line endings).
+        output_path: File to write normalized numbers to.
+        country_code: The country code to use (default: 38).
+
+    Returns:
+        (valid, invalid) line counts, or None if validation fails, a
+        file cannot be opened or output_path is the input file.
+        Output line N holds the normalized form of input line N, or is
+        empty if that line is not a valid phone number.
+
+    Note:
+        Only ASCII digits are recognised, whereas :func:`normalize_phone`
+        also keeps other Unicode decimal digits. Invalid lines are counted
+        rather than reported one by one.
+
+    """
+    import mmap
+    import os
+
+    error = _check_country_code(country_code)
+    if error:
+        print(f"Error: {error.message}")
+        return None
+
+    country_code_bytes = str(country_code).encode("ascii")
+    min_length = len(country_code_bytes) + 9
+    valid = invalid = 0
+
+    try:
+        source = open(input_path, "rb")
+    except OSError as os_error:
+        print(f"Error: Cannot open '{input_path}': {os_error.strerror}.")
+        return None
+
+    # Opening the output truncates it, so it must not be the input
+    try:
+        same_file = os.path.samefile(input_path, output_path)
+    except OSError:
+        same_file = False
+    if same_file:
+        source.close()
+        print(f"Error: Output '{output_path}' is the same file as input '{input_path}'.")
+        return None
+
+    try:
+        target = open(output_path, "wb")
+    except OSError as os_error:
+        source.close()
+        print(f"Error: Cannot open '{output_path}': {os_error.strerror}.")
+        return None
+
+    with source, target:
+        size = os.fstat(source.fileno()).st_size
+        if size == 0:
+            return 0, 0
+
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            position = 0
+            while position < size:
+                # Extend the block to the end of the line it stops in
+                end = mapped.find(b"\n", min(position + _BLOCK_SIZE, size) - 1)
+                end = size if end == -1 else end + 1
+                digits_block = mapped[position:end].translate(None, _NON_DIGIT_BYTES)
+                position = end
+
+                lines = digits_block.split(b"\n")
+                if digits_block.endswith(b"\n"):
+                    lines.pop()
+
+                output = []
+                for digits in lines:
+                    if not digits.startswith(country_code_bytes):
+                        digits = country_code_bytes + digits
+                    if len(digits) < min_length:
+                        invalid += 1
+                        output.append(b"")
+                    else:
+                        valid += 1
+                        output.append(b"+" + digits)
+
+                output.append(b"")  # Trailing newline
+                target.write(b"\n".join(output))
+
+    return valid, invalid
+
+
+def encode_phone(phone: str) -> Optional[int]:
+    """Pack a normalized phone number into a 64-bit integer.
+
+    A number such as ``"+380501234567"`` takes about 60 bytes as a Python
+    string but fits one unsigned 64-bit slot as (digits value, digit count),
+    so leading zeros survive the round trip.
+
+    Args:
+        phone: Normalized number: '+' followed by 1-17 ASCII digits, as
+               returned by :func:`normalize_phone`.
+
+    Returns:
+        Positive packed integer, or None if *phone* is not a normalized
+        number.
+
+    """
+    if not isinstance(phone, str):
+        print(f"Error: phone must be a string, got {type(phone).__name__}.")
+        return None
+
+    digits = phone[1:]
+    if (
+        not phone.startswith("+")
+        or not 1 <= len(digits) <= _MAX_PACKED_DIGITS
+        or not (digits.isascii() and digits.isdigit())
+    ):
+        print(f"Error: '{phone}' is not a normalized phone number (+ and 1-17 digits).")
+        return None
+
+    return int(digits) << _COUNT_BITS | len(digits)
+
+
+def decode_phone(value: int) -> Optional[str]:
+    """Unpack an integer produced by :func:`encode_phone`.
+
+    Args:
+        value: Packed phone number.
+
+    Returns:
+        The normalized number (``"+..."``), or None if *value* is not a
+        valid packed number.
+
+    """
+    if not isinstance(value, int) or isinstance(value, bool):
+        print(f"Error: value must be an integer, got {type(value).__name__}.")
+        return None
+
+    count = value & _COUNT_MASK
+    number = value >> _COUNT_BITS
+    if value < 1 or not 1 <= count <= _MAX_PACKED_DIGITS or number >= 10 ** count:
+        print(f"Error: {value} is not a packed phone number.")
+        return None
+
+    return "+" + str(number).zfill(count)
+
+
+def encode_phones(phones: Iterable[str]) -> "array[int]":
+    """Pack many normalized numbers into an ``array('Q')``.
+
+    Args:
+        phones: Normalized phone numbers.
+
+    Returns:
+        Array of packed numbers in input order (8 bytes each). Invalid
+        entries are stored as 0, which no valid number encodes to, and are
+        not reported individually.
+
+    """
+    def pack(phone) -> int:
+        if phone.__class__ is not str or phone[:1] != "+":
+            return 0
+        digits = phone[1:]
+        if not 1 <= len(digits) <= _MAX_PACKED_DIGITS or not (digits.isascii() and digits.isdigit()):
+            return 0
+        return int(digits) << _COUNT_BITS | len(digits)
+
+    return array("Q", map(pack, phones))
+
+
+def decode_phones(values: Iterable[int]) -> List[Optional[str]]:
+    """Unpack many numbers produced by :func:`encode_phones`.
+
+    Args:
+        values: Packed numbers, e.g. an ``array('Q')``.
+
+    Returns:
+        Normalized numbers in input order; None for 0, negative and
+        non-integer items and other invalid values (not reported
+        individually).
+
+    """
+    decoded: List[Optional[str]] = []
+    for value in values:
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            decoded.append(None)
+            continue
+        count = value & _COUNT_MASK
+        number = value >> _COUNT_BITS
+        if 1 <= count <= _MAX_PACKED_DIGITS and number < 10 ** count:
+            decoded.append("+" + str(number).zfill(count))
+        else:
+            decoded.append(None)
+    return decoded
@@ -1,5 +1,103 @@
+from collections.abc import Mapping
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from tasks.validation import Field, ValidationError, compile_schema
+
+
+# Bump when birthday parsing rules change: invalidates tasks.cache entries
+CACHE_VERSION = 1
+
+
+class _Record(Mapping):
+    """Compact read-only record with a dict-compatible view.
+
+    Subclasses list their fields in ``__slots__``, so an instance stores
+    only the field references (no per-instance ``__dict__``). Key access,
+    iteration, ``dict(record)`` and ``==`` against dicts work as for the
+    equivalent dictionary.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *values) -> None:
+        if len(values) != len(self.__slots__):
+            raise TypeError(
+                f"{type(self).__name__} takes {len(self.__slots__)} arguments, got {len(values)}."
+            )
+        for field, value in zip(self.__slots__, values):
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, field: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __getitem__(self, key: str):
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, field) for field in self.__slots__)
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return a plain dict copy (e.g. for JSON serialization)."""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class User(_Record):
+    """Compact user record: drop-in for ``{"name": ..., "birthday": ...}``."""
+
+    __slots__ = ("name", "birthday")
+
+
+class Congratulation(_Record):
+    """Compact result record: drop-in for ``{"name": ..., "congratulation_date": ...}``."""
+
+    __slots__ = ("name", "congratulation_date")
+
+
+@lru_cache(maxsize=None)
+def _value_schema(
+    variable_name: str, expected_type: Optional[type] = None
+) -> Callable[[Any], Optional[ValidationError]]:
+    """Compiled check for one field, with the messages of _validate_value.
+
+    As everywhere in tasks.validation, booleans do not pass as integers.
+
+    Args:
+        variable_name: Name of the field (for error messages)
+        expected_type: Expected type of the value, or None for any type
+
+    Returns:
+        Check function returning a ValidationError or None
+    """
+    type_name = expected_type.__name__ if expected_type is not None else "object"
+    return compile_schema(Field(
+        variable_name,
+        expected_type or object,
+        non_empty=True,
+        messages={
+            "type": f"{{name}} must be a {type_name}, got {{type}}.",
+            "empty": "{name} cannot be empty or None.",
+            "blank": "{name} cannot be empty or whitespace.",
+        },
+    ))
+
+
+_check_users = _value_schema("users", list)
+_check_user = _value_schema("user", dict)
+_check_name = _value_schema("name", str)
 
 
 def _validate_value(variable_name: str, value, expected_type=None) -> bool:
@@ -11,27 +109,21 @@ def _validate_value(variable_name: str, value, expected_type=None) -> bool:
         expected_type: Expected type of the value (e.g., str, dict, list)
 
     Returns:
-        True if valid (correct type and truthy), False otherwise
+        True if valid (correct type, truthy and not whitespace-only),
+        False otherwise (the error is printed)
     """
-    # Check type if specified
-    if expected_type is not None:
-        if not isinstance(value, expected_type):
-            print(
-                f"Error: {variable_name} must be a {expected_type.__name__}, "
-                f"got {type(value).__name__}."
-            )
-            return False
+    return _report(_value_schema(variable_name, expected_type)(value))
 
-    # Check if value is truthy (not None, not empty, not whitespace-only string)
-    if not value:
-        print(f"Error: {variable_name} cannot be empty or None.")
-        return False
 
-    # For strings, check if not just whitespace
-    if isinstance(value, str) and not value.strip():
-        print(f"Error: {variable_name} cannot be empty or whitespace.")
-        return False
+def _report(error: Optional[ValidationError]) -> bool:
+    """Print *error* if there is one.
 
+    Returns:
+        True if there was no error
+    """
+    if error:
+        print(f"Error: {error.message}")
+        return False
     return True
 
 
@@ -57,7 +149,266 @@ def _parse_birthday(birthday_str) -> Optional[date]:
         return None
 
 
-def get_upcoming_birthdays(users: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def _format_date(day: date) -> str:
+    """Format a date as 'YYYY.MM.DD'.
+
+    Args:
+        day: Date to format
+
+    Returns:
+        Formatted date string
+    """
+    return day.strftime("%Y.%m.%d")
+
+
+# Output formats for congratulation dates (resolved at call time, so
+# instrumentation wrappers around _format_date are honoured)
+_OUTPUT_FORMATS = {
+    "dotted": lambda day: _format_date(day),
+    "iso": date.isoformat,
+    "date": lambda day: day,
+    "ordinal": date.toordinal,
+}
+
+
+def _validate_output_format(output_format) -> bool:
+    """Check that *output_format* is one of the supported formats.
+
+    Args:
+        output_format: Requested output format
+
+    Returns:
+        True if supported, False otherwise
+    """
+    if not isinstance(output_format, str) or output_format not in _OUTPUT_FORMATS:
+        print(
+            f"Error: output_format must be one of {', '.join(_OUTPUT_FORMATS)}, "
+            f"got {output_format!r}."
+        )
+        return False
+    return True
+
+
+def _birthday_in_year(birthday: date, year: int) -> date:
+    """Return the birthday occurrence in the given year.
+
+    Args:
+        birthday: Birth date
+        year: Year to project the birthday into
+
+    Returns:
+        The birthday in *year*; Feb 29 becomes March 1 in non-leap years
+    """
+    try:
+        return birthday.replace(year=year)
+    except ValueError:
+        # Handle Feb 29 in non-leap years - move to March 1
+        return date(year, 3, 1)
+
+
+def _shift_weekend(day: date) -> date:
+    """Move a Saturday or Sunday to the following Monday.
+
+    Args:
+        day: Date to check
+
+    Returns:
+        The next Monday for weekend dates, *day* itself otherwise
+    """
+    weekday = day.weekday()
+    if weekday == 5:  # Saturday
+        return day + timedelta(days=2)  # Move to Monday
+    if weekday == 6:  # Sunday
+        return day + timedelta(days=1)  # Move to Monday
+    return day
+
+
+def _congratulation_date(birthday: date, today: date) -> Optional[date]:
+    """Calculate the congratulation date for a birthday in the next 7 days.
+
+    Args:
+        birthday: Birth date
+        today: Reference date
+
+    Returns:
+        Congratulation date (weekends moved to Monday), or None if the
+        birthday is not within the next 7 days (including today)
+    """
+    # Calculate birthday for this year
+    birthday_this_year = _birthday_in_year(birthday, today.year)
+
+    # If birthday already passed this year, use next year
+    if birthday_this_year < today:
+        birthday_this_year = _birthday_in_year(birthday, today.year + 1)
+
+    # Check if birthday is within next 7 days
+    if (birthday_this_year - today).days > 6:
+        return None
+
+    return _shift_weekend(birthday_this_year)
+
+
+def _window_month_days(today: date) -> FrozenSet[str]:
+    """Return the 'MM.DD' birthdays that fall in the 7-day window from *today*.
+
+    Feb 29 is included when the window holds March 1 of a non-leap year,
+    matching :func:`_birthday_in_year`.
+
+    Args:
+        today: Reference date
+
+    Returns:
+        Set of 'MM.DD' strings, i.e. ``birthday_str[5:10]`` of qualifying rows
+    """
+    month_days = set()
+    for offset in range(7):
+        day = today + timedelta(days=offset)
+        month_days.add(f"{day.month:02d}.{day.day:02d}")
+        # March 1 right after Feb 28: a non-leap year
+        if day.month == 3 and day.day == 1 and (day - timedelta(days=1)).day == 28:
+            month_days.add("02.29")
+    return frozenset(month_days)
+
+
+def _outside_window(value, window: FrozenSet[str]) -> bool:
+    """Return True if *value* is a canonical 'YYYY.MM.DD' string outside *window*.
+
+    strptime also accepts non-canonical layouts of the same length (e.g. a
+    space-padded day, '2000.01. 5'); those return False and are parsed.
+    """
+    return (
+        value.__class__ is str
+        and len(value) == 10
+        and value[4] == value[7] == "."
+        and value[5:10].isascii()
+        and value[5:7].isdigit()
+        and value[8:10].isdigit()
+        and value[5:10] not in window
+    )
+
+
+def _birthday_str(user) -> Optional[str]:
+    """Birthday field of a record, or None if the record is not well-formed."""
+    if user.__class__ is User:
+        return user.birthday
+    if user.__class__ is dict:
+        birthday_str = user.get("birthday")
+        if birthday_str.__class__ is str:
+            return birthday_str
+    return None
+
+
+def _parse_user(user) -> Optional[Tuple[str, date]]:
+    """Validate a user record and extract its name and birth date.
+
+    Args:
+        user: User dictionary with 'name' and 'birthday' keys, or a User
+
+    Returns:
+        (name, birthday) tuple if valid, None otherwise
+    """
+    if user.__class__ is User:
+        name, birthday_str = user.name, user.birthday
+    else:
+        # Validate user is a dict
+        if not _report(_check_user(user)):
+            return None
+
+        # Check required keys
+        if "name" not in user or "birthday" not in user:
+            print("Error: user dict must have 'name' and 'birthday' keys.")
+            return None
+
+        name, birthday_str = user["name"], user["birthday"]
+
+    # Validate name is non-empty string
+    if not _report(_check_name(name)):
+        return None
+
+    # Parse and validate birthday
+    birthday = _parse_birthday(birthday_str)
+    if not birthday:
+        return None
+
+    return name, birthday
+
+
+def _parse_trusted_user(user) -> Tuple[str, date]:
+    """Extract name and birth date from a record known to be valid.
+
+    Args:
+        user: User dictionary with 'name' and 'birthday' keys, or a User
+
+    Returns:
+        (name, birthday) tuple
+    """
+    if user.__class__ is User:
+        return user.name, datetime.strptime(user.birthday, "%Y.%m.%d").date()
+    return user["name"], datetime.strptime(user["birthday"], "%Y.%m.%d").date()
+
+
+def _iter_upcoming(
+    users: Iterable,
+    today: date,
+    validate: bool = True,
+    as_records: bool = False,
+    output_format: str = "dotted",
+    strict: bool = True,
+) -> Iterator[Dict[str, str]]:
+    """Yield congratulation entries for users with birthdays in range.
+
+    Args:
+        users: Iterable of user dictionaries or User records (invalid
+               entries are skipped)
+        today: Reference date
+        validate: Validate each record; False trusts the input
+        as_records: Yield Congratulation records instead of dicts
+        output_format: Key of _OUTPUT_FORMATS
+        strict: Parse and validate every record. False skips records whose
+                'YYYY.MM.DD' birthday is outside the window, judged by the
+                month and day slice alone
+
+    Yields:
+        Dictionaries (or Congratulation records) with 'name' and
+        'congratulation_date' keys
+    """
+    parse_user = _parse_user if validate else _parse_trusted_user
+    format_date = _OUTPUT_FORMATS[output_format]
+    # At most 9 distinct congratulation dates: format each only once
+    formatted: Dict[date, object] = {}
+    window = None if strict else _window_month_days(today)
+
+    for user in users:
+        if window is not None and _outside_window(_birthday_str(user), window):
+            continue
+
+        parsed = parse_user(user)
+        if not parsed:
+            continue
+
+        name, birthday = parsed
+        congratulation_date = _congratulation_date(birthday, today)
+        if congratulation_date is None:
+            continue
+
+        value = formatted.get(congratulation_date)
+        if value is None:
+            value = formatted[congratulation_date] = format_date(congratulation_date)
+
+        if as_records:
+            yield Congratulation(name, value)
+        else:
+            yield {"name": name, "congratulation_date": value}
+
+
+def get_upcoming_birthdays(
+    users: List[Dict[str, str]],
+    *,
+    validate: bool = True,
+    as_records: bool = False,
+    output_format: str = "dotted",
+    strict: bool = True,
+) -> List[Dict[str, str]]:
     """Get list of users with upcoming birthdays in the next 7 days.
 
     This function identifies colleagues who have birthdays within the next 7 days
@@ -66,14 +417,32 @@ def get_upcoming_birthdays(users: List[Dict[str, str]]) -> List[Dict[str, str]]:
     to the following Monday.
 
     Args:
-        users: List of user dictionaries. Each dictionary must contain:
+        users: List of user dictionaries (or compact :class:`User` records).
+               Each must contain:
                - 'name': User's name (str)
                - 'birthday': Birth date in format 'YYYY.MM.DD' (str)
+        validate: Validate the list and every record. Pass ``False`` for
+                  trusted bulk input: checks are skipped and malformed
+                  records raise instead of being reported and skipped.
+        as_records: Return compact :class:`Congratulation` records instead
+                    of dicts. They compare equal to the equivalent dicts
+                    and support key access.
+        output_format: Type of 'congratulation_date' in the results:
+                       'dotted' ('YYYY.MM.DD' str, default), 'iso'
+                       ('YYYY-MM-DD' str), 'date' (datetime.date) or
+                       'ordinal' (int, date.toordinal()). Bulk callers
+                       can use 'date'/'ordinal' to skip string formatting.
+        strict: Parse and validate every record (default). Pass ``False``
+                to first compare the month and day of each 'YYYY.MM.DD'
+                birthday (``birthday[5:10]``) with the days in the window
+                and fully check only matching records; invalid records
+                outside the window are then skipped without a report.
 
     Returns:
         List of dictionaries with congratulation information. Each contains:
         - 'name': User's name (str)
-        - 'congratulation_date': Date to congratulate in format 'YYYY.MM.DD' (str)
+        - 'congratulation_date': Date to congratulate, by default in format
+          'YYYY.MM.DD' (str)
 
         Returns empty list for invalid inputs or if no birthdays in range.
 
@@ -93,73 +462,405 @@ def get_upcoming_birthdays(users: List[Dict[str, str]]) -> List[Dict[str, str]]:
         - This ensures people born on Feb 29 are still included
 
     """
-    upcoming_birthdays = []
-
     # Validate input type
-    if not _validate_value("users", users, list):
-        return upcoming_birthdays
+    if validate and not _report(_check_users(users)):
+        return []
+
+    if not _validate_output_format(output_format):
+        return []
+
+    today = datetime.today().date()
+
+    return list(_iter_upcoming(users, today, validate, as_records, output_format, strict))
+
+
+def get_upcoming_birthdays_grouped(users: List[Dict[str, str]]) -> Dict[str, List[str]]:
+    """Get upcoming birthdays grouped and ordered by congratulation date.
+
+    Produces the same matches as :func:`get_upcoming_birthdays`, but as a
+    mapping ready for notification batches. Congratulation dates fall at most
+    8 days after today (a birthday 6 days ahead on a Saturday moves to
+    Monday), so users are bucket-sorted by day offset in a single pass
+    instead of sorting the results afterwards.
 
-    # Empty list is valid
-    if not users:
-        return upcoming_birthdays
+    Args:
+        users: List of user dictionaries with 'name' and 'birthday' keys.
+
+    Returns:
+        Dictionary mapping congratulation date ('YYYY.MM.DD') to the list of
+        names to congratulate that day. Keys are in chronological order and
+        names keep their input order. Returns an empty dict for invalid
+        inputs or if no birthdays are in range.
+
+    """
+    if not _report(_check_users(users)):
+        return {}
 
     today = datetime.today().date()
 
+    # One bucket per day offset from today: 6 days + up to 2 weekend days
+    buckets: List[List[str]] = [[] for _ in range(9)]
+
     for user in users:
-        # Validate user is a dict
-        if not _validate_value("user", user, dict):
+        parsed = _parse_user(user)
+        if not parsed:
             continue
 
-        # Check required keys
-        if "name" not in user or "birthday" not in user:
-            print("Error: user dict must have 'name' and 'birthday' keys.")
-            continue
+        name, birthday = parsed
+        congratulation_date = _congratulation_date(birthday, today)
+        if congratulation_date is not None:
+            buckets[(congratulation_date - today).days].append(name)
 
-        name = user["name"]
-        birthday_str = user["birthday"]
+    return {
+        _format_date(today + timedelta(days=offset)): names
+        for offset, names in enumerate(buckets)
+        if names
+    }
 
-        # Validate name is non-empty string
-        if not _validate_value("name", name, str):
-            continue
 
-        # Parse and validate birthday
-        birthday = _parse_birthday(birthday_str)
-        if not birthday:
-            continue
+def get_upcoming_birthdays_tz(
+    users: List[Dict[str, str]], default_timezone: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """Get upcoming birthdays using each user's local "today".
 
-        # Calculate birthday for this year
-        try:
-            birthday_this_year = birthday.replace(year=today.year)
-        except ValueError:
-            # Handle Feb 29 in non-leap years - move to March 1
-            birthday_this_year = date(today.year, 3, 1)
+    Same as :func:`get_upcoming_birthdays`, but a user may carry a
+    'timezone' key with an IANA zone name (e.g. 'Europe/Kyiv'). "Today" is
+    computed once per distinct zone and reused for every user in it, so the
+    cost stays O(users + zones). Zones are resolved with the standard
+    library :mod:`zoneinfo` and the local tz database.
+
+    Args:
+        users: List of user dictionaries with 'name' and 'birthday' keys and
+               an optional 'timezone' key.
+        default_timezone: Zone for users without a 'timezone' key. ``None``
+                          uses the server's local date.
+
+    Returns:
+        List of dictionaries with 'name' and 'congratulation_date' keys, in
+        input order. Returns empty list for invalid inputs.
+
+    Validations:
+        - Same as :func:`get_upcoming_birthdays`
+        - timezone must be a non-empty string naming a known zone; users
+          with an unknown zone are reported and skipped
+        - default_timezone must be None or a known zone name
+
+    """
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    if not _report(_check_users(users)):
+        return []
 
-        # If birthday already passed this year, use next year
-        if birthday_this_year < today:
+    # Zone name -> local "today" (None for unknown zones)
+    todays: Dict[Optional[str], Optional[date]] = {None: datetime.today().date()}
+
+    def today_in(zone_name: Optional[str]) -> Optional[date]:
+        if zone_name not in todays:
             try:
-                birthday_this_year = birthday.replace(year=today.year + 1)
-            except ValueError:
-                # Handle Feb 29 in non-leap years for next year - move to March 1
-                birthday_this_year = date(today.year + 1, 3, 1)
+                todays[zone_name] = datetime.now(ZoneInfo(zone_name)).date()
+            except (ZoneInfoNotFoundError, ValueError):
+                todays[zone_name] = None
+        today = todays[zone_name]
+        if today is None:
+            print(f"Error: Unknown timezone '{zone_name}'.")
+        return today
+
+    if default_timezone is not None:
+        if not _validate_value("default_timezone", default_timezone, str):
+            return []
+        if today_in(default_timezone) is None:
+            return []
 
-        # Calculate days until birthday
-        days_until_birthday = (birthday_this_year - today).days
+    upcoming_birthdays = []
 
-        # Check if birthday is within next 7 days
-        if 0 <= days_until_birthday <= 6:
+    for user in users:
+        parsed = _parse_user(user)
+        if not parsed:
+            continue
 
-            # Check if birthday falls on weekend
-            weekday = birthday_this_year.weekday()
-            if weekday == 5:  # Saturday
-                birthday_this_year += timedelta(days=2)  # Move to Monday
-            elif weekday == 6:  # Sunday
-                birthday_this_year += timedelta(days=1)  # Move to Monday
+        zone_name = user.get("timezone", default_timezone)
+        if zone_name is not None and not _validate_value("timezone", zone_name, str):
+            continue
 
-            # Format date as string
-            congratulation_date_str = birthday_this_year.strftime("%Y.%m.%d")
+        today = today_in(zone_name)
+        if today is None:
+            continue
 
+        name, birthday = parsed
+        congratulation_date = _congratulation_date(birthday, today)
+        if congratulation_date is not None:
             upcoming_birthdays.append(
-                {"name": name, "congratulation_date": congratulation_date_str}
+                {"name": name, "congratulation_date": _format_date(congratulation_date)}
             )
 
     return upcoming_birthdays
+
+
+def _upcoming_shard(users: List[Dict[str, str]], today: date) -> List[Dict[str, str]]:
+    """Evaluate one shard of users (runs inside a pool worker).
+
+    Args:
+        users: Slice of the user list
+        today: Reference date shared by all shards
+
+    Returns:
+        Matches for this shard, in input order
+    """
+    return list(_iter_upcoming(users, today))
+
+
+def get_upcoming_birthdays_sharded(
+    users: List[Dict[str, str]],
+    shards: Optional[int] = None,
+    executor: Optional[str] = None,
+) -> List[Dict[str, str]]:
+    """Get upcoming birthdays by evaluating shards of users in parallel.
+
+    Splits *users* into contiguous shards, evaluates each in a worker pool
+    and concatenates the per-shard results in shard order, so the output is
+    identical to :func:`get_upcoming_birthdays`. "Today" is computed once in
+    the caller and shared by every shard.
+
+    Args:
+        users: List of user dictionaries with 'name' and 'birthday' keys.
+        shards: Number of shards (default: number of CPUs).
+        executor: 'process' or 'thread'. Defaults to threads on free-threaded
+                  builds (GIL disabled) and processes otherwise.
+
+    Returns:
+        List of dictionaries with 'name' and 'congratulation_date' keys.
+        Returns empty list for invalid inputs.
+
+    Validations:
+        - Same as :func:`get_upcoming_birthdays`
+        - shards must be a positive integer (not a boolean)
+        - executor must be None, 'process' or 'thread'
+
+    """
+    import os
+    import sys
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    if not _report(_check_users(users)):
+        return []
+
+    if shards is None:
+        shards = os.cpu_count() or 1
+    if not isinstance(shards, int) or isinstance(shards, bool) or shards < 1:
+        print("Error: shards must be a positive integer.")
+        return []
+
+    if executor is None:
+        gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+        executor = "process" if gil_enabled else "thread"
+    if executor not in ("process", "thread"):
+        print(f"Error: executor must be 'process' or 'thread', got {executor!r}.")
+        return []
+
+    today = datetime.today().date()
+
+    shards = min(shards, len(users))
+    if shards == 1:
+        return _upcoming_shard(users, today)
+
+    shard_size = -(-len(users) // shards)  # Ceiling division
+    chunks = [users[i:i + shard_size] for i in range(0, len(users), shard_size)]
+
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=len(chunks)) as pool:
+        # map() returns results in submission order: deterministic merge
+        shard_results = pool.map(_upcoming_shard, chunks, [today] * len(chunks))
+        return [entry for shard_result in shard_results for entry in shard_result]
+
+
+def iter_upcoming_birthdays(
+    users: Iterable[Dict[str, str]], *, validate: bool = True, output_format: str = "dotted"
+) -> Iterator[Dict[str, str]]:
+    """Lazily yield users with upcoming birthdays in the next 7 days.
+
+    Streaming variant of :func:`get_upcoming_birthdays`: accepts any iterable
+    (lists, generators, lazily parsed CSV/NDJSON readers) and yields each
+    match as soon as it is found, so memory use does not grow with input size.
+
+    Args:
+        users: Iterable of user dictionaries with 'name' and 'birthday' keys.
+        validate: Validate the input and every record; ``False`` trusts it.
+        output_format: 'dotted' (default), 'iso', 'date' or 'ordinal', as
+                       in :func:`get_upcoming_birthdays`.
+
+    Yields:
+        Dictionaries with 'name' and 'congratulation_date' ('YYYY.MM.DD'
+        unless another output_format is requested).
+        Yields nothing if *users* is not an iterable of records.
+
+    Validations:
+        - users must be iterable (strings, bytes and dicts are rejected)
+        - Invalid user records are reported and skipped, as in
+          :func:`get_upcoming_birthdays`
+
+    """
+    if validate and (isinstance(users, (str, bytes, dict)) or not hasattr(users, "__iter__")):
+        print(f"Error: users must be an iterable of dicts, got {type(users).__name__}.")
+        return
+
+    if not _validate_output_format(output_format):
+        return
+
+    today = datetime.today().date()
+
+    yield from _iter_upcoming(users, today, validate, output_format=output_format)
+
+
+def iter_congratulation_dates(
+    users: Iterable[Dict[str, str]], start: date, end: date
+) -> Iterator[Dict[str, str]]:
+    """Yield every congratulation date between *start* and *end*.
+
+    Projects birthdays over an arbitrary date range, e.g. a full planning
+    year or several years. Users are indexed by (month, day) in one pass,
+    then the range is walked day by day, so the cost is O(users + days)
+    instead of re-running :func:`get_upcoming_birthdays` for every day.
+
+    Args:
+        users: Iterable of user dictionaries with 'name' and 'birthday' keys.
+        start: First congratulation date to include.
+        end: Last congratulation date to include.
+
+    Yields:
+        Dictionaries with 'name' and 'congratulation_date' ('YYYY.MM.DD')
+        in chronological order. Users appear once per year in the range.
+
+    Rules (applied per year):
+        - Feb 29 birthdays → March 1 in non-leap years
+        - Saturday/Sunday birthdays → congratulate on the following Monday,
+          so birthdays up to 2 days before *start* can still be included
+
+    """
+    import calendar
+
+    for variable_name, value in (("start", start), ("end", end)):
+        if not isinstance(value, date) or isinstance(value, datetime):
+            print(f"Error: {variable_name} must be a date, got {type(value).__name__}.")
+            return
+
+    if start > end:
+        print("Error: start must not be after end.")
+        return
+
+    if isinstance(users, (str, bytes, dict)) or not hasattr(users, "__iter__"):
+        print(f"Error: users must be an iterable of dicts, got {type(users).__name__}.")
+        return
+
+    # Month-day index: (month, day) -> names, in input order
+    index: Dict[Tuple[int, int], List[str]] = {}
+    for user in users:
+        parsed = _parse_user(user)
+        if parsed:
+            name, birthday = parsed
+            index.setdefault((birthday.month, birthday.day), []).append(name)
+
+    if not index:
+        return
+
+    leap_day_names = index.get((2, 29), [])
+    one_day = timedelta(days=1)
+
+    # Weekend birthdays shift forward by up to 2 days
+    day = start - timedelta(days=2)
+    while day <= end:
+        names = index.get((day.month, day.day), [])
+        if leap_day_names and day.month == 3 and day.day == 1 and not calendar.isleap(day.year):
+            names = names + leap_day_names
+
+        if names:
+            congratulation_date = _shift_weekend(day)
+            if start <= congratulation_date <= end:
+                congratulation_date_str = _format_date(congratulation_date)
+                for name in names:
+                    yield {"name": name, "congratulation_date": congratulation_date_str}
+
+        day += one_day
+
+
+def _read_users(stream, file_format: str) -> Iterator[Dict[str, str]]:
+    """Lazily parse user records from a CSV or NDJSON text stream.
+
+    Args:
+        stream: Open text stream
+        file_format: 'csv' (header row with name,birthday) or 'ndjson'
+
+    Yields:
+        User dictionaries, one per row; malformed NDJSON lines are reported
+        and skipped
+    """
+    if file_format == "csv":
+        import csv
+
+        yield from csv.DictReader(stream)
+        return
+
+    import json
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            print(f"Error: Invalid JSON on line {line_number}.")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point: ``python -m tasks.task_4 FILE``.
+
+    Streams users from a CSV or NDJSON file (or ``-`` for stdin) and writes
+    upcoming birthdays as NDJSON to stdout in constant memory. Validation
+    errors go to stderr.
+
+    Args:
+        argv: Argument list (defaults to ``sys.argv[1:]``)
+
+    Returns:
+        Process exit code
+    """
+    import argparse
+    import contextlib
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tasks.task_4",
+        description="Stream upcoming birthdays from a CSV or NDJSON file.",
+    )
+    parser.add_argument("path", help="input file, or '-' for stdin")
+    parser.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        help="input format (default: detected from file extension, ndjson for stdin)",
+    )
+    args = parser.parse_args(argv)
+
+    file_format = args.format
+    if file_format is None:
+        file_format = "csv" if args.path.lower().endswith(".csv") else "ndjson"
+
+    out = sys.stdout
+    try:
+        stream = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8", newline="")
+    except OSError as error:
+        print(f"Error: Cannot open '{args.path}': {error.strerror}.", file=sys.stderr)
+        return 1
+
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            for entry in iter_upcoming_birthdays(_read_users(stream, file_format)):
+                out.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
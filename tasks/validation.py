@@ -0,0 +1,147 @@
+"""Shared argument validation for the task functions.
+
+A schema is a sequence of :class:`Field` rules. :func:`compile_schema`
+turns it once into a generated check function, so the per-call cost is a
+handful of ``isinstance`` and comparison operations. Errors are returned as
+structured :class:`ValidationError` tuples instead of being printed, and
+the callers decide how to report them.
+
+Checks run in phases, so the reported error does not depend on which field
+is listed first within a phase: booleans given for fields with a 'bool'
+message, then every type check, then emptiness and bounds in field order.
+
+Example:
+    >>> check = compile_schema(Field("min", int, min_value=1))
+    >>> check(0)
+    ValidationError(field='min', code='min', message='min must be >= 1, got 0.')
+"""
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+
+class ValidationError(NamedTuple):
+    """A single validation failure.
+
+    Attributes:
+        field: Name of the invalid argument
+        code: Failure kind: 'type', 'empty', 'min' or 'max'
+        message: Human-readable description
+    """
+
+    field: str
+    code: str
+    message: str
+
+
+class Field(NamedTuple):
+    """Validation rule for one argument.
+
+    Attributes:
+        name: Argument name used in error messages
+        type: Expected type
+        non_empty: Reject falsy values (None, empty strings and
+                   collections) and whitespace-only strings
+        min_value: Inclusive lower bound for numbers
+        max_value: Inclusive upper bound for numbers
+        messages: Message templates by error code ('type', 'empty', 'min',
+                  'max'), replacing the defaults. Templates may use {name},
+                  {type} (name of the given type), {value} and {limit}. A
+                  'bool' template reports a boolean given for an integer
+                  field before any type check runs; a 'blank' template
+                  reports whitespace-only strings (code 'empty') apart
+                  from falsy values.
+    """
+
+    name: str
+    type: type
+    non_empty: bool = False
+    min_value: Optional[int] = None
+    max_value: Optional[int] = None
+    messages: Optional[Mapping[str, str]] = None
+
+
+_TYPE_NAMES = {int: "an integer", str: "a string", list: "a list", dict: "a dict"}
+
+
+_DEFAULT_MESSAGES = {
+    "type": "{name} must be {expected}, got {type}.",
+    "empty": "{name} cannot be empty or whitespace-only.",
+    "min": "{name} must be >= {limit}, got {value}.",
+    "max": "{name} must be <= {limit}, got {value}.",
+}
+
+
+def _field_source(index: int, field: Field) -> Tuple[List[str], List[str], List[str]]:
+    """Generate the boolean, type and value check statements for one field."""
+    name, expected_type, non_empty, min_value, max_value, messages = field
+    value = f"v{index}"
+    type_check = f"not isinstance({value}, T{index})"
+    bool_lines = []
+    # bool is a subclass of int, but never a valid integer argument
+    if expected_type not in (bool, object) and issubclass(bool, expected_type):
+        type_check += f" or {value}.__class__ is bool"
+        if messages and "bool" in messages:
+            bool_lines = [f"    if {value}.__class__ is bool:", f"        return BOOL{index}"]
+
+    type_lines = [f"    if {type_check}:", f"        return type_error({index}, {value})"]
+    value_lines = []
+    if non_empty:
+        value_lines += [f"    if not {value}:", f"        return EMPTY{index}"]
+        if issubclass(expected_type, str):
+            value_lines += [f"    if not {value}.strip():", f"        return BLANK{index}"]
+        elif issubclass(str, expected_type):
+            value_lines += [f"    if isinstance({value}, str) and not {value}.strip():", f"        return BLANK{index}"]
+    if min_value is not None:
+        value_lines += [f"    if {value} < {min_value!r}:", f"        return bound_error({index}, 'min', {value})"]
+    if max_value is not None:
+        value_lines += [f"    if {value} > {max_value!r}:", f"        return bound_error({index}, 'max', {value})"]
+    return bool_lines, type_lines, value_lines
+
+
+def compile_schema(*fields: Field) -> Callable[..., Optional[ValidationError]]:
+    """Compile field rules into a single check function.
+
+    The rules are turned into straight-line Python source once, so a call
+    runs only the checks the schema needs, with no loops or option lookups.
+
+    Args:
+        *fields: Rules in the order the values will be passed
+
+    Returns:
+        Function taking one positional value per field and returning the
+        first :class:`ValidationError` in phase order, or None if all
+        values are valid
+    """
+    def message(field: Field, code: str, **values: Any) -> str:
+        template = (field.messages or {}).get(code) or _DEFAULT_MESSAGES[code]
+        return template.format(name=field.name, **values)
+
+    def type_error(index: int, value: Any) -> ValidationError:
+        field = fields[index]
+        expected = _TYPE_NAMES.get(field.type, field.type.__name__)
+        text = message(field, "type", expected=expected, type=type(value).__name__, value=value)
+        return ValidationError(field.name, "type", text)
+
+    def bound_error(index: int, code: str, value: Any) -> ValidationError:
+        field = fields[index]
+        limit = field.min_value if code == "min" else field.max_value
+        return ValidationError(field.name, code, message(field, code, limit=limit, value=value))
+
+    namespace: Dict[str, Any] = {"type_error": type_error, "bound_error": bound_error}
+    phases: Tuple[List[str], List[str], List[str]] = ([], [], [])
+    for index, field in enumerate(fields):
+        namespace[f"T{index}"] = field.type
+        namespace[f"EMPTY{index}"] = ValidationError(field.name, "empty", message(field, "empty"))
+        blank = "blank" if field.messages and "blank" in field.messages else "empty"
+        namespace[f"BLANK{index}"] = ValidationError(field.name, "empty", message(field, blank))
+        if field.messages and "bool" in field.messages:
+            namespace[f"BOOL{index}"] = ValidationError(field.name, "type", message(field, "bool"))
+        for phase, lines in zip(phases, _field_source(index, field)):
+            phase += lines
+
+    lines = [f"def check({', '.join(f'v{i}' for i in range(len(fields)))}):"]
+    for phase in phases:
+        lines += phase
+    lines.append("    return None")
+
+    exec("\n".join(lines), namespace)
+    return namespace["check"]
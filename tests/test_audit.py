@@ -0,0 +1,174 @@
+"""
+Test suite for the streaming ticket fairness audit.
+
+Test Coverage:
+- Per-number and per-pair counters against a direct count
+- Invalid tickets skipped and counted
+- Merging partial audits
+- Chi-square statistics and p-values, calibrated for draws without replacement
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from tasks.audit import ChiSquare, TicketAudit, audit_tickets, merge_audits
+from tasks.task_2 import get_numbers_ticket
+
+
+def _tickets(count, min_value=1, max_value=20, quantity=4):
+    return [get_numbers_ticket(min_value, max_value, quantity) for _ in range(count)]
+
+
+class TestTicketAudit:
+    """Test suite for TicketAudit counters."""
+
+    def test_counts_match_direct_count(self):
+        """Number and pair counters should match a straightforward count."""
+        tickets = _tickets(500)
+        audit = TicketAudit(1, 20, 4)
+
+        assert audit.update(tickets) == 500
+
+        numbers = Counter(number for ticket in tickets for number in ticket)
+        pairs = Counter(pair for ticket in tickets for pair in combinations(ticket, 2))
+        assert audit.tickets == 500
+        assert list(audit.number_counts) == [numbers[n] for n in range(1, 21)]
+        for a, b in combinations(range(1, 21), 2):
+            assert audit.pair_count(a, b) == audit.pair_count(b, a) == pairs[(a, b)]
+
+    def test_unsorted_tickets(self):
+        """Ticket order should not matter."""
+        audit = TicketAudit(1, 5, 2)
+        audit.update([(5, 1), [1, 5]])
+
+        assert audit.pair_count(1, 5) == 2
+
+    @pytest.mark.parametrize("ticket", [[1, 2, 3], [1, 1, 2, 3], [0, 1, 2, 3], "1234", [1, 2, 3, "4"]])
+    def test_invalid_tickets_skipped(self, ticket, capsys):
+        """Invalid tickets should be reported, counted and not added."""
+        audit = TicketAudit(1, 20, 4)
+
+        assert audit.update([ticket, [1, 2, 3, 4]]) == 1
+        assert audit.invalid == 1
+        assert audit.tickets == 1
+        assert sum(audit.number_counts) == 4
+        assert "Error" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("args", [(0, 49, 6), (1, 1001, 6), (10, 5, 1), (1, 5, 6), ("1", 49, 6)])
+    def test_invalid_parameters(self, args):
+        """Constructor should reject arguments get_numbers_ticket rejects."""
+        with pytest.raises(ValueError):
+            TicketAudit(*args)
+
+    def test_pairs_disabled(self):
+        """Without pair tracking only number counts are kept."""
+        audit = TicketAudit(1, 1000, 10, pairs=False)
+        audit.update(_tickets(10, 1, 1000, 10))
+
+        assert audit.pair_counts is None
+        assert "pairs" not in audit.report()
+        with pytest.raises(ValueError):
+            audit.pair_chi_square()
+
+
+class TestMergeAudits:
+    """Test suite for combining partial audits."""
+
+    def test_merge_equals_single_pass(self):
+        """Merged worker audits should equal one audit over all tickets."""
+        batches = [_tickets(100) for _ in range(4)]
+        whole = audit_tickets(batches, 1, 20, 4)
+        parts = [audit_tickets([batch], 1, 20, 4) for batch in batches]
+
+        merged = merge_audits(parts)
+
+        assert merged.tickets == whole.tickets == 400
+        assert merged.number_counts == whole.number_counts
+        assert merged.pair_counts == whole.pair_counts
+        assert parts[0].tickets == 100
+
+    def test_merge_different_parameters(self):
+        """Audits over different ranges should not be merged."""
+        with pytest.raises(ValueError):
+            TicketAudit(1, 20, 4).merge(TicketAudit(1, 21, 4))
+        with pytest.raises(ValueError):
+            TicketAudit(1, 20, 4).merge(TicketAudit(1, 20, 4, pairs=False))
+
+    def test_merge_nothing(self):
+        """merge_audits needs at least one audit."""
+        with pytest.raises(ValueError):
+            merge_audits([])
+
+
+class TestChiSquare:
+    """Test suite for the uniformity statistics."""
+
+    def test_empty_audit(self):
+        """No data should give a neutral result."""
+        audit = TicketAudit(1, 49, 6)
+
+        assert audit.number_chi_square() == ChiSquare(0.0, 48, 1.0)
+
+    def test_known_statistic(self):
+        """Statistic should follow Pearson's formula."""
+        audit = TicketAudit(1, 3, 1)
+        audit.update([[1]] * 6 + [[2]] * 3 + [[3]] * 3)
+
+        statistic, dof, p_value = audit.number_chi_square()
+
+        # expected 4 per cell: (4 + 1 + 1) / 4
+        assert statistic == pytest.approx(1.5)
+        assert dof == 2
+        # exact chi-square(2) tail: exp(-1.5 / 2)
+        assert p_value == pytest.approx(0.4724, abs=0.01)
+
+    def test_fair_generator_passes(self):
+        """get_numbers_ticket output should not look biased."""
+        audit = audit_tickets([_tickets(5000, 1, 20, 4)], 1, 20, 4)
+
+        assert audit.number_chi_square().p_value > 1e-4
+        assert audit.pair_chi_square().p_value > 1e-4
+
+    def test_biased_generator_fails(self):
+        """A generator that never draws 20 should be detected."""
+        audit = audit_tickets([_tickets(5000, 1, 19, 4)], 1, 20, 4)
+
+        assert audit.number_chi_square().p_value < 1e-6
+        assert audit.report()["numbers"]["p_value"] < 1e-6
+
+    def test_statistic_scaled_for_distinct_draws(self):
+        """Balanced number counts should give zero; k = n - 1 uses (n - 1) / (n - k)."""
+        audit = TicketAudit(1, 4, 3)
+        audit.update([[1, 2, 3], [1, 2, 4], [1, 3, 4], [2, 3, 4]])
+        assert audit.number_chi_square().statistic == pytest.approx(0.0)
+
+        audit.update([[1, 2, 3]])
+        # Pearson: expected 15/4, deviations (1/4, 1/4, 1/4, -3/4) -> 0.2; scaled by 3
+        assert audit.number_chi_square().statistic == pytest.approx(0.6)
+
+    def test_every_number_drawn(self):
+        """When a ticket holds the whole range the counts cannot vary."""
+        audit = audit_tickets([[[1, 2, 3]] * 10], 1, 3, 3)
+
+        assert audit.number_chi_square().p_value == 1.0
+        assert audit.pair_chi_square().p_value == 1.0
+
+    @pytest.mark.parametrize("max_value, quantity, tickets", [(49, 6, 400), (20, 19, 50), (8, 3, 100)])
+    def test_p_values_calibrated(self, max_value, quantity, tickets):
+        """About 5% of fair audits should have p < 0.05."""
+        rng = random.Random(max_value * 100 + quantity)
+        population = range(1, max_value + 1)
+        runs = 300
+        number_rejections = pair_rejections = 0
+        for _ in range(runs):
+            audit = TicketAudit(1, max_value, quantity)
+            audit.update([rng.sample(population, quantity) for _ in range(tickets)], validate=False)
+            number_rejections += audit.number_chi_square().p_value < 0.05
+            pair_rejections += audit.pair_chi_square().p_value < 0.05
+
+        # 0.05 +- about 3.5 standard errors for 300 runs
+        assert 0.01 <= number_rejections / runs <= 0.09
+        assert 0.01 <= pair_rejections / runs <= 0.09
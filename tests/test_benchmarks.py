@@ -0,0 +1,71 @@
+"""
+Test suite for the benchmark harness.
+
+Test Coverage:
+- Seeded generators are deterministic and honour the dirty ratio
+- Regression detection against a baseline
+- Single case execution produces all metrics
+"""
+
+import pytest
+
+from benchmarks.data import GENERATORS
+from benchmarks.run import case_key, find_regressions, run_case
+
+
+class TestGenerators:
+    """Test suite for seeded synthetic data generators."""
+
+    @pytest.mark.parametrize("name", sorted(GENERATORS))
+    def test_same_seed_same_data(self, name):
+        """Same arguments should always produce the same data."""
+        assert GENERATORS[name](100, 0.3, 7) == GENERATORS[name](100, 0.3, 7)
+
+    @pytest.mark.parametrize("name", sorted(GENERATORS))
+    def test_requested_size(self, name):
+        """Generators should return exactly the requested number of items."""
+        assert len(GENERATORS[name](250, 0.5, 1)) == 250
+
+    def test_clean_phones_are_valid(self):
+        """Clean phone inputs should all normalize successfully."""
+        from tasks.task_3 import normalize_phone
+
+        assert all(normalize_phone(phone) for phone in GENERATORS["normalize_phone"](200))
+
+    def test_dirty_users_contain_invalid_records(self):
+        """A dirty mix should include records rejected by validation."""
+        users = GENERATORS["get_upcoming_birthdays"](200, 0.5, 3)
+        assert any(not isinstance(user, dict) or "birthday" not in user for user in users)
+
+
+class TestRegressionDetection:
+    """Test suite for find_regressions."""
+
+    def test_slowdown_above_threshold_flagged(self):
+        """Throughput drop beyond the threshold should be flagged."""
+        baseline = {"a": {"ops_per_sec": 1000.0}, "b": {"ops_per_sec": 1000.0}}
+        results = {"a": {"ops_per_sec": 700.0}, "b": {"ops_per_sec": 900.0}}
+
+        assert find_regressions(results, baseline, threshold=0.2) == ["a"]
+
+    def test_missing_baseline_case_ignored(self):
+        """New cases without a baseline entry should not be flagged."""
+        assert find_regressions({"new": {"ops_per_sec": 1.0}}, {}, threshold=0.2) == []
+
+
+class TestRunCase:
+    """Test suite for run_case."""
+
+    @pytest.mark.parametrize("name", sorted(GENERATORS))
+    def test_reports_all_metrics(self, name, capsys):
+        """A small case should report every metric without printing errors."""
+        metrics = run_case(name, 10, "dirty")
+
+        assert set(metrics) == {"ops_per_sec", "p50_us", "p99_us", "peak_kib"}
+        assert metrics["ops_per_sec"] > 0
+        assert metrics["p50_us"] <= metrics["p99_us"]
+        assert capsys.readouterr().out == ""
+
+    def test_case_key(self):
+        """Case keys should identify function, size and mix."""
+        assert case_key("normalize_phone", 1000, "clean") == "normalize_phone[size=1000,mix=clean]"
@@ -0,0 +1,138 @@
+"""
+Test suite for the persistent SQLite cache.
+
+Test Coverage:
+- Bulk get/put round trips, including cached None results
+- Persistence across connections and version invalidation
+- Size-bounded LRU eviction
+- Cached phone normalization and date parsing helpers
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from tasks.cache import (
+    PersistentCache,
+    cached_normalize_phones,
+    cached_parse_birthdays,
+    cached_parse_dates,
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path of a fresh cache database."""
+    return str(tmp_path / "cache.sqlite3")
+
+
+class TestPersistentCache:
+    """Test suite for PersistentCache."""
+
+    def test_round_trip(self, cache_path):
+        """Stored entries should be returned by get_many; misses omitted."""
+        with PersistentCache(cache_path) as cache:
+            cache.put_many("ns", 1, {"a": "1", "b": None})
+
+            assert cache.get_many("ns", 1, ["a", "b", "c"]) == {"a": "1", "b": None}
+
+    def test_persists_across_connections(self, cache_path):
+        """Entries should survive closing and reopening the database."""
+        with PersistentCache(cache_path) as cache:
+            cache.put_many("ns", 1, {"a": "1"})
+
+        with PersistentCache(cache_path) as cache:
+            assert cache.get_many("ns", 1, ["a"]) == {"a": "1"}
+
+    def test_version_change_invalidates_namespace(self, cache_path):
+        """A new version should clear only its own namespace."""
+        with PersistentCache(cache_path) as cache:
+            cache.put_many("ns", 1, {"a": "1"})
+            cache.put_many("other", 1, {"a": "x"})
+
+        with PersistentCache(cache_path) as cache:
+            assert cache.get_many("ns", 2, ["a"]) == {}
+            assert cache.get_many("other", 1, ["a"]) == {"a": "x"}
+
+    def test_large_batches(self, cache_path):
+        """Batches above the SQL parameter limit should work."""
+        items = {str(i): str(i * 2) for i in range(2500)}
+        with PersistentCache(cache_path) as cache:
+            cache.put_many("ns", 1, items)
+
+            assert cache.get_many("ns", 1, items) == items
+
+    def test_lru_eviction(self, cache_path):
+        """Least recently used entries should be evicted past max_entries."""
+        with PersistentCache(cache_path, max_entries=3) as cache:
+            cache.put_many("ns", 1, {"a": "1", "b": "2"})
+            cache.put_many("ns", 1, {"c": "3"})
+            cache.get_many("ns", 1, ["a"])  # "b" is now least recently used
+            cache.put_many("ns", 1, {"d": "4"})
+
+            assert set(cache.get_many("ns", 1, ["a", "b", "c", "d"])) == {"a", "c", "d"}
+            assert len(cache) == 3
+
+    @pytest.mark.parametrize("max_entries", [0, -1, True, 1.5])
+    def test_invalid_max_entries(self, max_entries):
+        """max_entries must be a positive integer."""
+        with pytest.raises(ValueError):
+            PersistentCache(":memory:", max_entries=max_entries)
+
+
+class TestCachedHelpers:
+    """Test suite for cached task helpers."""
+
+    def test_normalize_phones(self, cache_path):
+        """Results should match normalize_phone, in input order."""
+        phones = ["050 123 45 67", "123", None, "050 123 45 67", "+38(067)765-43-21"]
+
+        with PersistentCache(cache_path) as cache:
+            result = cached_normalize_phones(phones, cache)
+
+        assert result == ["+380501234567", None, None, "+380501234567", "+380677654321"]
+
+    def test_second_run_uses_cache(self, cache_path):
+        """Cached values should be reused without calling normalize_phone."""
+        phones = ["050 123 45 67", "123"]
+        with PersistentCache(cache_path) as cache:
+            cached_normalize_phones(phones, cache)
+
+        with PersistentCache(cache_path) as cache, \
+                patch("tasks.task_3.normalize_phone") as normalize_phone:
+            result = cached_normalize_phones(phones, cache)
+
+        normalize_phone.assert_not_called()
+        assert result == ["+380501234567", None]
+
+    def test_country_code_is_part_of_key(self, cache_path):
+        """The same number with another country code should not hit the cache."""
+        with PersistentCache(cache_path) as cache:
+            assert cached_normalize_phones(["5012345678"], cache, 38) == ["+385012345678"]
+            assert cached_normalize_phones(["5012345678"], cache, 1) == ["+15012345678"]
+
+    def test_version_bump_recomputes(self, cache_path):
+        """Bumping CACHE_VERSION should discard old results."""
+        with PersistentCache(cache_path) as cache:
+            cached_normalize_phones(["050 123 45 67"], cache)
+
+        with PersistentCache(cache_path) as cache, patch("tasks.task_3.CACHE_VERSION", 2):
+            cache.get_many("normalize_phone", 2, [])
+            assert cache.get_many("normalize_phone", 2, ["38:050 123 45 67"]) == {}
+
+    def test_parse_dates(self, cache_path):
+        """ISO dates should be parsed with task_1 rules."""
+        with PersistentCache(cache_path) as cache:
+            result = cached_parse_dates(["2024-02-29", "2025-02-29", "", 20240229, "2024-01-01T10:00"], cache)
+
+        assert result == [date(2024, 2, 29), None, None, None, date(2024, 1, 1)]
+
+    def test_parse_birthdays(self, cache_path):
+        """Birthdays should be parsed with task_4 rules."""
+        with PersistentCache(cache_path) as cache:
+            result = cached_parse_birthdays(["1990.01.15", "1990-01-15", None], cache)
+            again = cached_parse_birthdays(["1990.01.15"], cache)
+
+        assert result == [date(1990, 1, 15), None, None]
+        assert again == [date(1990, 1, 15)]
@@ -0,0 +1,77 @@
+"""
+Test suite for the lazy tasks package facade.
+
+Test Coverage:
+- Every public function is re-exported from its task module
+- Importing the package imports no task module
+- Accessing one function imports only its own module
+- Unknown attributes raise AttributeError
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import tasks
+
+
+def _loaded_modules(statement: str) -> list:
+    """Run *statement* in a fresh interpreter and list loaded task modules."""
+    code = (
+        f"import sys; {statement}; "
+        "print(' '.join(sorted(m for m in sys.modules if m.startswith('tasks') or m == 'random')))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.split()
+
+
+class TestLazyFacade:
+    """Test suite for module-level __getattr__ re-exports."""
+
+    @pytest.mark.parametrize("name", tasks.__all__)
+    def test_exports_resolve_to_module_functions(self, name):
+        """Each exported name should be the function from its task module."""
+        from importlib import import_module
+
+        module = import_module(tasks._EXPORTS[name])
+        assert getattr(tasks, name) is getattr(module, name)
+
+    def test_from_import(self):
+        """``from tasks import ...`` should work for exported names."""
+        from tasks import get_days_from_today, normalize_phone
+
+        assert callable(get_days_from_today)
+        assert normalize_phone("050 123 45 67") == "+380501234567"
+
+    def test_dir_lists_exports(self):
+        """dir(tasks) should include all public functions."""
+        assert set(tasks.__all__) <= set(dir(tasks))
+
+    def test_unknown_attribute(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_function"):
+            tasks.no_such_function
+
+    def test_package_import_loads_no_task_module(self):
+        """Importing the package alone should not import any task module."""
+        assert _loaded_modules("import tasks") == ["tasks"]
+
+    def test_access_loads_only_needed_module(self):
+        """Touching one function should import only its own module."""
+        loaded = _loaded_modules("import tasks; tasks.get_days_from_today")
+
+        assert loaded == ["tasks", "tasks.task_1", "tasks.validation"]
+
+    def test_instrumentation_wrappers_visible(self):
+        """Functions swapped in by instrumentation should be returned."""
+        from tasks import instrumentation
+
+        instrumentation.enable()
+        try:
+            assert tasks.normalize_phone is sys.modules["tasks.task_3"].normalize_phone
+            assert hasattr(tasks.normalize_phone, "__wrapped__")
+        finally:
+            instrumentation.disable()
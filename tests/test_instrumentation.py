@@ -0,0 +1,143 @@
+"""
+Test suite for the opt-in instrumentation layer.
+
+Test Coverage:
+- Enable/disable swaps and restores the original functions
+- Call counters, phase timings and error categories
+- Snapshot and Prometheus exporter output
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import tasks.task_1 as task_1
+import tasks.task_4 as task_4
+from tasks import instrumentation
+
+
+@pytest.fixture
+def instrumented():
+    """Enable instrumentation with clean metrics for one test."""
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestEnableDisable:
+    """Test suite for swapping wrappers in and out."""
+
+    def test_disabled_by_default(self):
+        """Nothing should be wrapped until enable() is called."""
+        assert not instrumentation.is_enabled()
+        assert "print" not in vars(task_1)
+
+    def test_enable_and_disable_restore_originals(self):
+        """disable() should put back the exact original objects."""
+        original = task_4.get_upcoming_birthdays
+        original_helper = task_4._parse_birthday
+
+        instrumentation.enable()
+        try:
+            assert instrumentation.is_enabled()
+            assert task_4.get_upcoming_birthdays is not original
+            assert task_4.get_upcoming_birthdays.__wrapped__ is original
+        finally:
+            instrumentation.disable()
+
+        assert not instrumentation.is_enabled()
+        assert task_4.get_upcoming_birthdays is original
+        assert task_4._parse_birthday is original_helper
+        assert "print" not in vars(task_4)
+
+    def test_enable_twice_is_noop(self, instrumented):
+        """A second enable() should not double-wrap functions."""
+        wrapped = task_1.get_days_from_today
+        instrumented.enable()
+        assert task_1.get_days_from_today is wrapped
+
+    def test_no_metrics_when_disabled(self):
+        """Calls made while disabled should not be recorded."""
+        instrumentation.reset()
+        task_1.get_days_from_today("2024-01-01")
+        assert instrumentation.snapshot()["calls"] == {}
+
+
+class TestMetrics:
+    """Test suite for counters, timings and error categories."""
+
+    def test_call_counters(self, instrumented):
+        """Each call through the module should be counted."""
+        for _ in range(3):
+            task_1.get_days_from_today("2024-01-01")
+
+        assert instrumented.snapshot()["calls"] == {"get_days_from_today": 3}
+
+    def test_phase_timings_attributed_to_entry_point(self, instrumented):
+        """Helper phases should be recorded under the calling function."""
+        soon = datetime.today().date() + timedelta(days=1)
+        task_4.get_upcoming_birthdays([{"name": "A", "birthday": f"1990.{soon:%m.%d}"}])
+
+        phases = instrumented.snapshot()["seconds"]["get_upcoming_birthdays"]
+        assert set(phases) == {"total", "validate", "parse", "compute", "format"}
+        assert all(value >= 0 for value in phases.values())
+        exclusive = sum(value for phase, value in phases.items() if phase != "total")
+        assert exclusive <= phases["total"]
+
+    def test_error_categories(self, instrumented, capsys):
+        """Printed errors should be counted by category and still printed."""
+        task_1.get_days_from_today(123)
+        task_1.get_days_from_today("")
+        task_1.get_days_from_today("not a date")
+
+        errors = instrumented.snapshot()["errors"]["get_days_from_today"]
+        assert errors == {"type": 1, "empty": 1, "format": 1}
+        assert "Cannot parse the date" in capsys.readouterr().out
+
+    def test_task_2_and_task_3_errors(self, instrumented):
+        """Range and type errors from other modules should be categorized."""
+        import tasks.task_2 as task_2
+        import tasks.task_3 as task_3
+
+        task_2.get_numbers_ticket(0, 10, 5)
+        task_3.normalize_phone(None)
+        task_3.normalize_phone("123")
+
+        errors = instrumented.snapshot()["errors"]
+        assert errors["get_numbers_ticket"] == {"range": 1}
+        assert errors["normalize_phone"] == {"type": 1, "range": 1}
+
+    def test_reset(self, instrumented):
+        """reset() should clear all metrics."""
+        task_1.get_days_from_today("2024-01-01")
+        instrumented.reset()
+        assert instrumented.snapshot() == {"calls": {}, "seconds": {}, "errors": {}}
+
+
+class TestPrometheusExporter:
+    """Test suite for the Prometheus text exporter."""
+
+    def test_exposition_format(self, instrumented):
+        """Metrics should render as Prometheus counters."""
+        task_1.get_days_from_today("2024-01-01")
+        task_1.get_days_from_today(None)
+
+        text = instrumented.to_prometheus()
+
+        assert "# TYPE tasks_calls_total counter" in text
+        assert 'tasks_calls_total{function="get_days_from_today"} 2' in text
+        assert 'tasks_phase_seconds_total{function="get_days_from_today",phase="parse"}' in text
+        assert 'tasks_errors_total{function="get_days_from_today",category="type"} 1' in text
+        assert text.endswith("\n")
+
+    def test_write_prometheus(self, instrumented, tmp_path):
+        """write_prometheus() should write the exposition text to a file."""
+        task_1.get_days_from_today("2024-01-01")
+        path = tmp_path / "tasks.prom"
+
+        instrumented.write_prometheus(str(path))
+
+        assert path.read_text(encoding="utf-8") == instrumented.to_prometheus()
+        assert not (tmp_path / "tasks.prom.tmp").exists()
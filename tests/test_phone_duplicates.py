@@ -0,0 +1,113 @@
+"""
+Test suite for near-duplicate phone detection.
+
+Test Coverage:
+- Optimal string alignment distance, bounded and unbounded
+- Clusters for wrong, missing, extra and swapped digits
+- Agreement with an all-pairs reference, for several thresholds and passes
+- Invalid arguments and ignored non-string entries
+"""
+
+import random
+from itertools import combinations
+
+import pytest
+
+from tasks.phone_duplicates import find_near_duplicates, osa_distance
+
+
+def _all_pairs_clusters(numbers, max_distance):
+    """Reference clustering by comparing every pair."""
+    numbers = list(dict.fromkeys(numbers))
+    parents = {number: number for number in numbers}
+
+    def find(number):
+        while parents[number] != number:
+            number = parents[number]
+        return number
+
+    for first, second in combinations(numbers, 2):
+        if osa_distance(first, second) <= max_distance:
+            parents[find(first)] = find(second)
+
+    clusters = {}
+    for number in numbers:
+        clusters.setdefault(find(number), []).append(number)
+    return sorted(sorted(cluster) for cluster in clusters.values() if len(cluster) > 1)
+
+
+class TestOsaDistance:
+    """Test suite for osa_distance."""
+
+    @pytest.mark.parametrize("a, b, expected", [
+        ("", "", 0),
+        ("abc", "abc", 0),
+        ("abc", "abd", 1),
+        ("abc", "ab", 1),
+        ("abc", "abxc", 1),
+        ("abcd", "abdc", 1),
+        ("ca", "abc", 3),  # OSA, not unrestricted Damerau-Levenshtein
+        ("1234", "4321", 3),
+        ("", "123", 3),
+    ])
+    def test_distance(self, a, b, expected):
+        """Distances should match known values and be symmetric."""
+        assert osa_distance(a, b) == expected
+        assert osa_distance(b, a) == expected
+
+    def test_bounded(self):
+        """Distances above the bound should be reported as bound + 1."""
+        assert osa_distance("+380501234567", "+380679999999", 1) == 2
+        assert osa_distance("123", "123456", 2) == 3
+        assert osa_distance("abcd", "abdc", 1) == 1
+
+
+class TestFindNearDuplicates:
+    """Test suite for find_near_duplicates."""
+
+    def test_typo_kinds(self):
+        """Each single-edit typo should join the original's cluster."""
+        numbers = [
+            "+380501234567",
+            "+380501234568",  # wrong digit
+            "+38050123456",  # missing digit
+            "+3805012345677",  # extra digit
+            "+380501234576",  # swapped digits
+            "+380679876543",
+        ]
+
+        assert find_near_duplicates(numbers) == [sorted(numbers[:5])]
+
+    def test_no_duplicates(self):
+        """Numbers two edits apart should not be clustered at distance 1."""
+        assert find_near_duplicates(["+380501234567", "+380501234598"]) == []
+        assert find_near_duplicates(["+380501234567", "+380501234598"], 2) == [
+            ["+380501234567", "+380501234598"]
+        ]
+
+    def test_ignores_exact_repeats_and_non_strings(self):
+        """Repeated numbers count once; None entries are skipped."""
+        numbers = ["+380501234567", None, "+380501234567", 380501234568]
+
+        assert find_near_duplicates(numbers) == []
+
+    @pytest.mark.parametrize("max_distance, passes", [(1, 1), (1, 3), (2, 1), (2, 4)])
+    def test_matches_all_pairs(self, max_distance, passes):
+        """Blocking should find exactly the all-pairs clusters."""
+        rng = random.Random(max_distance * 10 + passes)
+        numbers = []
+        for _ in range(150):
+            number = "".join(rng.choice("0123") for _ in range(rng.randrange(5, 8)))
+            numbers.append(number)
+
+        assert find_near_duplicates(numbers, max_distance, passes=passes) == \
+            _all_pairs_clusters(numbers, max_distance)
+
+    @pytest.mark.parametrize("args", [(0,), (-1,), (1.5,), (True,), (1, 0)])
+    def test_invalid_arguments(self, args, capsys):
+        """Invalid thresholds or pass counts should return an empty list."""
+        max_distance, *rest = args
+        passes = rest[0] if rest else 1
+
+        assert find_near_duplicates(["1", "2"], max_distance, passes=passes) == []
+        assert "Error" in capsys.readouterr().out
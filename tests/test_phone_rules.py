@@ -0,0 +1,149 @@
+"""
+Test suite for the phone number rules engine.
+
+Test Coverage:
+- Ukrainian mobile and landline classification
+- Length, prefix and character checks
+- Custom and JSON-loaded rule tables, including malformed ones
+- Bulk classification with normalization
+"""
+
+import json
+
+import pytest
+
+from tasks.phone_rules import (
+    INVALID,
+    LANDLINE,
+    MOBILE,
+    VALID,
+    PhoneRules,
+    classify_phone,
+    classify_phones,
+    load_phone_rules,
+)
+
+
+class TestClassifyPhone:
+    """Test suite for the default Ukrainian rules."""
+
+    @pytest.mark.parametrize("number, expected", [
+        ("+380501234567", MOBILE),
+        ("+380671234567", MOBILE),
+        ("+380991234567", MOBILE),
+        ("380931234567", MOBILE),
+        ("+380441234567", LANDLINE),
+        ("+380322123456", LANDLINE),
+        ("+380001234567", INVALID),  # no such code
+        ("+380801234567", INVALID),  # toll-free, not a subscriber line
+        ("+38050123456", INVALID),  # too short
+        ("+3805012345678", INVALID),  # too long
+        ("+3815551234567", INVALID),  # not Ukraine
+        ("+38050123456a", INVALID),
+        ("+380５01234567", INVALID),  # non-ASCII digit
+        ("+", INVALID),
+        ("", INVALID),
+        (None, INVALID),
+        (380501234567, INVALID),
+    ])
+    def test_classification(self, number, expected):
+        """Numbers should be classified by prefix and length."""
+        assert classify_phone(number) == expected
+
+    def test_classify_phones_normalizes(self, capsys):
+        """Bulk classification should normalize raw numbers first."""
+        results = classify_phones(["050 123 45 67", "(044) 123-45-67", "123", "+1 555 123 4567"])
+
+        assert results == [
+            ("+380501234567", MOBILE),
+            ("+380441234567", LANDLINE),
+            (None, INVALID),
+            ("+3815551234567", INVALID),
+        ]
+        assert "too short" in capsys.readouterr().out
+
+
+class TestPhoneRules:
+    """Test suite for custom rule tables."""
+
+    TABLE = [
+        {"country": "UA", "country_code": "380", "lengths": [12], "mobile": ["50"], "landline": ["44"]},
+        {"country": "PL", "country_code": "48", "lengths": [11]},
+        {"country": "X", "country_code": "3805", "lengths": [13], "landline": ["01"]},
+    ]
+
+    def test_custom_table(self):
+        """Rules without line types should classify as 'valid'."""
+        rules = PhoneRules(self.TABLE)
+
+        assert rules.classify("+48123456789") == VALID
+        assert rules.classify("+4812345678") == INVALID
+        assert rules.classify("+380441234567") == LANDLINE
+        assert classify_phone("+48123456789") == INVALID
+        assert classify_phone("+48123456789", rules) == VALID
+
+    def test_longest_prefix_wins(self):
+        """A longer matching prefix should win when it allows the length."""
+        rules = PhoneRules(self.TABLE)
+
+        assert rules.classify("+3805011234567") == LANDLINE
+        assert rules.classify("+380501234567") == MOBILE
+        assert rules.classify("+380509999999") == MOBILE
+
+    def test_classify_many(self):
+        """Bulk classification should keep input order."""
+        rules = PhoneRules(self.TABLE)
+
+        assert rules.classify_many(["+380501234567", "bad", "+48123456789"]) == [MOBILE, INVALID, VALID]
+
+    @pytest.mark.parametrize("rule", [
+        "UA",
+        {"country_code": 380, "lengths": [12]},
+        {"country_code": "+380", "lengths": [12]},
+        {"country_code": "380", "lengths": []},
+        {"country_code": "380", "lengths": [3]},
+        {"country_code": "380", "lengths": [True]},
+        {"country_code": "380", "lengths": [12], "mobile": "50"},
+        {"country_code": "380", "lengths": [12], "mobile": [50]},
+        {"country_code": "380", "lengths": [12], "fax": ["50"]},
+    ])
+    def test_malformed_rule(self, rule):
+        """Malformed rules should be rejected when compiling."""
+        with pytest.raises(ValueError):
+            PhoneRules([rule])
+
+    def test_conflicting_rules(self):
+        """The same prefix cannot be both mobile and landline."""
+        with pytest.raises(ValueError):
+            PhoneRules([{"country_code": "380", "lengths": [12], "mobile": ["50"], "landline": ["50"]}])
+
+
+class TestLoadPhoneRules:
+    """Test suite for loading rule tables from JSON."""
+
+    def test_load(self, tmp_path):
+        """A JSON table should compile to working rules."""
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps(TestPhoneRules.TABLE), encoding="utf-8")
+
+        rules = load_phone_rules(str(path))
+
+        assert rules.classify("+48123456789") == VALID
+
+    @pytest.mark.parametrize("content, message", [
+        ("{not json", "Invalid JSON"),
+        ('{"country_code": "380"}', "must be a JSON list"),
+        ('[{"country_code": "380"}]', "Invalid phone rule"),
+    ])
+    def test_load_invalid(self, tmp_path, capsys, content, message):
+        """Invalid files should be reported and return None."""
+        path = tmp_path / "rules.json"
+        path.write_text(content, encoding="utf-8")
+
+        assert load_phone_rules(str(path)) is None
+        assert message in capsys.readouterr().out
+
+    def test_load_missing(self, tmp_path, capsys):
+        """A missing file should be reported and return None."""
+        assert load_phone_rules(str(tmp_path / "missing.json")) is None
+        assert "Cannot read phone rules" in capsys.readouterr().out
@@ -0,0 +1,169 @@
+"""
+Test suite for the streaming record pipeline.
+
+Test Coverage:
+- Stage outputs match the task functions
+- Batching, streaming and input order, in-process and with a process pool
+- Per-stage metrics
+- Invalid records, values and configuration
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from tasks.pipeline import BirthdayStage, DaysStage, Pipeline, PhoneStage, Stage
+from tasks.task_1 import get_days_from_today
+from tasks.task_3 import normalize_phone
+from tasks.task_4 import get_upcoming_birthdays
+
+
+def _records(count):
+    today = datetime.today().date()
+    records = []
+    for i in range(count):
+        birthday = today + timedelta(days=i % 30)
+        records.append({
+            "id": i,
+            "phone": f"050 {i % 1000:03d} 45 67" if i % 7 else "123",
+            "signup": (today - timedelta(days=i)).isoformat() if i % 11 else "bad date",
+            "birthday": f"1990.{birthday.month:02d}.{birthday.day:02d}" if i % 13 else "1990-01-01",
+        })
+    return records
+
+
+def _pipeline(batch_size=16, strict=True):
+    return Pipeline(
+        [PhoneStage("phone"), DaysStage("signup"), BirthdayStage("birthday", strict=strict)],
+        batch_size=batch_size,
+    )
+
+
+class TestPipeline:
+    """Test suite for Pipeline."""
+
+    def test_outputs_match_task_functions(self, capsys):
+        """Each stage should produce what the task function returns."""
+        records = _records(100)
+
+        output = list(_pipeline().run(records))
+
+        assert [record["id"] for record in output] == list(range(100))
+        for source, record in zip(records, output):
+            assert record["phone_normalized"] == normalize_phone(source["phone"])
+            assert record["signup_days"] == get_days_from_today(source["signup"])
+            upcoming = get_upcoming_birthdays([{"name": "x", "birthday": source["birthday"]}])
+            expected = upcoming[0]["congratulation_date"] if upcoming else None
+            assert record["congratulation_date"] == expected
+        assert "phone_normalized" not in records[0]
+
+    def test_streams_lazily(self):
+        """Records should be consumed one batch at a time."""
+        consumed = []
+
+        def source():
+            for record in _records(50):
+                consumed.append(record["id"])
+                yield record
+
+        output = _pipeline(batch_size=10).run(source())
+        first = next(output)
+
+        assert first["id"] == 0
+        assert len(consumed) == 10
+
+    def test_metrics(self, capsys):
+        """Metrics should count items and invalid values per stage."""
+        pipeline = _pipeline()
+        list(pipeline.run(_records(100)))
+
+        metrics = pipeline.metrics()
+
+        assert list(metrics) == [
+            "normalize_phone:phone", "get_days_from_today:signup", "upcoming_birthday:birthday",
+        ]
+        assert metrics["normalize_phone:phone"]["items"] == 100
+        assert metrics["normalize_phone:phone"]["invalid"] == 15
+        assert metrics["get_days_from_today:signup"]["invalid"] == 10
+        assert metrics["upcoming_birthday:birthday"]["invalid"] == 8
+        assert all(stage["per_second"] > 0 for stage in metrics.values())
+
+    def test_process_pool_same_output(self, capsys):
+        """Parallel runs should give the same records in the same order."""
+        records = _records(200)
+        pipeline = _pipeline(batch_size=25)
+
+        assert list(pipeline.run(records, workers=2)) == list(_pipeline().run(records))
+        assert pipeline.metrics()["normalize_phone:phone"]["items"] == 200
+
+    def test_prefilter_same_output(self, capsys):
+        """strict=False should only skip reports for rows outside the window."""
+        records = _records(100)
+
+        relaxed = list(_pipeline(strict=False).run(records))
+
+        assert relaxed == list(_pipeline().run(records))
+
+    def test_prefilter_parses_non_canonical_layouts(self):
+        """Space-padded days should not be skipped by the month/day slice."""
+        values = [f"2000.01. {day}" for day in range(1, 10)]
+        today = date(2026, 1, 1)
+
+        relaxed = BirthdayStage("birthday", strict=False).process(values, today)
+
+        assert relaxed == BirthdayStage("birthday").process(values, today)
+        assert relaxed[0][4] == "2026.01.05"
+
+    def test_days_use_run_date(self):
+        """DaysStage should use the date shared by the run, not the clock."""
+        outputs, invalid = DaysStage("signup").process(["2026-01-11", "bad"], date(2026, 1, 1))
+
+        assert (outputs, invalid) == ([10, None], 1)
+
+    def test_days_accept_str_subclass(self):
+        """str subclasses should be parsed as date strings."""
+        class DateString(str):
+            pass
+
+        outputs, _ = DaysStage("signup").process([DateString("2026-01-11")], date(2026, 1, 1))
+
+        assert outputs == [10]
+
+    def test_stage_is_abstract(self):
+        """Stage subclasses must implement process."""
+        class NoProcess(Stage):
+            kind = "none"
+
+        with pytest.raises(TypeError):
+            NoProcess("field", "output")
+
+    def test_non_dict_records_dropped(self, capsys):
+        """Non-dict records should be reported and skipped."""
+        output = list(_pipeline().run([None, {"phone": "0501234567"}, "x"]))
+
+        assert [record["phone_normalized"] for record in output] == ["+380501234567"]
+        assert capsys.readouterr().out.count("record must be a dict") == 2
+
+    def test_empty_input(self):
+        """No records should give no output."""
+        assert list(_pipeline().run([])) == []
+
+    @pytest.mark.parametrize("kwargs", [
+        {"stages": []},
+        {"stages": ["phone"]},
+        {"stages": [PhoneStage("phone"), PhoneStage("phone", output="other")]},
+        {"stages": [PhoneStage("phone")], "batch_size": 0},
+    ])
+    def test_invalid_pipeline(self, kwargs):
+        """Invalid configuration should raise ValueError."""
+        with pytest.raises(ValueError):
+            Pipeline(**kwargs)
+
+    def test_invalid_stage_options(self):
+        """Stage options should be checked once, up front."""
+        with pytest.raises(ValueError):
+            PhoneStage("phone", country_code=0)
+        with pytest.raises(ValueError):
+            DaysStage("signup", epoch_unit="hours")
+        with pytest.raises(ValueError):
+            _pipeline().run([], workers=0)
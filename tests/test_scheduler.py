@@ -0,0 +1,224 @@
+"""
+Test suite for the asyncio congratulation scheduler.
+
+Test Coverage:
+- Next congratulation dates (weekends, Feb 29, year rollover)
+- Incremental upsert/remove without rescanning
+- Users keyed by (name, birthday) or a custom key
+- Dispatch of due messages and yearly rescheduling
+- Bounded send concurrency and sender failures
+- The run loop with an injected clock and sleep
+"""
+
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from tasks.scheduler import BirthdayScheduler, LocalSender, _next_congratulation_date
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += timedelta(seconds=delay)
+        await asyncio.sleep(0)
+
+
+def _birthday(day, birth_year=1990):
+    return f"{birth_year}.{day.month:02d}.{day.day:02d}"
+
+
+class TestNextCongratulationDate:
+    """Tests for the next congratulation date."""
+
+    @pytest.mark.parametrize("birthday, today, expected", [
+        (date(1990, 10, 21), date(2026, 10, 19), date(2026, 10, 21)),  # Wednesday
+        (date(1990, 10, 24), date(2026, 10, 19), date(2026, 10, 26)),  # Saturday -> Monday
+        (date(1990, 10, 19), date(2026, 10, 19), date(2026, 10, 19)),  # today
+        (date(1990, 10, 18), date(2026, 10, 19), date(2027, 10, 18)),  # passed
+        (date(2000, 2, 29), date(2027, 2, 1), date(2027, 3, 1)),  # non-leap year
+        (date(2000, 2, 29), date(2028, 2, 1), date(2028, 2, 29)),
+    ])
+    def test_dates(self, birthday, today, expected):
+        """Dates should follow the task_4 rules without the 7-day limit."""
+        assert _next_congratulation_date(birthday, today) == expected
+
+
+class TestBirthdayScheduler:
+    """Test suite for BirthdayScheduler."""
+
+    def make_scheduler(self, now=datetime(2026, 10, 19, 8, 0), **kwargs):
+        clock = FakeClock(now)
+        sender = LocalSender()
+        scheduler = BirthdayScheduler(sender, clock=clock, sleep=clock.sleep, **kwargs)
+        return scheduler, sender, clock
+
+    def test_next_due_is_earliest(self):
+        """The heap head should be the earliest congratulation."""
+        scheduler, _, _ = self.make_scheduler()
+        loaded = scheduler.load([
+            {"name": "Later", "birthday": "1990.12.01"},
+            {"name": "Soon", "birthday": "1990.10.21"},
+            {"name": "", "birthday": "1990.10.20"},
+        ])
+
+        assert loaded == 2
+        assert len(scheduler) == 2
+        assert scheduler.next_due() == (datetime(2026, 10, 21, 9, 0), "Soon")
+
+    def test_same_name_scheduled_separately(self):
+        """Users sharing a name should not replace each other by default."""
+        scheduler, sender, clock = self.make_scheduler()
+        loaded = scheduler.load([
+            {"name": "John", "birthday": "1990.10.19"},
+            {"name": "John", "birthday": "1991.10.20"},
+            {"name": "John", "birthday": "1990.10.19"},
+        ])
+
+        assert loaded == len(scheduler) == 2
+        clock.now = datetime(2026, 10, 20, 9, 0)
+        assert asyncio.run(scheduler.run_pending()) == 2
+        assert sender.sent == [("John", date(2026, 10, 19)), ("John", date(2026, 10, 20))]
+        assert scheduler.remove_user(("John", date(1991, 10, 20)))
+        assert len(scheduler) == 1
+
+    def test_reload_does_not_grow_heap(self):
+        """Reloading unchanged users should not add heap entries."""
+        scheduler, _, _ = self.make_scheduler()
+        users = [{"name": f"User{i}", "birthday": f"1990.{i % 12 + 1:02d}.{i % 28 + 1:02d}"} for i in range(1000)]
+
+        for _ in range(50):
+            assert scheduler.load(users) == 1000
+
+        assert len(scheduler) == 1000
+        assert len(scheduler._heap) == 1000
+
+    def test_stale_entries_compacted(self):
+        """Replaced and removed entries should not outnumber live ones for long."""
+        scheduler, _, _ = self.make_scheduler(key=lambda user: user["name"])
+        for day in range(1, 29):
+            scheduler.load({"name": f"User{i}", "birthday": f"1990.11.{day:02d}"} for i in range(100))
+            assert len(scheduler._heap) <= 2 * len(scheduler) + 1
+        for i in range(90):
+            scheduler.remove_user(f"User{i}")
+
+        assert len(scheduler._heap) <= 2 * len(scheduler) + 1
+        assert scheduler.next_due() == (datetime(2026, 11, 30, 9, 0), "User90")
+
+    def test_upsert_and_remove(self):
+        """Changing or removing a user should update only their entry."""
+        scheduler, _, _ = self.make_scheduler(key=lambda user: user["name"])
+        scheduler.load([{"name": "A", "birthday": "1990.10.21"}, {"name": "B", "birthday": "1990.11.02"}])
+
+        assert scheduler.upsert_user({"name": "A", "birthday": "1990.12.24"})
+        assert scheduler.next_due() == (datetime(2026, 11, 2, 9, 0), "B")
+        assert scheduler.remove_user("B")
+        assert not scheduler.remove_user("B")
+        assert scheduler.next_due() == (datetime(2026, 12, 24, 9, 0), "A")
+        assert scheduler.remove_user("A")
+        assert scheduler.next_due() is None
+        assert not scheduler.upsert_user({"name": "C"})
+
+    def test_run_pending_sends_due_and_reschedules(self):
+        """Due messages should be sent once and moved to next year."""
+        scheduler, sender, clock = self.make_scheduler()
+        scheduler.load([{"name": "Today", "birthday": "1990.10.19"}, {"name": "Soon", "birthday": "1990.10.21"}])
+
+        assert asyncio.run(scheduler.run_pending()) == 0
+        clock.now = datetime(2026, 10, 19, 9, 0)
+        assert asyncio.run(scheduler.run_pending()) == 1
+        assert asyncio.run(scheduler.run_pending()) == 0
+
+        assert sender.sent == [("Today", date(2026, 10, 19))]
+        assert scheduler.sent == 1
+        scheduler.remove_user(("Soon", date(1990, 10, 21)))
+        assert scheduler.next_due() == (datetime(2027, 10, 19, 9, 0), "Today")
+
+    def test_bounded_concurrency(self):
+        """No more than max_concurrency sends should run at once."""
+        active = peak = 0
+
+        async def slow_sender(name, day):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            for _ in range(3):
+                await asyncio.sleep(0)
+            active -= 1
+
+        clock = FakeClock(datetime(2026, 10, 21, 10, 0))
+        scheduler = BirthdayScheduler(slow_sender, max_concurrency=2, clock=clock, sleep=clock.sleep)
+        scheduler.load({"name": f"User{i}", "birthday": "1990.10.21"} for i in range(10))
+
+        assert asyncio.run(scheduler.run_pending()) == 10
+        assert peak == 2
+        assert scheduler.sent == 10
+
+    def test_failed_send_reported(self, capsys):
+        """Sender errors should be counted and reported, not raised."""
+        async def failing_sender(name, day):
+            raise ConnectionError("down")
+
+        clock = FakeClock(datetime(2026, 10, 21, 10, 0))
+        scheduler = BirthdayScheduler(failing_sender, clock=clock, sleep=clock.sleep)
+        scheduler.load([{"name": "A", "birthday": "1990.10.21"}])
+
+        asyncio.run(scheduler.run_pending())
+
+        assert scheduler.failed == 1
+        assert "Cannot send congratulation to 'A'" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("value", [0, -1, 1.5, True])
+    def test_invalid_concurrency(self, value):
+        """max_concurrency must be a positive integer."""
+        with pytest.raises(ValueError):
+            BirthdayScheduler(LocalSender(), max_concurrency=value)
+
+    def test_run_sleeps_until_due(self):
+        """The run loop should send each message at its due time."""
+        scheduler, sender, clock = self.make_scheduler(send_time=time(10, 30))
+        start = clock.now.date()
+        scheduler.load([
+            {"name": "Wed", "birthday": _birthday(start + timedelta(days=2))},
+            {"name": "Sat", "birthday": _birthday(start + timedelta(days=5))},
+        ])
+        sent_at = []
+
+        async def recording_sender(name, day):
+            sent_at.append((name, clock.now))
+            if len(sent_at) == 2:
+                scheduler.stop()
+
+        scheduler.sender = recording_sender
+        asyncio.run(scheduler.run())
+
+        assert sent_at == [
+            ("Wed", datetime(2026, 10, 21, 10, 30)),
+            ("Sat", datetime(2026, 10, 26, 10, 30)),
+        ]
+        assert sender.sent == []
+
+    def test_run_picks_up_new_users(self):
+        """Users added while running should be scheduled without a rescan."""
+        scheduler, sender, clock = self.make_scheduler()
+
+        async def main():
+            runner = asyncio.ensure_future(scheduler.run())
+            await asyncio.sleep(0)
+            scheduler.upsert_user({"name": "New", "birthday": "1990.10.20"})
+            while not sender.sent:
+                await asyncio.sleep(0)
+            scheduler.stop()
+            await runner
+
+        asyncio.run(main())
+
+        assert sender.sent == [("New", date(2026, 10, 20))]
@@ -0,0 +1,116 @@
+"""
+Test suite for the shared-memory birthday index.
+
+Test Coverage:
+- Same results as get_upcoming_birthdays across a year, incl. Feb 29
+- Generation counter and reader refresh after a rebuild
+- Unlinking and reading from another process
+"""
+
+import multiprocessing
+import os
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from tasks.shared_index import SharedBirthdayIndex, publish_birthday_index, unlink_birthday_index
+from tasks.task_4 import _iter_upcoming
+
+
+@pytest.fixture
+def index_name():
+    """Unique index name, unlinked after the test."""
+    name = f"bdix_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+    yield name
+    unlink_birthday_index(name)
+
+
+def _users():
+    start = date(2000, 1, 1)
+    users = [
+        {"name": f"Користувач{i}", "birthday": (start + timedelta(days=i)).strftime("%Y.%m.%d")}
+        for i in range(366)
+    ]
+    return users[::-1] + [{"name": "", "birthday": "1990.01.01"}, {"name": "Twin", "birthday": "1991.05.05"}]
+
+
+def _read_in_worker(name, today, queue):
+    with SharedBirthdayIndex(name) as index:
+        queue.put((index.generation, index.get_upcoming_birthdays(today)))
+
+
+class TestSharedBirthdayIndex:
+    """Test suite for publish_birthday_index and SharedBirthdayIndex."""
+
+    def test_matches_get_upcoming_birthdays(self, index_name):
+        """Results should equal task_4 results, in input order."""
+        users = _users()
+        publish_birthday_index(users, index_name)
+
+        with SharedBirthdayIndex(index_name) as index:
+            assert len(index) == 367
+            day = date(2027, 1, 1)
+            while day < date(2029, 1, 1):
+                assert index.get_upcoming_birthdays(day) == list(_iter_upcoming(users, day))
+                day += timedelta(days=5)
+            for day in (date(2027, 2, 24), date(2028, 2, 24), date(2027, 12, 28)):
+                assert index.get_upcoming_birthdays(day) == list(_iter_upcoming(users, day))
+
+    def test_invalid_users_reported(self, index_name, capsys):
+        """Invalid records should be reported and skipped."""
+        publish_birthday_index([{"name": "Bad", "birthday": "1990-01-01"}, None], index_name)
+
+        with SharedBirthdayIndex(index_name) as index:
+            assert len(index) == 0
+            assert index.get_upcoming_birthdays(date(2026, 1, 1)) == []
+        assert capsys.readouterr().out.count("Error") >= 2
+
+    def test_rebuild_bumps_generation(self, index_name):
+        """Readers should switch to a rebuilt index on the next query."""
+        assert publish_birthday_index([{"name": "Old", "birthday": "1990.06.10"}], index_name) == 1
+
+        with SharedBirthdayIndex(index_name) as index:
+            today = date(2026, 6, 8)
+            assert [u["name"] for u in index.get_upcoming_birthdays(today)] == ["Old"]
+
+            assert publish_birthday_index([{"name": "New", "birthday": "1990.06.10"}], index_name) == 2
+            assert [u["name"] for u in index.get_upcoming_birthdays(today)] == ["New"]
+            assert index.generation == 2
+            assert not index.refresh()
+
+    def test_missing_index(self, index_name):
+        """Opening an unpublished index should fail."""
+        with pytest.raises(FileNotFoundError):
+            SharedBirthdayIndex(index_name)
+
+    def test_unlink(self, index_name):
+        """Unlinked indexes can no longer be opened."""
+        publish_birthday_index(_users(), index_name)
+        publish_birthday_index(_users(), index_name)
+        unlink_birthday_index(index_name)
+
+        with pytest.raises(FileNotFoundError):
+            SharedBirthdayIndex(index_name)
+        unlink_birthday_index(index_name)
+
+    def test_other_process_reads_index(self, index_name):
+        """A worker process should read the published index."""
+        users = _users()
+        publish_birthday_index(users, index_name)
+        today = date(2026, 10, 19)
+
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        worker = context.Process(target=_read_in_worker, args=(index_name, today, queue))
+        worker.start()
+        generation, result = queue.get(timeout=30)
+        worker.join(timeout=30)
+
+        assert worker.exitcode == 0
+        assert generation == 1
+        assert result == list(_iter_upcoming(users, today))
+
+        # The worker exiting must not remove the blocks
+        with SharedBirthdayIndex(index_name) as index:
+            assert len(index) == 367
@@ -9,9 +9,17 @@ Test Coverage:
 """
 
 import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 
-from tasks.task_1 import get_days_from_today
+from tasks.cache import PersistentCache
+from tasks.task_1 import (
+    HISTOGRAM_BUCKETS,
+    DateFormatDetector,
+    get_days_from_today,
+    get_days_from_today_many,
+    get_days_histogram,
+    merge_days_histograms,
+)
 
 
 class TestGetDaysFromToday:
@@ -148,9 +156,9 @@ class TestGetDaysFromToday:
         result = get_days_from_today({"date": "2026-02-08"})
         assert result is None
 
-    def test_datetime_object_returns_none(self):
-        """Datetime object input should return None."""
-        result = get_days_from_today(datetime.now())
+    def test_integer_without_epoch_unit_returns_none(self):
+        """Integers are only accepted with an explicit epoch_unit."""
+        result = get_days_from_today(1_700_000_000)
         assert result is None
 
     # ==================== NEGATIVE SCENARIOS: INVALID FORMATS ====================
@@ -253,4 +261,276 @@ class TestGetDaysFromToday:
         today = datetime.now().date()
         date_with_tz = f"{today.isoformat()}T14:30:00+02:00"
         result = get_days_from_today(date_with_tz)
-        assert result == 0
\ No newline at end of file
+        assert result == 0
+
+
+class TestTrustedInput:
+    """Tests for skipping validation with validate=False."""
+
+    def test_valid_input_same_result(self):
+        """Trusted valid input should give the same result."""
+        tomorrow = (datetime.now().date() + timedelta(days=1)).isoformat()
+        assert get_days_from_today(tomorrow, validate=False) == 1
+
+    def test_invalid_input_still_returns_none(self):
+        """Unparseable values should still return None without validation."""
+        assert get_days_from_today(None, validate=False) is None
+        assert get_days_from_today("", validate=False) is None
+
+    @pytest.mark.parametrize("value, message", [
+        (None, "Expected a string, got NoneType."),
+        (1.5, "Expected a string, got float."),
+        ("  ", "Date string is empty."),
+    ])
+    def test_error_messages(self, value, message, capsys):
+        """Validation errors should keep the original wording."""
+        assert get_days_from_today(value) is None
+        assert capsys.readouterr().out == message + "\n"
+
+
+def _offset(days):
+    """ISO date *days* away from today."""
+    return (datetime.now().date() + timedelta(days=days)).isoformat()
+
+
+class TestGetDaysHistogram:
+    """Tests for bucketed day counts."""
+
+    @pytest.mark.parametrize("days, bucket", [
+        (-8, "older"), (-7, "overdue"), (-1, "overdue"), (0, "today"),
+        (1, "this_week"), (7, "this_week"), (8, "later"),
+    ])
+    def test_bucket_boundaries(self, days, bucket):
+        """Each offset should land in its bucket."""
+        histogram = get_days_histogram([_offset(days)])
+
+        assert histogram == {**dict.fromkeys(HISTOGRAM_BUCKETS, 0), bucket: 1}
+
+    def test_matches_get_days_from_today(self, capsys):
+        """Counts should agree with per-date results, invalid values included."""
+        dates = [_offset(days) for days in range(-30, 30, 3)] * 3 + ["", None, "2025-02-30"]
+
+        histogram = get_days_histogram(iter(dates))
+
+        assert sum(histogram.values()) == len(dates)
+        assert histogram["invalid"] == 3
+        assert histogram["today"] == 3
+        assert capsys.readouterr().out.count("\n") == 3
+
+    def test_empty_input(self):
+        """No dates should give all-zero buckets."""
+        assert get_days_histogram([]) == dict.fromkeys(HISTOGRAM_BUCKETS, 0)
+
+    def test_repeated_invalid_reported_each_time(self, capsys):
+        """Invalid strings should be reported on every occurrence."""
+        histogram = get_days_histogram(["bad", "bad"])
+
+        assert histogram["invalid"] == 2
+        assert capsys.readouterr().out.count("Cannot parse") == 2
+
+    def test_with_persistent_cache(self, tmp_path):
+        """Cached parsing should give the same counts across runs."""
+        dates = [_offset(days) for days in (-10, -1, 0, 3, 20)] + ["bad"]
+        with PersistentCache(str(tmp_path / "cache.sqlite3")) as cache:
+            first = get_days_histogram(dates, cache=cache)
+            second = get_days_histogram(dates, cache=cache)
+
+        assert first == second == get_days_histogram(dates)
+        assert first == {
+            "older": 1, "overdue": 1, "today": 1, "this_week": 1, "later": 1, "invalid": 1,
+        }
+
+    def test_merge_shards(self):
+        """Merged shard histograms should equal one pass over all dates."""
+        dates = [_offset(days) for days in range(-20, 20)] + ["bad"]
+        shards = [get_days_histogram(dates[i::3]) for i in range(3)]
+
+        assert merge_days_histograms(shards) == get_days_histogram(dates)
+        assert merge_days_histograms([]) == dict.fromkeys(HISTOGRAM_BUCKETS, 0)
+
+
+class TestNativeInput:
+    """Tests for date, datetime, epoch and datetime64 input."""
+
+    def test_date_object(self):
+        """date objects should be used directly."""
+        tomorrow = datetime.now().date() + timedelta(days=1)
+        assert get_days_from_today(tomorrow) == 1
+
+    def test_datetime_object(self):
+        """datetime objects should ignore the time of day."""
+        assert get_days_from_today(datetime.now()) == 0
+        assert get_days_from_today(datetime.now() - timedelta(days=3)) == -3
+
+    @pytest.mark.parametrize("days", [-400, -1, 0, 1, 365])
+    def test_epoch_days_and_seconds(self, days):
+        """Epoch integers should count days from 1970-01-01 (UTC)."""
+        target = datetime.now().date() + timedelta(days=days)
+        epoch_days = (target - datetime(1970, 1, 1).date()).days
+
+        assert get_days_from_today(epoch_days, epoch_unit="days") == days
+        assert get_days_from_today(epoch_days * 86400 + 3600, epoch_unit="seconds") == days
+
+    def test_epoch_seconds_use_utc(self):
+        """Epoch seconds should match the UTC calendar date."""
+        stamp = datetime.now(timezone.utc).replace(hour=23, minute=59)
+        expected = (stamp.date() - datetime.now().date()).days
+
+        assert get_days_from_today(int(stamp.timestamp()), epoch_unit="seconds") == expected
+
+    @pytest.mark.parametrize("value", [True, 1.5, "1700000000", None])
+    def test_epoch_rejects_non_integers(self, value, capsys):
+        """Booleans, floats and other types are not epoch values."""
+        assert get_days_from_today(value, epoch_unit="seconds") is None
+        assert capsys.readouterr().out
+
+    def test_epoch_out_of_range(self, capsys):
+        """Epoch values beyond the date range should return None."""
+        assert get_days_from_today(10 ** 15, epoch_unit="days") is None
+        assert "outside the supported date range" in capsys.readouterr().out
+
+    def test_unknown_epoch_unit(self, capsys):
+        """Unknown epoch units should be reported."""
+        assert get_days_from_today(0, epoch_unit="hours") is None
+        assert get_days_from_today_many([0], epoch_unit="hours") == []
+        assert "epoch_unit must be one of" in capsys.readouterr().out
+
+    def test_str_subclass_parsed_as_string(self):
+        """str subclasses should be parsed like plain strings."""
+        class DateString(str):
+            pass
+
+        value = DateString(_offset(3))
+
+        assert get_days_from_today(value) == 3
+        assert get_days_from_today_many([value, value]) == [3, 3]
+        assert get_days_histogram([value])["this_week"] == 1
+
+    def test_histogram_agrees_with_many(self, tmp_path, capsys):
+        """Bulk entry points should accept the same native values."""
+        today = datetime.now().date()
+        epoch_days = (today - datetime(1970, 1, 1).date()).days
+        dates = [today, datetime.now() + timedelta(days=3), epoch_days - 10, _offset(20), None]
+
+        days = get_days_from_today_many(dates, epoch_unit="days")
+        expected = {"older": 1, "overdue": 0, "today": 1, "this_week": 1, "later": 1, "invalid": 1}
+
+        assert days == [0, 3, -10, 20, None]
+        assert get_days_histogram(dates, epoch_unit="days") == expected
+        with PersistentCache(str(tmp_path / "cache.sqlite3")) as cache:
+            assert get_days_histogram(dates, cache=cache, epoch_unit="days") == expected
+        assert get_days_histogram([epoch_days]) == {**dict.fromkeys(HISTOGRAM_BUCKETS, 0), "invalid": 1}
+        assert get_days_histogram([], epoch_unit="hours") == {}
+        capsys.readouterr()
+
+    def test_numpy_datetime64(self):
+        """NumPy datetime64 scalars and arrays should be converted natively."""
+        np = pytest.importorskip("numpy")
+        today = np.datetime64(datetime.now().date().isoformat())
+
+        assert get_days_from_today(today + np.timedelta64(2, "D")) == 2
+        assert get_days_from_today(np.datetime64("NaT")) is None
+        values = np.array([today - np.timedelta64(1, "D"), today], dtype="datetime64[s]")
+        assert get_days_from_today_many(values) == [-1, 0]
+        assert get_days_from_today_many(np.array([today, "NaT"], dtype="datetime64[D]")) == [0, None]
+
+
+class TestGetDaysFromTodayMany:
+    """Tests for the bulk day-difference function."""
+
+    def test_matches_single_calls(self):
+        """Bulk results should equal per-item results for mixed input."""
+        today = datetime.now().date()
+        dates = [
+            (today + timedelta(days=5)).isoformat(),
+            today,
+            datetime.now() - timedelta(days=2),
+            "2025-02-30",
+            None,
+            (today + timedelta(days=5)).isoformat(),
+            "",
+        ]
+
+        expected = [get_days_from_today(value) for value in dates]
+
+        assert get_days_from_today_many(dates) == expected
+        assert expected[:3] == [5, 0, -2]
+
+    def test_explicit_today(self):
+        """A given reference date should replace the clock."""
+        reference = date(2026, 1, 1)
+
+        assert get_days_from_today_many(["2026-01-11", date(2025, 12, 31)], today=reference) == [10, -1]
+
+    def test_epoch_integers(self):
+        """Integers need an epoch_unit in bulk mode too."""
+        epoch_days = (datetime.now().date() - datetime(1970, 1, 1).date()).days
+
+        assert get_days_from_today_many([epoch_days, epoch_days + 1], epoch_unit="days") == [0, 1]
+        assert get_days_from_today_many([epoch_days]) == [None]
+
+    def test_repeated_invalid_reported_each_time(self, capsys):
+        """Invalid strings should be reported on every occurrence."""
+        assert get_days_from_today_many(["bad", "bad"]) == [None, None]
+        assert capsys.readouterr().out.count("Cannot parse") == 2
+
+
+class TestLenientFormats:
+    """Tests for multi-format parsing with format detection."""
+
+    @pytest.mark.parametrize("value, fmt", [
+        ("2026-02-08", "YYYY-MM-DD"),
+        ("08.02.2026", "DD.MM.YYYY"),
+        ("2026/02/08", "YYYY/MM/DD"),
+        ("20260208", "YYYYMMDD"),
+    ])
+    def test_detects_format(self, value, fmt):
+        """Each supported format should be detected and parsed."""
+        detector = DateFormatDetector()
+
+        assert detector.parse(value) == datetime(2026, 2, 8).date()
+        assert detector.current == fmt
+
+    @pytest.mark.parametrize("value", [
+        "", "2026-2-8", "8.2.2026", "2026.02.08", "2026/2/8", "2026028", "30.02.2026",
+        "+1.02.2026", "2026/13/01", "February 8, 2026",
+    ])
+    def test_rejects_unknown_format(self, value):
+        """Values in no supported format should return None."""
+        assert DateFormatDetector().parse(value) is None
+
+    def test_redetects_only_on_failure(self):
+        """The format should change only when a value does not match it."""
+        detector = DateFormatDetector()
+        for value in ["01.01.2026", "02.01.2026", "2026/01/03", "2026/01/04", "05.01.2026"]:
+            detector.parse(value)
+
+        assert detector.current == "DD.MM.YYYY"
+        assert detector.detections == 3
+
+    def test_restricted_formats(self):
+        """Only the chosen formats should be accepted."""
+        detector = DateFormatDetector(["YYYYMMDD"])
+
+        assert detector.parse("2026-02-08") is None
+        assert detector.parse("20260208") == datetime(2026, 2, 8).date()
+        with pytest.raises(ValueError):
+            DateFormatDetector(["MM/DD/YYYY"])
+        with pytest.raises(ValueError):
+            DateFormatDetector([])
+
+    def test_bulk_lenient_mode(self, capsys):
+        """Bulk mode should accept mixed formats only when lenient."""
+        target = datetime.now().date() + timedelta(days=3)
+        dates = [
+            target.isoformat(),
+            target.strftime("%d.%m.%Y"),
+            target.strftime("%Y/%m/%d"),
+            target.strftime("%Y%m%d"),
+            f"{target.isoformat()}T10:00:00",
+            "not a date",
+        ]
+
+        assert get_days_from_today_many(dates, lenient=True) == [3, 3, 3, 3, 3, None]
+        assert "Supported formats" in capsys.readouterr().out
+        assert get_days_from_today_many(dates[1:3]) == [None, None]
@@ -8,7 +8,17 @@ Test Coverage:
 - Randomness validation
 """
 
-from tasks.task_2 import get_numbers_ticket
+import pytest
+
+from tasks.task_2 import (
+    get_numbers_ticket,
+    random_ticket_rank,
+    rank_ticket,
+    rank_tickets,
+    ticket_count,
+    unrank_ticket,
+    unrank_tickets,
+)
 
 
 class TestGetNumbersTicket:
@@ -187,4 +197,131 @@ class TestGetNumbersTicket:
         assert len(result) == 19
         assert len(set(result)) == 19
         missing_number = set(range(1, 21)) - set(result)
-        assert len(missing_number) == 1  # Exactly one number not selected
\ No newline at end of file
+        assert len(missing_number) == 1  # Exactly one number not selected
+
+
+class TestTrustedInput:
+    """Tests for skipping validation with validate=False."""
+
+    def test_valid_input_same_properties(self):
+        """Trusted valid input should give a sorted unique ticket."""
+        result = get_numbers_ticket(1, 49, 6, validate=False)
+        assert len(result) == 6
+        assert result == sorted(set(result))
+        assert all(1 <= number <= 49 for number in result)
+
+    def test_validation_still_on_by_default(self):
+        """Invalid input should still be rejected by default."""
+        assert get_numbers_ticket(True, 49, 6) == []
+        assert get_numbers_ticket(1, 1001, 6) == []
+
+    @pytest.mark.parametrize("args, message", [
+        ((1.5, True, 6), "Error: Boolean parameters are not allowed."),
+        ((1, 49, "6"), "Error: All parameters must be integers."),
+        ((0, 2000, 0), "Error: Parameter 'min' must be >= 1."),
+        ((1, 1001, 0), "Error: Parameter 'max' should be <= 1000 for practical lottery use."),
+        ((5, 3, 0), "Error: Parameter 'max' must be > parameter 'min'."),
+        ((1, 49, 0), "Error: Parameter 'quantity' must be >= 1."),
+        ((1, 5, 6), "Error: Quantity (6) must be <= available range (5 numbers from 1 to 5)."),
+    ])
+    def test_error_messages(self, args, message, capsys):
+        """The first failing rule should be reported in the original wording."""
+        assert get_numbers_ticket(*args) == []
+        assert capsys.readouterr().out == message + "\n"
+
+
+class TestTicketRanking:
+    """Tests for combinatorial rank/unrank of lottery tickets."""
+
+    @pytest.mark.parametrize("min_value, max_value, quantity", [
+        (1, 6, 3),
+        (3, 9, 1),
+        (1, 5, 5),
+        (5, 12, 4),
+    ])
+    def test_matches_lexicographic_order(self, min_value, max_value, quantity):
+        """Ranks should follow itertools.combinations order exactly."""
+        from itertools import combinations
+
+        combos = [list(c) for c in combinations(range(min_value, max_value + 1), quantity)]
+
+        assert ticket_count(min_value, max_value, quantity) == len(combos)
+        assert rank_tickets(combos, min_value, max_value) == list(range(len(combos)))
+        assert unrank_tickets(range(len(combos)), min_value, max_value, quantity) == combos
+
+    def test_lottery_6_of_49(self):
+        """First and last tickets of a 6/49 lottery."""
+        assert ticket_count(1, 49, 6) == 13983816
+        assert rank_ticket([1, 2, 3, 4, 5, 6], 1, 49) == 0
+        assert rank_ticket([44, 45, 46, 47, 48, 49], 1, 49) == 13983815
+        assert unrank_ticket(13983815, 1, 49, 6) == [44, 45, 46, 47, 48, 49]
+
+    def test_large_range_computed_on_demand(self):
+        """Ranges too big to tabulate should still round-trip."""
+        from math import comb
+
+        from tasks.task_2 import _TABLE_LIMIT, _binomial_table
+
+        assert ticket_count(1, 1000, 500) == comb(1000, 500)
+        assert 501 * 1001 > _TABLE_LIMIT
+        ticket = list(range(2, 1001, 2))
+        rank = rank_ticket(ticket, 1, 1000)
+        assert unrank_ticket(rank, 1, 1000, 500) == ticket
+        assert unrank_ticket(comb(1000, 500) - 1, 1, 1000, 500) == list(range(501, 1001))
+        assert _binomial_table.cache_info().maxsize <= 8
+
+    @pytest.mark.parametrize("bounds", [("a", 10), (None, 10), (1, 10.0), (True, 10), (1, False)])
+    def test_rank_invalid_bounds(self, bounds, capsys):
+        """Non-integer and boolean bounds should be reported, not raise."""
+        assert rank_ticket([1, 2], *bounds) is None
+        assert capsys.readouterr().out.startswith("Error: ")
+
+    def test_unsorted_ticket(self):
+        """Ticket order should not matter for ranking."""
+        assert rank_ticket([6, 1, 3], 1, 49) == rank_ticket([1, 3, 6], 1, 49)
+
+    def test_round_trip_generated_tickets(self):
+        """Tickets from get_numbers_ticket should round-trip."""
+        for _ in range(50):
+            ticket = get_numbers_ticket(1, 1000, 10)
+            assert unrank_ticket(rank_ticket(ticket, 1, 1000), 1, 1000, 10) == ticket
+
+    def test_random_ticket_rank(self):
+        """Random ranks should be valid and unrank to valid tickets."""
+        for _ in range(50):
+            rank = random_ticket_rank(1, 49, 6)
+            ticket = unrank_ticket(rank, 1, 49, 6)
+            assert 0 <= rank < 13983816
+            assert len(ticket) == 6 and ticket == sorted(set(ticket))
+
+    @pytest.mark.parametrize("ticket", [
+        "1,2,3",
+        [1, 2, "3"],
+        [1, 2, True],
+        [0, 2, 3],
+        [1, 2, 50],
+        [1, 1, 2],
+        [],
+    ])
+    def test_rank_invalid_ticket(self, ticket):
+        """Invalid tickets should return None."""
+        assert rank_ticket(ticket, 1, 49) is None
+
+    @pytest.mark.parametrize("rank", [-1, 13983816, 1.5, True, None])
+    def test_unrank_invalid_rank(self, rank):
+        """Out-of-range or non-integer ranks should return an empty list."""
+        assert unrank_ticket(rank, 1, 49, 6) == []
+
+    @pytest.mark.parametrize("args", [(0, 49, 6), (1, 1001, 6), (10, 5, 1), (1, 5, 6)])
+    def test_invalid_range(self, args):
+        """Range validation should follow get_numbers_ticket rules."""
+        assert ticket_count(*args) is None
+        assert random_ticket_rank(*args) is None
+        assert unrank_ticket(0, *args) == []
+        assert unrank_tickets([0], *args) == []
+
+    def test_bulk_invalid_entries(self):
+        """Bulk functions should keep positions of invalid entries."""
+        assert rank_tickets([[1, 2], [1, 1], [2, 1]], 1, 5) == [0, None, 0]
+        assert unrank_tickets([0, 99, 9], 1, 5, 2) == [[1, 2], [], [4, 5]]
+        assert rank_tickets([[1, 2]], 0, 5) == []
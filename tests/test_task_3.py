@@ -9,7 +9,14 @@ Test Coverage:
 """
 
 import pytest
-from tasks.task_3 import normalize_phone
+from tasks.task_3 import (
+    decode_phone,
+    decode_phones,
+    encode_phone,
+    encode_phones,
+    normalize_phone,
+    normalize_phone_file,
+)
 
 
 class TestNormalizePhone:
@@ -313,3 +320,181 @@ class TestParametrizedScenarios:
         """Test various formatting styles all normalize to same result."""
         result = normalize_phone(formatted_phone)
         assert result == "+380501234567"
+
+
+class TestTrustedInput:
+    """Tests for skipping validation with validate=False."""
+
+    def test_valid_input_same_result(self):
+        """Trusted valid input should give the same result."""
+        assert normalize_phone("(050) 123-45-67", validate=False) == "+380501234567"
+
+    def test_length_rule_still_applies(self):
+        """Too short numbers should be rejected even without validation."""
+        assert normalize_phone("123", validate=False) is None
+
+    @pytest.mark.parametrize("args, message", [
+        ((5, True), "Error: phone_number must be a string, got int."),
+        (("", True), "Error: country_code must be an integer, got bool."),
+        (("  ", 0), "Error: country_code must be a positive integer."),
+        (("  ", 38), "Error: phone_number cannot be empty or whitespace-only."),
+    ])
+    def test_error_messages(self, args, message, capsys):
+        """The first failing rule should be reported in the original wording."""
+        assert normalize_phone(*args) is None
+        assert capsys.readouterr().out == message + "\n"
+
+
+class TestNormalizePhoneFile:
+    """Test suite for the bytes-level normalize_phone_file function."""
+
+    PHONES = [
+        "050 123 45 67",
+        "+38(067)765-43-21",
+        "380501234567",
+        "   ",
+        "",
+        "123",
+        "abc",
+        "+1 555 123 4567",
+        "  (050)   123-45-67  ",
+    ]
+
+    def run(self, tmp_path, content: bytes, **kwargs):
+        """Write *content*, normalize it and return (counts, output lines)."""
+        source = tmp_path / "phones.txt"
+        target = tmp_path / "normalized.txt"
+        source.write_bytes(content)
+
+        counts = normalize_phone_file(str(source), str(target), **kwargs)
+
+        return counts, target.read_bytes().decode("ascii").split("\n")[:-1]
+
+    def test_matches_normalize_phone(self, tmp_path):
+        """Each output line should equal normalize_phone of the input line."""
+        counts, lines = self.run(tmp_path, "\n".join(self.PHONES).encode() + b"\n")
+
+        expected = [normalize_phone(phone) or "" for phone in self.PHONES]
+        assert lines == expected
+        assert counts == (sum(map(bool, expected)), expected.count(""))
+
+    def test_crlf_and_missing_final_newline(self, tmp_path):
+        """CRLF endings and a missing trailing newline should be handled."""
+        counts, lines = self.run(tmp_path, b"050 123 45 67\r\n067 765 43 21")
+
+        assert lines == ["+380501234567", "+380677654321"]
+        assert counts == (2, 0)
+
+    def test_custom_country_code(self, tmp_path):
+        """The country code rule should match normalize_phone."""
+        counts, lines = self.run(tmp_path, b"5551234567\n15551234567\n", country_code=1)
+
+        assert lines == ["+15551234567", "+15551234567"]
+
+    def test_block_boundaries(self, tmp_path, monkeypatch):
+        """Lines spanning block boundaries should not be split."""
+        import tasks.task_3 as task_3
+
+        monkeypatch.setattr(task_3, "_BLOCK_SIZE", 7)
+        phones = self.PHONES * 3
+
+        counts, lines = self.run(tmp_path, "\n".join(phones).encode() + b"\n")
+
+        assert lines == [normalize_phone(phone) or "" for phone in phones]
+
+    def test_empty_file(self, tmp_path):
+        """An empty input file should produce an empty output file."""
+        counts, lines = self.run(tmp_path, b"")
+
+        assert counts == (0, 0)
+        assert lines == []
+
+    def test_missing_input_file(self, tmp_path):
+        """A missing input file should return None."""
+        assert normalize_phone_file(str(tmp_path / "missing.txt"), str(tmp_path / "out.txt")) is None
+
+    @pytest.mark.parametrize("country_code", [0, -38, True, "38"])
+    def test_invalid_country_code(self, tmp_path, country_code):
+        """Invalid country codes should return None."""
+        source = tmp_path / "phones.txt"
+        source.write_bytes(b"050 123 45 67\n")
+
+        assert normalize_phone_file(str(source), str(tmp_path / "out.txt"), country_code) is None
+
+    def test_output_same_as_input(self, tmp_path, capsys):
+        """Writing over the input file should be refused, keeping the input."""
+        source = tmp_path / "phones.txt"
+        source.write_bytes(b"050 123 45 67\n")
+
+        assert normalize_phone_file(str(source), str(source)) is None
+        assert source.read_bytes() == b"050 123 45 67\n"
+        assert "same file" in capsys.readouterr().out
+
+    def test_unwritable_output(self, tmp_path, capsys):
+        """An output path that cannot be opened should return None."""
+        source = tmp_path / "phones.txt"
+        source.write_bytes(b"050 123 45 67\n")
+
+        assert normalize_phone_file(str(source), str(tmp_path / "missing" / "out.txt")) is None
+        assert "Cannot open" in capsys.readouterr().out
+
+
+class TestPhoneCodec:
+    """Test suite for the packed 64-bit phone number codec."""
+
+    @pytest.mark.parametrize("phone", [
+        "+380501234567",
+        "+1",
+        "+0",
+        "+0012",
+        "+99999999999999999",  # 17 digits, the maximum
+        "+3815551234567",
+    ])
+    def test_round_trip(self, phone):
+        """Encoding then decoding should return the original number."""
+        value = encode_phone(phone)
+
+        assert 0 < value < 2 ** 64
+        assert decode_phone(value) == phone
+
+    def test_round_trip_normalized(self):
+        """Numbers from normalize_phone should round-trip."""
+        phone = normalize_phone("(050) 123-45-67")
+        assert decode_phone(encode_phone(phone)) == phone
+
+    def test_leading_zeros_distinguished(self):
+        """Numbers differing only in leading zeros should encode differently."""
+        assert encode_phone("+012") != encode_phone("+12")
+
+    @pytest.mark.parametrize("phone", [
+        "380501234567",          # Missing '+'
+        "+",                     # No digits
+        "+38 050 123 45 67",     # Not normalized
+        "+999999999999999999",   # 18 digits
+        "+３８０",                # Non-ASCII digits
+        None,
+        380501234567,
+    ])
+    def test_encode_invalid(self, phone):
+        """Non-normalized input should return None."""
+        assert encode_phone(phone) is None
+
+    @pytest.mark.parametrize("value", [0, 31, (10 << 5) | 1, -1, -31, True, "12", None])
+    def test_decode_invalid(self, value):
+        """Values that no number encodes to should return None."""
+        assert decode_phone(value) is None
+        assert decode_phones([value]) == [None]
+
+    def test_bulk_round_trip(self):
+        """Bulk encode/decode should keep order and mark invalid entries."""
+        from array import array
+
+        phones = ["+380501234567", "bad", None, "+0012", "+380677654321"]
+
+        packed = encode_phones(phones)
+
+        assert isinstance(packed, array) and packed.typecode == "Q"
+        assert packed.itemsize == 8
+        assert list(packed) == [encode_phone("+380501234567"), 0, 0, encode_phone("+0012"),
+                                encode_phone("+380677654321")]
+        assert decode_phones(packed) == ["+380501234567", None, None, "+0012", "+380677654321"]
@@ -9,10 +9,23 @@ Test Coverage:
 - Edge cases (leap years, empty lists, multiple users)
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 import pytest
-from tasks.task_4 import get_upcoming_birthdays, _validate_value
+from tasks.task_4 import (
+    Congratulation,
+    User,
+    get_upcoming_birthdays,
+    get_upcoming_birthdays_grouped,
+    get_upcoming_birthdays_sharded,
+    get_upcoming_birthdays_tz,
+    iter_congratulation_dates,
+    iter_upcoming_birthdays,
+    main,
+    _iter_upcoming,
+    _validate_value,
+    _window_month_days,
+)
 
 
 class TestGetUpcomingBirthdays:
@@ -682,4 +695,716 @@ class TestLeapYearEdgeCases:
             # Next Monday
             assert result[2]['congratulation_date'] == "2026.01.05"
             assert result[3]['congratulation_date'] == "2026.01.05"
-            assert result[4]['congratulation_date'] == "2026.01.05"
\ No newline at end of file
+            assert result[4]['congratulation_date'] == "2026.01.05"
+
+
+def _birthday_in_days(days: int, birth_year: int = 1990) -> str:
+    """Get birthday string that will occur N days from today."""
+    target_date = datetime.today().date() + timedelta(days=days)
+    return f"{birth_year}.{target_date.month:02d}.{target_date.day:02d}"
+
+
+class TestIterUpcomingBirthdays:
+    """Test suite for the streaming iter_upcoming_birthdays variant."""
+
+    def test_matches_list_version(self):
+        """Streaming output should equal get_upcoming_birthdays output."""
+        users = [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in range(-3, 12)
+        ]
+
+        assert list(iter_upcoming_birthdays(users)) == get_upcoming_birthdays(users)
+
+    def test_accepts_generator(self):
+        """Any iterable, including a one-shot generator, should be accepted."""
+        users = (
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in (1, 30)
+        )
+
+        result = list(iter_upcoming_birthdays(users))
+
+        assert [r['name'] for r in result] == ["User1"]
+
+    def test_is_lazy(self):
+        """Matches should be yielded before the input is exhausted."""
+        def users():
+            yield {"name": "First", "birthday": _birthday_in_days(0)}
+            raise AssertionError("input consumed too eagerly")
+
+        stream = iter_upcoming_birthdays(users())
+
+        assert next(stream)['name'] == "First"
+
+    def test_invalid_records_skipped(self):
+        """Invalid records should be skipped like in the list version."""
+        users = iter([None, {"name": "NoBirthday"}, {"name": "Valid", "birthday": _birthday_in_days(2)}])
+
+        result = list(iter_upcoming_birthdays(users))
+
+        assert [r['name'] for r in result] == ["Valid"]
+
+    @pytest.mark.parametrize("invalid_input", [None, 123, "string", b"bytes", {"key": "value"}])
+    def test_invalid_users_types(self, invalid_input):
+        """Non-iterables, strings and dicts should yield nothing."""
+        assert list(iter_upcoming_birthdays(invalid_input)) == []
+
+
+class TestTrustedInput:
+    """Tests for skipping validation with validate=False."""
+
+    def test_valid_input_same_result(self):
+        """Trusted valid input should give the same result."""
+        users = [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in range(-3, 12)
+        ]
+
+        assert get_upcoming_birthdays(users, validate=False) == get_upcoming_birthdays(users)
+        assert list(iter_upcoming_birthdays(users, validate=False)) == get_upcoming_birthdays(users)
+
+    def test_malformed_record_raises(self):
+        """Malformed records are not skipped when validation is off."""
+        with pytest.raises(KeyError):
+            get_upcoming_birthdays([{"name": "NoBirthday"}], validate=False)
+
+    def test_empty_name_rejected_with_validation(self, capsys):
+        """Name validation should report a structured error message."""
+        assert get_upcoming_birthdays([{"name": " ", "birthday": _birthday_in_days(1)}]) == []
+        assert "name cannot be empty" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("users, message", [
+        ("x", "Error: users must be a list, got str."),
+        ([], "Error: users cannot be empty or None."),
+        ([None], "Error: user must be a dict, got NoneType."),
+        ([{}], "Error: user cannot be empty or None."),
+    ])
+    def test_users_error_messages(self, users, message, capsys):
+        """users and user errors should keep the original wording."""
+        assert get_upcoming_birthdays(users) == []
+        assert capsys.readouterr().out == message + "\n"
+
+    @pytest.mark.parametrize("name, message", [
+        (5, "Error: name must be a str, got int."),
+        ("", "Error: name cannot be empty or None."),
+        ("  ", "Error: name cannot be empty or whitespace."),
+    ])
+    def test_name_error_messages(self, name, message, capsys):
+        """Name errors should use the same wording as the other fields."""
+        assert get_upcoming_birthdays([{"name": name, "birthday": _birthday_in_days(1)}]) == []
+        assert capsys.readouterr().out == message + "\n"
+
+
+class TestRecords:
+    """Tests for the compact User and Congratulation record types."""
+
+    def test_dict_compatible_view(self):
+        """Records should behave like the equivalent read-only dicts."""
+        user = User("John", "1990.01.15")
+
+        assert user == {"name": "John", "birthday": "1990.01.15"}
+        assert {"name": "John", "birthday": "1990.01.15"} == user
+        assert user["name"] == "John"
+        assert user.get("missing") is None
+        assert "birthday" in user
+        assert dict(user) == user.as_dict() == {"name": "John", "birthday": "1990.01.15"}
+        assert len(user) == 2
+
+    def test_no_instance_dict(self):
+        """Slotted records should not carry a per-instance __dict__."""
+        import sys
+
+        record = Congratulation("John", "2025.01.15")
+
+        assert not hasattr(record, "__dict__")
+        assert sys.getsizeof(record) < sys.getsizeof(record.as_dict())
+
+    def test_read_only(self):
+        """Fields should not be reassignable."""
+        user = User("John", "1990.01.15")
+        with pytest.raises(AttributeError):
+            user.name = "Jane"
+
+    def test_wrong_argument_count(self):
+        """Constructors should require one value per field."""
+        with pytest.raises(TypeError):
+            User("John")
+
+    def test_missing_key(self):
+        """Unknown keys should raise KeyError like a dict."""
+        with pytest.raises(KeyError):
+            User("John", "1990.01.15")["email"]
+
+    def test_picklable(self):
+        """Records should survive pickling (e.g. for process pools)."""
+        import pickle
+
+        record = Congratulation("John", "2025.01.15")
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_user_records_accepted(self):
+        """User records should give the same results as dicts."""
+        dict_users = [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in range(-3, 12)
+        ]
+        records = [User(user["name"], user["birthday"]) for user in dict_users]
+
+        assert get_upcoming_birthdays(records) == get_upcoming_birthdays(dict_users)
+        assert get_upcoming_birthdays(records, validate=False) == get_upcoming_birthdays(dict_users)
+
+    def test_invalid_user_record_skipped(self):
+        """User records with invalid fields should be reported and skipped."""
+        records = [User("", _birthday_in_days(1)), User("Bad", "1990-01-01"), User("Good", _birthday_in_days(1))]
+
+        result = get_upcoming_birthdays(records)
+
+        assert [r['name'] for r in result] == ["Good"]
+
+    def test_as_records_output(self):
+        """as_records=True should return Congratulation records equal to the dicts."""
+        users = [{"name": "Soon", "birthday": _birthday_in_days(2)}]
+
+        result = get_upcoming_birthdays(users, as_records=True)
+
+        assert all(isinstance(record, Congratulation) for record in result)
+        assert result == get_upcoming_birthdays(users)
+
+
+class TestOutputFormat:
+    """Tests for the output_format option."""
+
+    def make_users(self):
+        """Users with birthdays over the next two weeks."""
+        return [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in range(14)
+        ]
+
+    @pytest.mark.parametrize("output_format, convert", [
+        ("dotted", lambda day: day.strftime("%Y.%m.%d")),
+        ("iso", lambda day: day.isoformat()),
+        ("date", lambda day: day),
+        ("ordinal", lambda day: day.toordinal()),
+    ])
+    def test_formats(self, output_format, convert):
+        """Each format should represent the same congratulation dates."""
+        users = self.make_users()
+        expected = [
+            {"name": r['name'],
+             "congratulation_date": convert(datetime.strptime(r['congratulation_date'], "%Y.%m.%d").date())}
+            for r in get_upcoming_birthdays(users)
+        ]
+
+        assert get_upcoming_birthdays(users, output_format=output_format) == expected
+        assert list(iter_upcoming_birthdays(users, output_format=output_format)) == expected
+
+    def test_formatted_once_per_distinct_date(self):
+        """Strings should be formatted once per distinct congratulation date."""
+        from unittest.mock import patch
+        import tasks.task_4 as task_4
+
+        birthday = _birthday_in_days(3)
+        users = [{"name": f"User{i}", "birthday": birthday} for i in range(100)]
+
+        with patch.object(task_4, "_format_date", wraps=task_4._format_date) as format_date:
+            result = get_upcoming_birthdays(users)
+
+        assert len(result) == 100
+        assert format_date.call_count == 1
+        assert len({id(r['congratulation_date']) for r in result}) == 1
+
+    def test_with_records(self):
+        """output_format should combine with as_records."""
+        users = self.make_users()
+
+        result = get_upcoming_birthdays(users, as_records=True, output_format="date")
+
+        assert result == get_upcoming_birthdays(users, output_format="date")
+
+    @pytest.mark.parametrize("output_format", ["DOTTED", "epoch", None, 1, ["iso"]])
+    def test_invalid_format(self, output_format):
+        """Unknown formats should return no results."""
+        users = self.make_users()
+
+        assert get_upcoming_birthdays(users, output_format=output_format) == []
+        assert list(iter_upcoming_birthdays(users, output_format=output_format)) == []
+
+
+class TestMonthDayPrefilter:
+    """Tests for the strict=False month/day prefilter."""
+
+    @staticmethod
+    def all_birthdays():
+        """One user per calendar day, including Feb 29."""
+        start = date(2000, 1, 1)
+        return [
+            {"name": f"User{i}", "birthday": (start + timedelta(days=i)).strftime("%Y.%m.%d")}
+            for i in range(366)
+        ]
+
+    @pytest.mark.parametrize("today", [
+        date(2024, 2, 24), date(2024, 2, 28), date(2024, 3, 1),
+        date(2025, 2, 23), date(2025, 2, 28), date(2025, 3, 1), date(2025, 3, 2),
+        date(2025, 12, 28), date(2026, 12, 31),
+    ])
+    def test_same_result_as_strict(self, today):
+        """Prefiltering should not change results for valid records."""
+        users = self.all_birthdays()
+
+        strict = list(_iter_upcoming(users, today))
+        prefiltered = list(_iter_upcoming(users, today, strict=False))
+
+        assert prefiltered == strict
+        assert len(strict) >= 7
+
+    def test_same_result_across_year(self):
+        """Results should match strict mode for start days across a year."""
+        users = self.all_birthdays()
+        day = date(2027, 1, 1)
+        while day.year == 2027:
+            assert list(_iter_upcoming(users, day, strict=False)) == list(_iter_upcoming(users, day))
+            day += timedelta(days=3)
+
+    def test_non_canonical_layouts_parsed(self):
+        """Layouts strptime accepts but the slice cannot judge should match strict mode."""
+        users = []
+        for month in range(1, 13):
+            for day in range(1, 10):
+                users.append({"name": f"Padded{month}.{day}", "birthday": f"2000.{month:02d}. {day}"})
+                users.append({"name": f"Short{month}.{day}", "birthday": f"2000.{month}.{day}"})
+
+        day = date(2025, 1, 1)
+        while day.year < 2027:
+            assert list(_iter_upcoming(users, day, strict=False)) == list(_iter_upcoming(users, day))
+            day += timedelta(days=1)
+
+    def test_window_includes_leap_day(self):
+        """Feb 29 should qualify only when March 1 of a non-leap year is in range."""
+        assert "02.29" in _window_month_days(date(2025, 2, 24))
+        assert "02.29" not in _window_month_days(date(2025, 3, 2))
+        assert _window_month_days(date(2024, 2, 24)) == frozenset(
+            ["02.24", "02.25", "02.26", "02.27", "02.28", "02.29", "03.01"]
+        )
+
+    def test_invalid_rows_outside_window_not_reported(self, capsys):
+        """Only rows passing the prefilter should be validated."""
+        users = [
+            {"name": "", "birthday": _birthday_in_days(30)},
+            {"name": "Bad", "birthday": "1990.13.45"},
+            {"name": "", "birthday": _birthday_in_days(1)},
+            {"name": "Alice", "birthday": _birthday_in_days(2)},
+        ]
+
+        result = get_upcoming_birthdays(users, strict=False)
+
+        assert [user["name"] for user in result] == ["Alice"]
+        assert capsys.readouterr().out.count("Error") == 1
+
+    def test_other_layouts_always_validated(self, capsys):
+        """Rows the slice cannot judge should be parsed and reported."""
+        assert get_upcoming_birthdays([{"name": "Bad", "birthday": "1990-01-01"}], strict=False) == []
+        assert "Invalid birthday format" in capsys.readouterr().out
+
+    def test_strict_mode_reports_every_row(self, capsys):
+        """Default strict mode should keep reporting all invalid rows."""
+        users = [
+            {"name": "", "birthday": _birthday_in_days(30)},
+            {"name": "Bad", "birthday": "1990-01-01"},
+        ]
+
+        assert get_upcoming_birthdays(users) == []
+        assert capsys.readouterr().out.count("Error") == 2
+
+    def test_malformed_records_still_checked(self, capsys):
+        """Records without a fixed-width birthday string go through full checks."""
+        users = [None, {"name": "NoBirthday"}, {"name": "X", "birthday": 19900105}]
+
+        assert get_upcoming_birthdays(users, strict=False) == []
+        output = capsys.readouterr().out
+        assert "user must be a dict" in output
+        assert "'name' and 'birthday' keys" in output
+        assert "birthday must be a str" in output
+
+    def test_unpadded_birthday_not_skipped(self):
+        """Birthdays like '1990.1.5' cannot be sliced and must be parsed."""
+        target = datetime.today().date() + timedelta(days=1)
+        users = [{"name": "Unpadded", "birthday": f"1990.{target.month}.{target.day}"}]
+
+        assert get_upcoming_birthdays(users, strict=False) == get_upcoming_birthdays(users)
+        assert len(get_upcoming_birthdays(users)) == 1
+
+    def test_records_and_trusted_input(self):
+        """Prefilter should work with User records and validate=False."""
+        users = [User("Near", _birthday_in_days(1)), User("Far", _birthday_in_days(100))]
+
+        result = get_upcoming_birthdays(users, strict=False, validate=False)
+
+        assert [user["name"] for user in result] == ["Near"]
+
+
+class TestGetUpcomingBirthdaysGrouped:
+    """Test suite for get_upcoming_birthdays_grouped function."""
+
+    def test_matches_list_version(self):
+        """Grouping should contain exactly the list version's matches."""
+        users = [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in (5, 1, 9, 3, 1, 0, 6, -2)
+        ]
+
+        grouped = get_upcoming_birthdays_grouped(users)
+
+        pairs = sorted(
+            (date_str, name) for date_str, names in grouped.items() for name in names
+        )
+        expected = sorted(
+            (r['congratulation_date'], r['name']) for r in get_upcoming_birthdays(users)
+        )
+        assert pairs == expected
+
+    def test_keys_in_chronological_order(self):
+        """Keys should already be sorted by congratulation date."""
+        users = [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in (6, 4, 2, 0, 5, 3, 1)
+        ]
+
+        grouped = get_upcoming_birthdays_grouped(users)
+
+        assert list(grouped) == sorted(grouped)
+
+    def test_weekend_birthdays_grouped_on_monday(self):
+        """Weekend birthdays should join the Monday bucket in input order."""
+        from unittest.mock import patch
+        from datetime import date
+
+        with patch('tasks.task_4.datetime') as mock_datetime:
+            # Thursday, Jan 2, 2025: Sat 4th and Sun 5th move to Mon 6th
+            mock_datetime.today.return_value.date.return_value = date(2025, 1, 2)
+            mock_datetime.strptime = datetime.strptime
+
+            users = [
+                {"name": "Monday", "birthday": "1990.01.06"},
+                {"name": "Saturday", "birthday": "1990.01.04"},
+                {"name": "Sunday", "birthday": "1990.01.05"},
+                {"name": "Thursday", "birthday": "1990.01.02"},
+            ]
+
+            grouped = get_upcoming_birthdays_grouped(users)
+
+        assert grouped == {
+            "2025.01.02": ["Thursday"],
+            "2025.01.06": ["Monday", "Saturday", "Sunday"],
+        }
+
+    def test_saturday_six_days_ahead(self):
+        """A Saturday birthday 6 days ahead should land 8 days ahead."""
+        from unittest.mock import patch
+        from datetime import date
+
+        with patch('tasks.task_4.datetime') as mock_datetime:
+            # Sunday, Jan 5, 2025: Saturday Jan 11 moves to Monday Jan 13
+            mock_datetime.today.return_value.date.return_value = date(2025, 1, 5)
+            mock_datetime.strptime = datetime.strptime
+
+            grouped = get_upcoming_birthdays_grouped(
+                [{"name": "Saturday", "birthday": "1990.01.11"}]
+            )
+
+        assert grouped == {"2025.01.13": ["Saturday"]}
+
+    @pytest.mark.parametrize("invalid_input", [None, [], "string", {"key": "value"}])
+    def test_invalid_users_types(self, invalid_input):
+        """Invalid input should return an empty dict."""
+        assert get_upcoming_birthdays_grouped(invalid_input) == {}
+
+
+class TestIterCongratulationDates:
+    """Test suite for iter_congratulation_dates range projection."""
+
+    def test_single_week_range(self):
+        """Weekday birthdays inside the range keep their dates."""
+        from datetime import date
+
+        users = [
+            {"name": "Tuesday", "birthday": "1990.01.07"},
+            {"name": "Monday", "birthday": "1985.01.06"},
+            {"name": "Outside", "birthday": "1990.01.20"},
+        ]
+
+        result = list(iter_congratulation_dates(users, date(2025, 1, 6), date(2025, 1, 10)))
+
+        assert result == [
+            {"name": "Monday", "congratulation_date": "2025.01.06"},
+            {"name": "Tuesday", "congratulation_date": "2025.01.07"},
+        ]
+
+    def test_weekend_before_start_moves_into_range(self):
+        """Weekend birthdays just before start should be congratulated on Monday."""
+        from datetime import date
+
+        users = [
+            {"name": "Saturday", "birthday": "1990.01.04"},
+            {"name": "Sunday", "birthday": "1990.01.05"},
+            {"name": "Friday", "birthday": "1990.01.03"},
+        ]
+
+        result = list(iter_congratulation_dates(users, date(2025, 1, 6), date(2025, 1, 6)))
+
+        assert [r['name'] for r in result] == ["Saturday", "Sunday"]
+        assert all(r['congratulation_date'] == "2025.01.06" for r in result)
+
+    def test_weekend_at_end_moves_out_of_range(self):
+        """Weekend birthdays whose Monday is after end should be excluded."""
+        from datetime import date
+
+        users = [{"name": "Saturday", "birthday": "1990.01.11"}]
+
+        result = list(iter_congratulation_dates(users, date(2025, 1, 6), date(2025, 1, 12)))
+
+        assert result == []
+
+    def test_multi_year_leap_day(self):
+        """Feb 29 birthdays follow the March 1 rule per year."""
+        from datetime import date
+
+        users = [{"name": "Leap Day Baby", "birthday": "2000.02.29"}]
+
+        result = list(iter_congratulation_dates(users, date(2023, 1, 1), date(2025, 12, 31)))
+
+        assert [r['congratulation_date'] for r in result] == [
+            "2023.03.01",  # Wednesday
+            "2024.02.29",  # Thursday, leap year
+            "2025.03.03",  # March 1 is a Saturday
+        ]
+
+    def test_once_per_year(self):
+        """Each user should appear once for every year in the range."""
+        from datetime import date
+
+        users = [
+            {"name": "Alice", "birthday": "1990.06.15"},
+            {"name": "Bob", "birthday": "1991.09.10"},
+        ]
+
+        result = list(iter_congratulation_dates(users, date(2020, 1, 1), date(2029, 12, 31)))
+
+        assert len(result) == 20
+        dates = [r['congratulation_date'] for r in result]
+        assert dates == sorted(dates)
+
+    def test_invalid_users_skipped(self):
+        """Invalid user records should be skipped."""
+        from datetime import date
+
+        users = [None, {"name": "Bad", "birthday": "1990-01-07"}, {"name": "Good", "birthday": "1990.01.07"}]
+
+        result = list(iter_congratulation_dates(users, date(2025, 1, 1), date(2025, 1, 31)))
+
+        assert [r['name'] for r in result] == ["Good"]
+
+    @pytest.mark.parametrize("start, end", [
+        ("2025.01.01", "2025.12.31"),
+        (None, None),
+        (datetime(2025, 1, 1), datetime(2025, 12, 31)),
+    ])
+    def test_invalid_range_types(self, start, end):
+        """Range bounds must be date objects."""
+        users = [{"name": "Alice", "birthday": "1990.06.15"}]
+        assert list(iter_congratulation_dates(users, start, end)) == []
+
+    def test_start_after_end(self):
+        """An inverted range should yield nothing."""
+        from datetime import date
+
+        users = [{"name": "Alice", "birthday": "1990.06.15"}]
+        assert list(iter_congratulation_dates(users, date(2025, 12, 31), date(2025, 1, 1))) == []
+
+
+class TestGetUpcomingBirthdaysTz:
+    """Test suite for timezone-aware get_upcoming_birthdays_tz."""
+
+    # UTC+14 and UTC-11: local dates always differ by at least one day
+    EAST = "Pacific/Kiritimati"
+    WEST = "Pacific/Pago_Pago"
+
+    def local_today(self, zone_name: str):
+        """Get today's date in the given zone."""
+        from zoneinfo import ZoneInfo
+
+        return datetime.now(ZoneInfo(zone_name)).date()
+
+    def test_today_differs_per_zone(self):
+        """Yesterday in the east can still be upcoming in the west."""
+        birthday = self.local_today(self.EAST) - timedelta(days=1)
+        birthday_str = f"1990.{birthday.month:02d}.{birthday.day:02d}"
+        users = [
+            {"name": "East", "birthday": birthday_str, "timezone": self.EAST},
+            {"name": "West", "birthday": birthday_str, "timezone": self.WEST},
+        ]
+
+        result = get_upcoming_birthdays_tz(users)
+
+        assert [r['name'] for r in result] == ["West"]
+
+    def test_default_timezone(self):
+        """Users without a timezone key should use default_timezone."""
+        birthday = self.local_today(self.EAST) - timedelta(days=1)
+        users = [{"name": "Default", "birthday": f"1990.{birthday.month:02d}.{birthday.day:02d}"}]
+
+        assert get_upcoming_birthdays_tz(users, default_timezone=self.EAST) == []
+        assert [r['name'] for r in get_upcoming_birthdays_tz(users, default_timezone=self.WEST)] == ["Default"]
+
+    def test_without_timezones_matches_local(self):
+        """Without any zone information the server date should be used."""
+        users = [
+            {"name": f"User{days}", "birthday": _birthday_in_days(days)}
+            for days in range(-2, 10)
+        ]
+
+        assert get_upcoming_birthdays_tz(users) == get_upcoming_birthdays(users)
+
+    def test_zone_resolved_once(self):
+        """Each distinct zone should be resolved only once."""
+        from unittest.mock import patch
+        import zoneinfo
+
+        users = [
+            {"name": f"User{i}", "birthday": _birthday_in_days(i % 5), "timezone": zone}
+            for i, zone in enumerate(["Europe/Kyiv", "UTC"] * 50)
+        ]
+
+        with patch.object(zoneinfo, "ZoneInfo", wraps=zoneinfo.ZoneInfo) as zone_info:
+            result = get_upcoming_birthdays_tz(users)
+
+        assert zone_info.call_count == 2
+        assert len(result) == 100
+
+    def test_unknown_timezone_skipped(self):
+        """Users with an unknown or invalid timezone should be skipped."""
+        birthday_str = _birthday_in_days(1)
+        users = [
+            {"name": "Unknown", "birthday": birthday_str, "timezone": "Mars/Olympus_Mons"},
+            {"name": "NotString", "birthday": birthday_str, "timezone": 3},
+            {"name": "Empty", "birthday": birthday_str, "timezone": ""},
+            {"name": "Valid", "birthday": birthday_str, "timezone": "UTC"},
+        ]
+
+        result = get_upcoming_birthdays_tz(users)
+
+        assert [r['name'] for r in result] == ["Valid"]
+
+    def test_unknown_default_timezone(self):
+        """An unknown default timezone should return an empty list."""
+        users = [{"name": "User", "birthday": _birthday_in_days(1)}]
+
+        assert get_upcoming_birthdays_tz(users, default_timezone="Nowhere/City") == []
+
+    @pytest.mark.parametrize("invalid_input", [None, [], "string", {"key": "value"}])
+    def test_invalid_users_types(self, invalid_input):
+        """Invalid input should return an empty list."""
+        assert get_upcoming_birthdays_tz(invalid_input) == []
+
+
+class TestGetUpcomingBirthdaysSharded:
+    """Test suite for get_upcoming_birthdays_sharded function."""
+
+    def make_users(self, count: int):
+        """Build users whose birthdays cycle through the next 14 days."""
+        return [
+            {"name": f"User{i}", "birthday": _birthday_in_days(i % 14)}
+            for i in range(count)
+        ]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    @pytest.mark.parametrize("shards", [1, 3, 8])
+    def test_matches_serial_result(self, executor, shards):
+        """Sharded output should equal the single-threaded output, in order."""
+        users = self.make_users(50)
+
+        result = get_upcoming_birthdays_sharded(users, shards=shards, executor=executor)
+
+        assert result == get_upcoming_birthdays(users)
+
+    def test_more_shards_than_users(self):
+        """Shard count larger than the input should still work."""
+        users = self.make_users(2)
+
+        result = get_upcoming_birthdays_sharded(users, shards=16, executor="thread")
+
+        assert result == get_upcoming_birthdays(users)
+
+    def test_default_executor(self):
+        """Default shard count and executor should produce the serial result."""
+        users = self.make_users(20)
+
+        assert get_upcoming_birthdays_sharded(users) == get_upcoming_birthdays(users)
+
+    @pytest.mark.parametrize("shards", [0, -1, True, 2.5, "4"])
+    def test_invalid_shards(self, shards):
+        """Invalid shard counts should return an empty list."""
+        assert get_upcoming_birthdays_sharded(self.make_users(5), shards=shards) == []
+
+    def test_invalid_executor(self):
+        """Unknown executors should return an empty list."""
+        assert get_upcoming_birthdays_sharded(self.make_users(5), executor="gpu") == []
+
+    @pytest.mark.parametrize("invalid_input", [None, [], "string", {"key": "value"}])
+    def test_invalid_users_types(self, invalid_input):
+        """Invalid input should return an empty list."""
+        assert get_upcoming_birthdays_sharded(invalid_input) == []
+
+
+class TestCommandLine:
+    """Test suite for the python -m tasks.task_4 command-line interface."""
+
+    def test_ndjson_input(self, tmp_path, capsys):
+        """NDJSON input should produce NDJSON output on stdout."""
+        import json
+
+        path = tmp_path / "users.ndjson"
+        path.write_text(
+            json.dumps({"name": "Soon", "birthday": _birthday_in_days(1)}) + "\n"
+            + "\n"
+            + json.dumps({"name": "Later", "birthday": _birthday_in_days(40)}) + "\n",
+            encoding="utf-8",
+        )
+
+        assert main([str(path)]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)['name'] for line in lines] == ["Soon"]
+
+    def test_csv_input(self, tmp_path, capsys):
+        """CSV input should be detected from the file extension."""
+        import json
+
+        path = tmp_path / "users.csv"
+        path.write_text(
+            f"name,birthday\nSoon,{_birthday_in_days(2)}\nLater,{_birthday_in_days(40)}\n",
+            encoding="utf-8",
+        )
+
+        assert main([str(path)]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line)['name'] for line in lines] == ["Soon"]
+
+    def test_errors_go_to_stderr(self, tmp_path, capsys):
+        """Validation errors should not pollute the NDJSON output."""
+        path = tmp_path / "users.ndjson"
+        path.write_text('not json\n{"name": "Bad", "birthday": "1990-01-01"}\n', encoding="utf-8")
+
+        assert main([str(path)]) == 0
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Invalid JSON on line 1" in captured.err
+        assert "Invalid birthday format" in captured.err
+
+    def test_missing_file(self, tmp_path, capsys):
+        """A missing input file should return a non-zero exit code."""
+        assert main([str(tmp_path / "missing.ndjson")]) == 1
+        assert "Cannot open" in capsys.readouterr().err
@@ -0,0 +1,110 @@
+"""
+Test suite for the shared compiled validation layer.
+
+Test Coverage:
+- Type checks (including bool rejected as int)
+- Emptiness checks for strings
+- Inclusive numeric bounds
+- Multi-field schemas report the first failing field, type checks first
+- Custom message templates
+"""
+
+import pytest
+
+from tasks.validation import Field, ValidationError, compile_schema
+
+
+class TestCompileSchema:
+    """Test suite for compile_schema."""
+
+    def test_valid_values_return_none(self):
+        """Valid values should produce no error."""
+        check = compile_schema(Field("min", int, min_value=1), Field("name", str, non_empty=True))
+        assert check(1, "John") is None
+
+    @pytest.mark.parametrize("value, type_name", [
+        ("1", "str"),
+        (1.0, "float"),
+        (None, "NoneType"),
+        (True, "bool"),
+    ])
+    def test_type_errors(self, value, type_name):
+        """Wrong types, including booleans for ints, should be rejected."""
+        error = compile_schema(Field("min", int))(value)
+
+        assert error == ValidationError("min", "type", f"min must be an integer, got {type_name}.")
+
+    def test_bool_allowed_when_expected(self):
+        """Booleans should pass when bool itself is the expected type."""
+        assert compile_schema(Field("flag", bool))(True) is None
+
+    @pytest.mark.parametrize("value", ["", "   ", "\t\n"])
+    def test_empty_strings(self, value):
+        """Empty and whitespace-only strings should fail non_empty fields."""
+        error = compile_schema(Field("name", str, non_empty=True))(value)
+        assert error.code == "empty"
+
+    def test_blank_message_and_collections(self):
+        """Whitespace-only strings can get their own message; collections must be non-empty."""
+        check = compile_schema(Field("name", str, non_empty=True, messages={"blank": "{name} is blank."}))
+        assert check("").message == "name cannot be empty or whitespace-only."
+        assert check("  ") == ValidationError("name", "empty", "name is blank.")
+
+        assert compile_schema(Field("users", list, non_empty=True))([]).code == "empty"
+        assert compile_schema(Field("users", list, non_empty=True))([1]) is None
+
+    def test_empty_string_allowed_without_non_empty(self):
+        """Emptiness should only be checked when requested."""
+        assert compile_schema(Field("name", str))("") is None
+
+    @pytest.mark.parametrize("value, code", [(0, "min"), (1, None), (1000, None), (1001, "max")])
+    def test_bounds_are_inclusive(self, value, code):
+        """min_value and max_value should be inclusive bounds."""
+        error = compile_schema(Field("max", int, min_value=1, max_value=1000))(value)
+        assert (error.code if error else None) == code
+
+    def test_first_failing_field_reported(self):
+        """Multi-field schemas should report the first invalid field."""
+        check = compile_schema(
+            Field("min", int, min_value=1),
+            Field("max", int, max_value=1000),
+            Field("quantity", int, min_value=1),
+        )
+
+        assert check(1, 2000, 0).field == "max"
+        assert check(1, 10, 0).field == "quantity"
+
+    def test_type_checks_run_before_value_checks(self):
+        """A type error in a later field should win over a bound in an earlier one."""
+        check = compile_schema(Field("min", int, min_value=1), Field("max", int))
+
+        assert check(0, "10").field == "max"
+        assert check(0, 10).code == "min"
+
+    def test_custom_messages(self):
+        """Templates should replace the default wording per error code."""
+        messages = {"type": "Expected {name} as int, got {type}.", "min": "{name} must be at least {limit} ({value})."}
+        check = compile_schema(
+            Field("count", int, min_value=1, messages=messages),
+            Field("name", str, non_empty=True, messages={"empty": "No {name}."}),
+        )
+
+        assert check("1", "x").message == "Expected count as int, got str."
+        assert check(0, "x").message == "count must be at least 1 (0)."
+        assert check(1, " ").message == "No name."
+        assert check(True, "x").message == "Expected count as int, got bool."
+
+    def test_bool_message_checked_first(self):
+        """A 'bool' template should report booleans before other type errors."""
+        check = compile_schema(Field("a", int), Field("b", int, messages={"bool": "No booleans."}))
+
+        assert check("1", True) == ValidationError("b", "type", "No booleans.")
+        assert check("1", 2).field == "a"
+
+    def test_error_is_structured(self):
+        """Errors should expose field, code and message attributes."""
+        error = compile_schema(Field("country_code", int, min_value=1))(-5)
+
+        assert error.field == "country_code"
+        assert error.code == "min"
+        assert error.message == "country_code must be >= 1, got -5."